@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.translation import gettext_lazy as _
+from apps.core.admin import EstimatedCountPaginator
 from .models import User
 
 
@@ -11,6 +12,9 @@ class UserAdmin(BaseUserAdmin):
     list_filter = ('user_type', 'is_staff', 'is_active', 'created_at')
     search_fields = ('user_id', 'name', 'contact')
     ordering = ('-created_at',)
+    # 대용량 테이블 대응: 전체 건수 COUNT 생략, 예상 건수 사용
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
 
     # 필드셋 구성 (관리자 상세 페이지에서 보여줄 항목)
     fieldsets = (
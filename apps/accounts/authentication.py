@@ -1,15 +1,70 @@
 import logging
+from django.utils.functional import cached_property
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.models import TokenUser
 from rest_framework_simplejwt.settings import api_settings
 
+from .cache import get_token_version
+from .tokens import IS_ACTIVE_CLAIM, TOKEN_VERSION_CLAIM, USER_TYPE_CLAIM
+
 logger = logging.getLogger(__name__)
 
 class CustomJWTAuthentication(JWTAuthentication):
     def get_header(self, request):
-        logger.info(f"CustomJWTAuthentication.get_header called for path: {request.path}")
         header = super().get_header(request)
-        if header:
-            logger.info(f"Authorization header found: {header.decode('utf-8')[:50]}...")
-        else:
-            logger.info("Authorization header not found")
+        # 매 요청마다 호출되므로 DEBUG로만 남기고 토큰 값은 기록하지 않음 (LOG_SAMPLING_RATES로 샘플링)
+        logger.debug('Authorization header %s: %s', 'found' if header else 'not found', request.path)
         return header
+
+
+class StatelessUser(TokenUser):
+    """
+    토큰 클레임으로 만든 사용자 (DB 조회 없음)
+
+    id/pk는 정수, user_type/is_active는 토큰 클레임 값입니다.
+    모델 인스턴스가 아니므로 FK 값으로 쓸 때는 designer_id=request.user.pk처럼 id를 사용합니다.
+    """
+
+    @cached_property
+    def id(self):
+        return int(self.token[api_settings.USER_ID_CLAIM])
+
+    @cached_property
+    def user_type(self):
+        return self.token.get(USER_TYPE_CLAIM)
+
+    @cached_property
+    def is_active(self):
+        return self.token.get(IS_ACTIVE_CLAIM, True)
+
+    @cached_property
+    def token_version(self):
+        return self.token.get(TOKEN_VERSION_CLAIM)
+
+
+class StatelessJWTAuthentication(CustomJWTAuthentication):
+    """
+    users 테이블을 읽지 않는 JWT 인증
+
+    토큰의 tv 클레임을 캐시된 사용자 토큰 버전(apps.accounts.cache)과 비교해 폐기된 토큰을
+    거부하고, 클레임으로 StatelessUser를 만듭니다. tv 클레임이 없는 이전 토큰은
+    기존처럼 DB에서 사용자를 읽습니다.
+    """
+
+    def get_user(self, validated_token):
+        if TOKEN_VERSION_CLAIM not in validated_token:
+            return super().get_user(validated_token)
+
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken('Token contained no recognizable user identification')
+
+        if not validated_token.get(IS_ACTIVE_CLAIM, True):
+            raise AuthenticationFailed('User is inactive', code='user_inactive')
+
+        version = get_token_version(validated_token[api_settings.USER_ID_CLAIM])
+        if version is None or version != validated_token[TOKEN_VERSION_CLAIM]:
+            raise AuthenticationFailed('폐기된 토큰입니다.', code='token_revoked')
+
+        return api_settings.TOKEN_USER_CLASS(validated_token)
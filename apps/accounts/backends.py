@@ -0,0 +1,19 @@
+from django.contrib.auth.backends import ModelBackend
+
+from .cache import get_user_permissions
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    권한 조회를 사용자 권한 캐시(apps.accounts.cache.permission_cache)로 처리하는 인증 백엔드
+
+    관리자 화면처럼 요청마다 has_perm/has_module_perms를 여러 번 확인하는 경우
+    사용자/그룹 권한 쿼리를 생략합니다. 객체 단위 권한은 지원하지 않습니다(ModelBackend와 동일).
+    """
+
+    def get_all_permissions(self, user_obj, obj=None):
+        if not user_obj.is_active or user_obj.is_anonymous or obj is not None:
+            return set()
+        if not hasattr(user_obj, '_perm_cache'):
+            user_obj._perm_cache = set(get_user_permissions(user_obj.pk))
+        return user_obj._perm_cache
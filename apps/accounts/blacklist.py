@@ -0,0 +1,386 @@
+"""
+리프레시 토큰 블랙리스트 저장소
+
+simplejwt 기본 동작은 토큰 갱신/로그아웃마다 token_blacklist 테이블을 조회하고 기록합니다.
+여기서는 TOKEN_BLACKLIST_STORE로 저장소를 고를 수 있게 하고, 기본 저장소(CacheBlacklistStore)는
+- 워커별 블룸 필터로 '블랙리스트에 없음'을 DB/캐시 조회 없이 판단하고
+- 블룸 필터가 있다고 하는 경우만 공유 캐시(운영: Redis) -> DB 순서로 확인하며
+- 블랙리스트 추가는 공유 캐시에 즉시 기록하고 DB(OutstandingToken/BlacklistedToken)에는
+  백그라운드 스레드에서 기록합니다. (TOKEN_BLACKLIST_ASYNC_WRITES = False면 즉시 기록)
+
+워커 간 동기화: 블랙리스트에 추가된 jti를 공유 캐시의 로그(순번 -> jti)에 남기고,
+각 워커는 확인할 때마다 순번 하나를 읽어 새 항목만 자기 블룸 필터에 더합니다.
+로그가 만료되었거나 캐시가 비워진 경우, 그리고 TOKEN_BLACKLIST_REBUILD_INTERVAL마다
+DB(+최근 로그)로 블룸 필터를 다시 만듭니다. DB 테이블이 최종 기준입니다.
+
+토큰 회전은 갱신마다 OutstandingToken 행을 추가하므로, 만료된 토큰은
+compact_expired_tokens()(compact_tokens 명령, accounts.tasks 주기 작업)로 정리합니다.
+"""
+import atexit
+import hashlib
+import logging
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DatabaseError, close_old_connections, connection, transaction
+from django.db.models import Sum
+from django.db.models.functions import Length
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+logger = logging.getLogger(__name__)
+
+BLACKLIST_PREFIX = 'accounts:bl'
+
+
+def token_record(token):
+    """DB 기록에 필요한 토큰 값 (요청 스레드에서 미리 계산)"""
+    return {
+        'jti': token.payload[api_settings.JTI_CLAIM],
+        'user_id': token.payload.get(api_settings.USER_ID_CLAIM),
+        'created_at': token.current_time,
+        'expires_at': datetime_from_epoch(token.payload['exp']),
+        'token': str(token),
+    }
+
+
+def write_outstanding(record):
+    """OutstandingToken 기록 (이미 있으면 그대로)"""
+    User = get_user_model()
+    user = User._base_manager.filter(**{api_settings.USER_ID_FIELD: record['user_id']}).first()
+    outstanding, _ = OutstandingToken.objects.get_or_create(
+        jti=record['jti'],
+        defaults={
+            'user': user,
+            'created_at': record['created_at'],
+            'token': record['token'],
+            'expires_at': record['expires_at'],
+        },
+    )
+    return outstanding
+
+
+def write_blacklist(record):
+    BlacklistedToken.objects.get_or_create(token=write_outstanding(record))
+
+
+class BackgroundWriter:
+    """DB 기록을 단일 백그라운드 스레드에서 순서대로 실행 (종료 시 남은 작업 완료)"""
+
+    def __init__(self):
+        self.executor = None
+        self.lock = threading.Lock()
+
+    def submit(self, func, *args):
+        if not getattr(settings, 'TOKEN_BLACKLIST_ASYNC_WRITES', True):
+            func(*args)
+            return
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='token-blacklist')
+                atexit.register(self.shutdown)
+            self.executor.submit(self.run, func, *args)
+
+    @staticmethod
+    def run(func, *args):
+        close_old_connections()
+        try:
+            func(*args)
+        except Exception:
+            logger.exception('토큰 블랙리스트 DB 기록 실패: %s', func.__name__)
+        finally:
+            close_old_connections()
+
+    def shutdown(self):
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=True)
+                self.executor = None
+
+
+writer = BackgroundWriter()
+
+
+class BloomFilter:
+    """jti 문자열용 블룸 필터 (없다는 판단은 항상 정확, 있다는 판단은 error_rate 확률로 오탐)"""
+
+    def __init__(self, capacity, error_rate=0.001):
+        capacity = max(1, capacity)
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def positions(self, item):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:], 'big') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item):
+        for position in self.positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self.positions(item))
+
+
+class DatabaseBlacklistStore:
+    """simplejwt 기본 동작과 같은 DB 저장소 (캐시 없음, 즉시 기록)"""
+
+    def contains(self, jti):
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+    def add(self, token):
+        write_blacklist(token_record(token))
+
+    def outstand(self, token):
+        write_outstanding(token_record(token))
+
+
+class CacheBlacklistStore(DatabaseBlacklistStore):
+    """블룸 필터 + 공유 캐시 저장소 (DB 기록은 백그라운드)"""
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.bloom = None
+        self.log_seq = 0
+        self.built_at = None
+        self.synced_at = None
+        self.lock = threading.RLock()
+
+    # 공유 캐시 키
+    def entry_key(self, jti):
+        return f'{BLACKLIST_PREFIX}:jti:{jti}'
+
+    def seq_key(self):
+        return f'{BLACKLIST_PREFIX}:seq'
+
+    def log_key(self, seq):
+        return f'{BLACKLIST_PREFIX}:log:{seq}'
+
+    @property
+    def log_timeout(self):
+        return getattr(settings, 'TOKEN_BLACKLIST_LOG_TIMEOUT', 3600)
+
+    @property
+    def log_size(self):
+        return getattr(settings, 'TOKEN_BLACKLIST_LOG_SIZE', 10000)
+
+    def contains(self, jti):
+        self.sync()
+        if jti not in self.bloom:
+            return False
+        if cache.get(self.entry_key(jti)) is not None:
+            return True
+        # 블룸 필터 오탐이거나 캐시에서 밀려난 항목 -> DB 확인
+        blacklisted = super().contains(jti)
+        if blacklisted:
+            cache.set(self.entry_key(jti), 1, self.log_timeout)
+        return blacklisted
+
+    def add(self, token):
+        record = token_record(token)
+        jti = record['jti']
+        remaining = (record['expires_at'] - timezone.now()).total_seconds()
+        cache.set(self.entry_key(jti), 1, max(1, math.ceil(remaining)))
+        seq = self.next_seq()
+        cache.set(self.log_key(seq), jti, self.log_timeout)
+        with self.lock:
+            if self.bloom is not None:
+                self.bloom.add(jti)
+        writer.submit(write_blacklist, record)
+
+    def outstand(self, token):
+        writer.submit(write_outstanding, token_record(token))
+
+    def next_seq(self):
+        try:
+            return cache.incr(self.seq_key())
+        except ValueError:
+            cache.add(self.seq_key(), 0, timeout=None)
+            return cache.incr(self.seq_key())
+
+    def sync(self):
+        """공유 로그의 새 항목을 블룸 필터에 반영 (필요하면 다시 생성)"""
+        with self.lock:
+            interval = getattr(settings, 'TOKEN_BLACKLIST_REBUILD_INTERVAL', 3600)
+            if self.bloom is None or self.clock() - self.built_at >= interval:
+                self.rebuild()
+                return
+
+            seq = cache.get(self.seq_key())
+            if seq == self.log_seq:
+                self.synced_at = self.clock()
+                return
+            if seq is None or seq < self.log_seq or seq - self.log_seq > self.log_size:
+                # 캐시가 비워졌거나 로그를 너무 오래 읽지 않은 경우
+                self.rebuild()
+                return
+
+            keys = [self.log_key(n) for n in range(self.log_seq + 1, seq + 1)]
+            entries = cache.get_many(keys)
+            if len(entries) < len(keys) and self.clock() - self.synced_at > self.log_timeout / 2:
+                # 빠진 항목이 만료되었을 수 있음
+                self.rebuild()
+                return
+            for key in keys:
+                jti = entries.get(key)
+                if jti is None:
+                    # 순번만 올라가고 아직 기록되지 않은 항목: 다음 확인 때 다시 읽음
+                    return
+                self.bloom.add(jti)
+                self.log_seq += 1
+            self.synced_at = self.clock()
+
+    def rebuild(self):
+        """DB의 유효한 블랙리스트 + 아직 DB에 기록되지 않았을 수 있는 최근 로그로 블룸 필터 생성"""
+        seq = cache.get(self.seq_key())
+        if seq is None:
+            cache.add(self.seq_key(), 0, timeout=None)
+            seq = cache.get(self.seq_key(), 0)
+
+        jtis = list(BlacklistedToken.objects.filter(
+            token__expires_at__gt=timezone.now()
+        ).values_list('token__jti', flat=True))
+        first = max(1, seq - self.log_size + 1)
+        jtis += cache.get_many([self.log_key(n) for n in range(first, seq + 1)]).values()
+
+        capacity = max(getattr(settings, 'TOKEN_BLACKLIST_BLOOM_CAPACITY', 100000), len(jtis) * 2)
+        bloom = BloomFilter(capacity, getattr(settings, 'TOKEN_BLACKLIST_BLOOM_ERROR_RATE', 0.001))
+        for jti in jtis:
+            bloom.add(jti)
+
+        self.bloom = bloom
+        self.log_seq = seq
+        self.built_at = self.synced_at = self.clock()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_blacklist_store():
+    """TOKEN_BLACKLIST_STORE 설정의 저장소 (프로세스당 하나)"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                path = getattr(settings, 'TOKEN_BLACKLIST_STORE', 'apps.accounts.blacklist.CacheBlacklistStore')
+                _store = import_string(path)()
+    return _store
+
+
+def reset_blacklist_store():
+    """저장소 다시 생성 (설정 변경/테스트용)"""
+    global _store
+    with _store_lock:
+        _store = None
+
+
+COMPACTION_LOCK_KEY = f'{BLACKLIST_PREFIX}:compaction'
+# 토큰 문자열/jti 외 행 하나가 차지하는 대략의 크기(튜플 헤더, id/user_id/시각 컬럼, 인덱스 항목)
+OUTSTANDING_ROW_OVERHEAD = 120
+BLACKLISTED_ROW_OVERHEAD = 60
+
+
+def compact_expired_tokens(batch_size=1000, sleep=0.0, grace=None, lock_timeout=None, max_batches=None, log=None):
+    """
+    만료된 OutstandingToken(+ 연결된 BlacklistedToken) 행을 배치 단위로 삭제
+
+    expires_at에는 인덱스가 없으므로 기본 키 순서로 훑습니다. id는 발급 순서대로 증가하므로
+    기준 시각에 이미 만료될 수 있는 마지막 발급 시각(기준 시각 - REFRESH_TOKEN_LIFETIME)
+    이후에 발급된 행을 만나면 중단합니다. (유효한 토큰은 다시 훑지 않음)
+    배치마다 짧은 트랜잭션으로 나누고, PostgreSQL에서는 lock_timeout(ms)을 넘기는 배치를
+    건너뛰어 운영 트래픽과 잠금 경합을 오래 하지 않습니다.
+    만료된 토큰은 인증에서 이미 거부되므로 블랙리스트 행을 같이 지워도 안전합니다.
+
+    반환: 확인/삭제 행 수와 회수한 바이트 추정치 (다른 작업이 실행 중이면 None)
+    """
+    if grace is None:
+        grace = getattr(settings, 'TOKEN_COMPACTION_GRACE', 3600)
+    if lock_timeout is None:
+        lock_timeout = getattr(settings, 'TOKEN_COMPACTION_LOCK_TIMEOUT', 2000)
+    leeway = api_settings.LEEWAY
+    if not isinstance(leeway, timedelta):
+        leeway = timedelta(seconds=leeway)
+    cutoff = timezone.now() - leeway - timedelta(seconds=grace)
+    # 이 시각 이후에 발급된 토큰은 cutoff에 아직 만료되지 않음
+    issued_cutoff = cutoff - api_settings.REFRESH_TOKEN_LIFETIME
+
+    # 동시에 여러 워커/명령이 실행되지 않도록 (끝나지 못한 경우 1시간 뒤 해제)
+    if not cache.add(COMPACTION_LOCK_KEY, 1, 3600):
+        return None
+
+    stats = {'scanned': 0, 'outstanding': 0, 'blacklisted': 0, 'bytes': 0, 'batches': 0, 'skipped': 0}
+    started = time.monotonic()
+    try:
+        last_id = 0
+        done = False
+        while not done and (max_batches is None or stats['batches'] < max_batches):
+            rows = list(
+                OutstandingToken.objects.filter(pk__gt=last_id)
+                .order_by('pk')
+                .values_list('pk', 'created_at', 'expires_at')[:batch_size]
+            )
+            if not rows:
+                break
+            stats['scanned'] += len(rows)
+            last_id = rows[-1][0]
+            done = len(rows) < batch_size or any(created_at >= issued_cutoff for _, created_at, _ in rows)
+            expired = [pk for pk, _, expires_at in rows if expires_at < cutoff]
+            if not expired:
+                continue
+
+            stats['batches'] += 1
+            try:
+                deleted, size = _delete_tokens(expired, cutoff, lock_timeout)
+            except DatabaseError as exc:
+                # 잠금 대기 시간 초과 등: 이 배치는 다음 실행 때 다시 시도
+                stats['skipped'] += len(expired)
+                logger.warning('만료 토큰 배치 삭제 건너뜀 (~%s): %s', last_id, exc)
+            else:
+                outstanding = deleted.get(OutstandingToken._meta.label, 0)
+                blacklisted = deleted.get(BlacklistedToken._meta.label, 0)
+                stats['outstanding'] += outstanding
+                stats['blacklisted'] += blacklisted
+                stats['bytes'] += (
+                    size + outstanding * OUTSTANDING_ROW_OVERHEAD + blacklisted * BLACKLISTED_ROW_OVERHEAD
+                )
+                if log:
+                    log(f'  ~{last_id}: 토큰 {outstanding}건, 블랙리스트 {blacklisted}건 삭제')
+
+            if sleep and not done:
+                time.sleep(sleep)
+    finally:
+        cache.delete(COMPACTION_LOCK_KEY)
+
+    stats['elapsed'] = round(time.monotonic() - started, 3)
+    logger.info(
+        '만료 토큰 정리: %s건 확인, 토큰 %s건, 블랙리스트 %s건, 약 %s바이트 (%s초)',
+        stats['scanned'], stats['outstanding'], stats['blacklisted'], stats['bytes'], stats['elapsed'],
+    )
+    return stats
+
+
+def _delete_tokens(ids, cutoff, lock_timeout):
+    """배치 삭제: (모델별 삭제 수, 삭제한 토큰 문자열/jti 크기)"""
+    with transaction.atomic():
+        if lock_timeout and connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL lock_timeout = %s', [f'{int(lock_timeout)}ms'])
+        # 조회 후 삭제 전까지 바뀌었을 수 있으므로 만료 조건을 다시 확인
+        queryset = OutstandingToken.objects.filter(pk__in=ids, expires_at__lt=cutoff)
+        size = queryset.aggregate(size=Sum(Length('token') + Length('jti')))['size'] or 0
+        _, deleted = queryset.delete()
+    return deleted, size
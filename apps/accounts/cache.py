@@ -0,0 +1,260 @@
+"""
+사용자 캐시
+
+1) 토큰 버전 캐시
+StatelessJWTAuthentication은 요청마다 users 테이블을 읽지 않고 토큰의 tv 클레임을
+캐시된 현재 토큰 버전과 비교합니다. 버전이 바뀌면(권한/활성 상태/비밀번호 변경, 명시적
+폐기) 캐시 항목을 지우므로 이전 토큰은 다음 요청부터 거부됩니다.
+캐시를 지우지 못한 다른 캐시 서버/프로세스에서도 TOKEN_VERSION_CACHE_TIMEOUT 안에 반영됩니다.
+
+2) 사용자/권한 2단계 캐시 (user_cache, permission_cache)
+프로세스 내 LRU(+TTL) 캐시 -> Django 캐시(공유) -> DB 순서로 조회합니다.
+공유 캐시 키에는 전역 세대 번호(epoch)가 들어가고, 사용자가 바뀌면(signals.py) 세대 번호를
+올립니다. 각 워커는 USER_CACHE_EPOCH_INTERVAL초마다 세대 번호를 확인해 바뀌었으면
+프로세스 내 캐시를 비우므로, 모든 gunicorn 워커가 그 간격 안에 변경을 반영합니다.
+캐시된 User 인스턴스는 여러 요청이 공유하므로 읽기 전용으로만 사용합니다.
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+from apps.core.cache import bump_generations, get_generations
+
+TOKEN_VERSION_PREFIX = 'accounts:tv'
+# 없는 사용자 (토큰 거부)
+MISSING = -1
+
+USER_NAMESPACE = 'accounts:user'
+EPOCH_SCOPE = 'all'
+
+
+def token_version_key(user_id):
+    return f'{TOKEN_VERSION_PREFIX}:{user_id}'
+
+
+def get_token_version(user_id):
+    """사용자의 현재 토큰 버전 (없는 사용자나 비활성 사용자는 None)"""
+    key = token_version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        row = get_user_model()._base_manager.filter(pk=user_id).values_list('token_version', 'is_active').first()
+        version = row[0] if row and row[1] else MISSING
+        cache.set(key, version, getattr(settings, 'TOKEN_VERSION_CACHE_TIMEOUT', 300))
+    return None if version == MISSING else version
+
+
+def forget_token_version(user_id):
+    cache.delete(token_version_key(user_id))
+
+
+def revoke_tokens(user_id):
+    """사용자에게 발급된 모든 토큰 폐기 (토큰 버전 증가)"""
+    get_user_model()._base_manager.filter(pk=user_id).update(token_version=F('token_version') + 1)
+    transaction.on_commit(lambda: forget_token_version(user_id))
+
+
+class LocalCache:
+    """프로세스 내 LRU + TTL 캐시 (스레드 안전)"""
+
+    def __init__(self, maxsize=1000, timeout=60, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.clock = clock
+        self.items = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self.lock:
+            item = self.items.get(key)
+            if item is None:
+                return default
+            value, expires = item
+            if expires <= self.clock():
+                del self.items[key]
+                return default
+            self.items.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self.lock:
+            self.items[key] = (value, self.clock() + self.timeout)
+            self.items.move_to_end(key)
+            while len(self.items) > self.maxsize:
+                self.items.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.items.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
+
+    def __len__(self):
+        return len(self.items)
+
+
+class TwoTierCache:
+    """
+    프로세스 내 캐시 + 공유 캐시 + DB 로더
+
+    loader: id 목록을 받아 {id: 값}을 돌려주는 함수 (없는 id는 생략 -> None으로 캐시)
+    적중 횟수는 프로세스별로 stats()에서 확인합니다.
+    """
+
+    def __init__(self, name, loader, clock=time.monotonic):
+        self.name = name
+        self.loader = loader
+        self.clock = clock
+        self.local = LocalCache(
+            maxsize=getattr(settings, 'USER_CACHE_LOCAL_SIZE', 1000),
+            timeout=getattr(settings, 'USER_CACHE_LOCAL_TIMEOUT', 60),
+            clock=clock,
+        )
+        self.epoch = None
+        self.epoch_checked = None
+        self.lock = threading.Lock()
+        self.counters = {'local_hits': 0, 'shared_hits': 0, 'misses': 0}
+
+    def get_epoch(self):
+        """공유 세대 번호 (USER_CACHE_EPOCH_INTERVAL초마다 확인, 바뀌었으면 프로세스 내 캐시 비움)"""
+        now = self.clock()
+        interval = getattr(settings, 'USER_CACHE_EPOCH_INTERVAL', 1)
+        if self.epoch_checked is not None and now - self.epoch_checked < interval:
+            return self.epoch
+        epoch = get_generations(USER_NAMESPACE, [EPOCH_SCOPE])[0]
+        with self.lock:
+            if epoch != self.epoch:
+                self.local.clear()
+                self.epoch = epoch
+            self.epoch_checked = now
+        return epoch
+
+    def shared_key(self, epoch, key):
+        return f'{USER_NAMESPACE}:{self.name}:{epoch}:{key}'
+
+    def count(self, name, n=1):
+        with self.lock:
+            self.counters[name] += n
+
+    def get(self, key):
+        return self.get_many([key])[key]
+
+    def get_many(self, keys):
+        """{key: 값} (없는 사용자는 None)"""
+        epoch = self.get_epoch()
+        result = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            item = self.local.get(key)
+            if item is None:
+                missing.append(key)
+            else:
+                result[key] = item[0]
+        self.count('local_hits', len(result))
+        if not missing:
+            return result
+
+        shared_keys = {self.shared_key(epoch, key): key for key in missing}
+        for shared_key, item in cache.get_many(list(shared_keys)).items():
+            key = shared_keys.pop(shared_key)
+            self.local.set(key, item)
+            result[key] = item[0]
+        self.count('shared_hits', len(missing) - len(shared_keys))
+        if not shared_keys:
+            return result
+
+        keys = list(shared_keys.values())
+        self.count('misses', len(keys))
+        loaded = self.loader(keys)
+        timeout = getattr(settings, 'USER_CACHE_TIMEOUT', 600)
+        items = {}
+        for key in keys:
+            # (값,) 튜플로 감싸 없는 사용자(None)도 캐시
+            item = (loaded.get(key),)
+            items[self.shared_key(epoch, key)] = item
+            self.local.set(key, item)
+            result[key] = item[0]
+        cache.set_many(items, timeout)
+        return result
+
+    def clear_local(self):
+        self.local.clear()
+        self.epoch_checked = None
+
+    def stats(self):
+        """이 프로세스의 적중 횟수와 적중률"""
+        with self.lock:
+            counters = dict(self.counters)
+        total = sum(counters.values())
+        hits = counters['local_hits'] + counters['shared_hits']
+        return {**counters, 'hit_rate': hits / total if total else 0.0}
+
+    def reset_stats(self):
+        with self.lock:
+            for name in self.counters:
+                self.counters[name] = 0
+
+
+def invalidate_users():
+    """
+    모든 워커의 사용자/권한 캐시 무효화 (세대 번호 증가)
+
+    트랜잭션 안에서 호출하면 즉시 한 번, 커밋 후에 한 번 더 올립니다.
+    (커밋 전에 다른 워커가 이전 값을 다시 캐시한 경우까지 무효화)
+    """
+    def bump():
+        bump_generations(USER_NAMESPACE, [EPOCH_SCOPE])
+        for tier in (user_cache, permission_cache):
+            tier.clear_local()
+    bump()
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(bump)
+
+
+def _load_users(user_ids):
+    return get_user_model()._base_manager.in_bulk(user_ids)
+
+
+def _load_permissions(user_ids):
+    # django.contrib.auth.backends는 모듈 로드 시 사용자 모델을 읽으므로 여기서 import
+    from django.contrib.auth.backends import ModelBackend
+
+    backend = ModelBackend()
+    # 공유 중인 User 인스턴스에 권한 캐시 속성이 붙지 않도록 복사본으로 계산
+    return {
+        user_id: frozenset(backend.get_all_permissions(copy.copy(user)))
+        for user_id, user in user_cache.get_many(user_ids).items()
+        if user is not None
+    }
+
+
+user_cache = TwoTierCache('user', _load_users)
+permission_cache = TwoTierCache('perms', _load_permissions)
+
+
+def get_user(user_id):
+    """캐시된 사용자 (없으면 None, 읽기 전용)"""
+    return user_cache.get(int(user_id))
+
+
+def get_users(user_ids):
+    """캐시된 사용자 {id: User} (없는 사용자는 제외, DB 조회는 한 번)"""
+    users = user_cache.get_many([int(user_id) for user_id in user_ids])
+    return {user_id: user for user_id, user in users.items() if user is not None}
+
+
+def get_user_permissions(user_id):
+    """사용자의 권한 문자열 집합 ('app_label.codename')"""
+    return permission_cache.get(int(user_id)) or frozenset()
+
+
+def get_user_cache_stats():
+    return {'user': user_cache.stats(), 'permission': permission_cache.stats()}
@@ -0,0 +1,132 @@
+"""
+로그인 폭주 부하 벤치마크: 로그인이 몰릴 때 다른 API 응답 시간이 얼마나 늘어나는지 측정
+
+실행 중인 서버에 동시 로그인 요청을 보내면서 가벼운 API(--probe-path)를 순차로 호출해
+평상시(baseline)와 로그인 폭주 중의 응답 시간 분포를 비교합니다.
+동기 로그인(login_view)은 워커가 비밀번호 해시에 묶이고, 비동기 로그인(async_login_view)은
+프로세스 풀에서 해시하므로 probe 지연이 거의 늘지 않아야 합니다. (풀이 가득 차면 503)
+
+사용법:
+    gunicorn fablink_project.asgi:application -k uvicorn.workers.UvicornWorker --workers 2
+    python manage.py bench_login_storm --create-user
+    python manage.py bench_login_storm --login-paths /api/accounts/login/async/ --logins 500 --concurrency 100
+"""
+import json
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.accounts.models import User
+
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+class Command(BaseCommand):
+    help = '동시 로그인 요청 중 다른 API의 응답 시간을 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://127.0.0.1:8000', help='서버 주소')
+        parser.add_argument(
+            '--login-paths', nargs='+', default=['/api/accounts/login/', '/api/accounts/login/async/'],
+            help='비교할 로그인 경로',
+        )
+        parser.add_argument('--probe-path', default='/', help='응답 시간을 측정할 API 경로')
+        parser.add_argument('--logins', type=int, default=200, help='경로별 로그인 요청 수')
+        parser.add_argument('--concurrency', type=int, default=50, help='동시 로그인 요청 수')
+        parser.add_argument('--probes', type=int, default=50, help='baseline 측정 요청 수')
+        parser.add_argument('--timeout', type=float, default=30.0, help='요청 제한 시간(초)')
+        parser.add_argument('--user-id', default='bench-login', help='로그인할 사용자 ID')
+        parser.add_argument('--password', default='bench-login-password', help='로그인할 사용자 비밀번호')
+        parser.add_argument('--user-type', default='designer', choices=['designer', 'factory'])
+        parser.add_argument('--create-user', action='store_true', help='로그인할 사용자를 생성(또는 비밀번호 재설정)')
+
+    def handle(self, *args, **options):
+        self.options = options
+        if options['create_user']:
+            self.create_user()
+
+        self.stdout.write(f"{'phase':<32}{'probe p50':>11}{'p95':>9}{'p99':>9}{'max':>9}  login")
+        baseline = [self.probe() for _ in range(options['probes'])]
+        if None in baseline:
+            raise CommandError(f"probe 요청 실패: {options['url']}{options['probe_path']}")
+        self.report('baseline', baseline)
+
+        for path in options['login_paths']:
+            probes, statuses, login_times = self.storm(path)
+            self.report(path, probes, statuses, login_times)
+
+    def create_user(self):
+        options = self.options
+        user = User.objects.filter(user_id=options['user_id'], user_type=options['user_type']).first()
+        if user is None:
+            User.objects.create_user(
+                user_id=options['user_id'], name='벤치마크', user_type=options['user_type'],
+                password=options['password'],
+            )
+        else:
+            user.set_password(options['password'])
+            user.is_active = True
+            user.save()
+
+    def request(self, path, body=None):
+        """(상태 코드, 응답 시간 ms) — 연결 실패/시간 초과는 상태 코드 None"""
+        data = json.dumps(body).encode() if body is not None else None
+        request = urllib.request.Request(
+            self.options['url'] + path, data=data, headers={'Content-Type': 'application/json'}
+        )
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=self.options['timeout']) as response:
+                response.read()
+                code = response.status
+        except urllib.error.HTTPError as exc:
+            code = exc.code
+        except (urllib.error.URLError, TimeoutError, ConnectionError):
+            code = None
+        return code, (time.perf_counter() - started) * 1000
+
+    def probe(self):
+        code, elapsed = self.request(self.options['probe_path'])
+        return elapsed if code is not None and code < 500 else None
+
+    def login(self, path):
+        options = self.options
+        return self.request(path, {
+            'userId': options['user_id'], 'password': options['password'], 'userType': options['user_type'],
+        })
+
+    def storm(self, path):
+        """로그인 요청을 동시에 보내는 동안 probe를 순차로 반복"""
+        options = self.options
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as executor:
+            futures = [executor.submit(self.login, path) for _ in range(options['logins'])]
+            probes = []
+            while not all(future.done() for future in futures):
+                probes.append(self.probe())
+            results = [future.result() for future in futures]
+
+        statuses = Counter(code or 'error' for code, _ in results)
+        return probes, statuses, [elapsed for _, elapsed in results]
+
+    def report(self, phase, probes, statuses=None, login_times=None):
+        failed = sum(value is None for value in probes)
+        probes = [value for value in probes if value is not None]
+        line = (
+            f'{phase:<32}{percentile(probes, 50):>9.1f}ms{percentile(probes, 95):>7.1f}ms'
+            f'{percentile(probes, 99):>7.1f}ms{max(probes, default=0):>7.1f}ms'
+        )
+        if statuses is not None:
+            codes = ' '.join(f'{code}={count}' for code, count in sorted(statuses.items(), key=str))
+            line += f'  {codes} (p95 {percentile(login_times, 95):.0f}ms)'
+        if failed:
+            line += f'  probe 실패 {failed}건'
+        self.stdout.write(line)
@@ -0,0 +1,51 @@
+"""
+만료된 리프레시 토큰(OutstandingToken/BlacklistedToken)을 정리하는 명령
+
+토큰 회전으로 갱신마다 OutstandingToken 행이 쌓이므로 만료된 행을 배치 단위로 삭제합니다.
+운영 중에도 실행할 수 있도록 배치마다 짧은 트랜잭션을 사용합니다.
+(주기 실행: apps.accounts.tasks.compact_expired_tokens_task)
+
+사용법:
+    python manage.py compact_tokens --batch-size 5000 --sleep 0.1
+    python manage.py compact_tokens --grace 0  # 만료 직후 토큰까지 삭제
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.accounts.blacklist import compact_expired_tokens
+
+
+class Command(BaseCommand):
+    help = '만료된 리프레시 토큰과 블랙리스트 행을 배치 단위로 삭제합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=getattr(settings, 'TOKEN_COMPACTION_BATCH_SIZE', 1000),
+            help='배치당 확인할 토큰 수',
+        )
+        parser.add_argument(
+            '--sleep', type=float, default=getattr(settings, 'TOKEN_COMPACTION_SLEEP', 0.1),
+            help='배치 사이 대기 시간(초)',
+        )
+        parser.add_argument('--grace', type=int, default=None, help='만료 후 삭제까지 유예 시간(초)')
+        parser.add_argument('--lock-timeout', type=int, default=None, help='배치별 잠금 대기 한도(ms, PostgreSQL)')
+        parser.add_argument('--max-batches', type=int, default=None, help='이번 실행에서 삭제할 최대 배치 수')
+
+    def handle(self, *args, **options):
+        stats = compact_expired_tokens(
+            batch_size=options['batch_size'],
+            sleep=options['sleep'],
+            grace=options['grace'],
+            lock_timeout=options['lock_timeout'],
+            max_batches=options['max_batches'],
+            log=self.stdout.write,
+        )
+        if stats is None:
+            raise CommandError('다른 토큰 정리 작업이 실행 중입니다.')
+
+        if stats['skipped']:
+            self.stdout.write(self.style.WARNING(f'  잠금 대기로 건너뛴 토큰 {stats["skipped"]}건'))
+        self.stdout.write(self.style.SUCCESS(
+            f'만료 토큰 정리 완료: 토큰 {stats["outstanding"]}건, 블랙리스트 {stats["blacklisted"]}건, '
+            f'약 {stats["bytes"]:,}바이트 회수 ({stats["elapsed"]}초)'
+        ))
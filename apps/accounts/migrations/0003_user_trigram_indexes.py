@@ -0,0 +1,32 @@
+# Generated by Django 4.2.7 on 2026-10-18 06:05
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+from apps.core.db import PostgresOnlyAddIndex
+
+
+class Migration(migrations.Migration):
+    """관리자 검색(designer__name, designer__user_id 등)용 pg_trgm 인덱스"""
+
+    dependencies = [
+        ('accounts', '0002_alter_user_options'),
+    ]
+
+    operations = [
+        # PostgreSQL이 아니면 건너뜀
+        TrigramExtension(),
+        PostgresOnlyAddIndex(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['name'], name='users_name_trgm', opclasses=['gin_trgm_ops'],
+            ),
+        ),
+        PostgresOnlyAddIndex(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['user_id'], name='users_user_id_trgm', opclasses=['gin_trgm_ops'],
+            ),
+        ),
+    ]
@@ -1,5 +1,8 @@
+from django.contrib.auth.hashers import check_password, make_password
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
-from django.db import models
+from django.db import models, transaction
+
+from .cache import forget_token_version
 
 
 class UserManager(BaseUserManager):
@@ -40,6 +43,9 @@ class User(AbstractBaseUser, PermissionsMixin):
     # 권한 관련 필드
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
+
+    # 발급된 토큰의 tv 클레임과 비교하는 버전 (올리면 기존 토큰이 모두 폐기됨)
+    token_version = models.PositiveIntegerField(default=0)
     
     # 타임스탬프
     created_at = models.DateTimeField(auto_now_add=True)
@@ -49,9 +55,67 @@ class User(AbstractBaseUser, PermissionsMixin):
     
     USERNAME_FIELD = 'user_id'
     REQUIRED_FIELDS = ['name']
+
+    # 바뀌면 토큰 클레임과 달라지므로 토큰 버전을 올리는 필드
+    # (비밀번호는 해시 값이 아니라 set_password 호출로 판단: 같은 비밀번호의 재해시는 제외)
+    TOKEN_CLAIM_FIELDS = ('user_type', 'is_active')
     
     def __str__(self):
         return f"{self.name} ({self.user_id})"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 토큰 클레임 필드 변경 감지를 위해 로드 시점의 값 보관
+        instance._loaded_claims = {name: instance.__dict__.get(name) for name in cls.TOKEN_CLAIM_FIELDS}
+        return instance
+
+    def set_password(self, raw_password):
+        super().set_password(raw_password)
+        self._password_changed = True
+
+    def set_upgraded_password(self, encoded):
+        """해시 알고리즘/반복 횟수 변경으로 다시 계산한 같은 비밀번호 저장 (토큰 버전 유지)"""
+        self.password = encoded
+        self.save(update_fields=['password'])
+
+    def check_password(self, raw_password):
+        # AbstractBaseUser.check_password와 같지만 재해시는 set_password를 거치지 않음
+        def setter(raw_password):
+            self.set_upgraded_password(make_password(raw_password))
+
+        return check_password(raw_password, self.password, setter)
+
+    def get_changed_claim_fields(self):
+        changed = []
+        if getattr(self, '_password_changed', False) and not self._state.adding:
+            changed.append('password')
+        loaded = getattr(self, '_loaded_claims', None)
+        if loaded:
+            changed += [
+                name for name, value in loaded.items()
+                if value is not None and value != self.__dict__.get(name)
+            ]
+        return changed
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        changed = [
+            name for name in self.get_changed_claim_fields()
+            if update_fields is None or name in update_fields
+        ]
+        if changed:
+            self.token_version += 1
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'token_version'}
+
+        super().save(*args, **kwargs)
+        self._loaded_claims = {name: self.__dict__.get(name) for name in self.TOKEN_CLAIM_FIELDS}
+        if update_fields is None or 'password' in update_fields:
+            self._password_changed = False
+
+        if changed:
+            transaction.on_commit(lambda: forget_token_version(self.pk), using=kwargs.get('using'))
     
     class Meta:
         verbose_name = '사용자'
@@ -0,0 +1,118 @@
+"""
+로그인 비밀번호 확인용 프로세스 풀
+
+비밀번호 해시(PBKDF2)는 일부러 느리게 만든 연산이라, 로그인이 몰리면 요청 워커가
+해시 계산에 묶여 다른 API까지 지연됩니다. 비동기 로그인 뷰(async_login_view)는
+이 풀의 별도 프로세스에서 비밀번호를 확인하고 이벤트 루프는 다른 요청을 계속 처리합니다.
+
+풀에 들어갈 수 있는 요청 수(실행 중 + 대기)는 LOGIN_PASSWORD_WORKERS +
+LOGIN_PASSWORD_QUEUE_SIZE로 제한하고, 가득 차면 PasswordPoolBusy를 발생시켜
+뷰가 503(Retry-After)으로 응답합니다.
+"""
+import asyncio
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+
+
+class PasswordPoolBusy(Exception):
+    """대기열이 가득 찬 경우"""
+
+
+def _init_worker(settings_module):
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+
+
+def verify_password(password, encoded):
+    """
+    풀 프로세스에서 실행: (일치 여부, 새 해시 또는 None)
+
+    해시 알고리즘/반복 횟수가 바뀌어 다시 해시해야 하는 경우 새 해시도 여기서 계산합니다.
+    (User.check_password의 setter와 같은 동작)
+    """
+    from django.contrib.auth.hashers import check_password, make_password
+
+    upgraded = []
+    valid = check_password(password, encoded, setter=lambda raw: upgraded.append(make_password(raw)))
+    return valid, upgraded[0] if upgraded else None
+
+
+class PasswordPool:
+    """비밀번호 확인 프로세스 풀 (처음 사용할 때 생성, fork된 프로세스에서는 다시 생성)"""
+
+    def __init__(self, workers=None, queue_size=None):
+        self.workers = workers or getattr(settings, 'LOGIN_PASSWORD_WORKERS', None) or os.cpu_count() or 1
+        if queue_size is None:
+            queue_size = getattr(settings, 'LOGIN_PASSWORD_QUEUE_SIZE', self.workers * 4)
+        self.capacity = self.workers + queue_size
+        self.slots = threading.BoundedSemaphore(self.capacity)
+        self.executor = None
+        self.pid = None
+        self.lock = threading.Lock()
+
+    def get_executor(self):
+        with self.lock:
+            if self.executor is None or self.pid != os.getpid():
+                # 요청 처리 스레드(로그 리스너 등)가 있는 프로세스를 fork하지 않도록 spawn 사용
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                    initargs=(os.environ.get('DJANGO_SETTINGS_MODULE', 'fablink_project.settings'),),
+                )
+                self.pid = os.getpid()
+            return self.executor
+
+    def submit(self, password, encoded):
+        """concurrent.futures.Future 반환 (자리가 없으면 PasswordPoolBusy)"""
+        if not self.slots.acquire(blocking=False):
+            raise PasswordPoolBusy()
+        try:
+            try:
+                future = self.get_executor().submit(verify_password, password, encoded)
+            except BrokenProcessPool:
+                # 풀 프로세스가 비정상 종료된 경우 새 풀로 한 번 다시 시도
+                self.reset()
+                future = self.get_executor().submit(verify_password, password, encoded)
+        except BaseException:
+            self.slots.release()
+            raise
+        # 요청이 취소되어도 계산이 끝날 때까지 자리를 차지하도록 완료 시점에 반환
+        future.add_done_callback(lambda _: self.slots.release())
+        return future
+
+    async def check(self, password, encoded):
+        """비밀번호 확인: (일치 여부, 새 해시 또는 None)"""
+        return await asyncio.wrap_future(self.submit(password, encoded))
+
+    def reset(self):
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor is not None and self.pid == os.getpid():
+            executor.shutdown(wait=True)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_password_pool():
+    """프로세스당 하나의 비밀번호 확인 풀"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = PasswordPool()
+                atexit.register(_pool.shutdown)
+    return _pool
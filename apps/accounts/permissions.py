@@ -0,0 +1,10 @@
+from rest_framework.permissions import BasePermission
+
+
+class IsFactoryUser(BasePermission):
+    """공장주 사용자만 허용"""
+    message = '공장주만 사용할 수 있습니다.'
+
+    def has_permission(self, request, view):
+        user = request.user
+        return bool(user and user.is_authenticated and getattr(user, 'user_type', None) == 'factory')
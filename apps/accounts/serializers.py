@@ -1,7 +1,9 @@
 from rest_framework import serializers
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from .cache import get_user
 from .models import User
+from .tokens import RefreshToken
 
 class LoginSerializer(serializers.Serializer):
     """통합 로그인 Serializer (Designer와 Factory 모두 지원)"""
@@ -10,6 +12,13 @@ class LoginSerializer(serializers.Serializer):
     user_type = serializers.ChoiceField(choices=[('designer', '디자이너'), ('factory', '공장주')], required=True)
 
     def validate(self, attrs):
+        user = self.get_user(attrs)
+        if not user.check_password(attrs.get('password')):
+            raise serializers.ValidationError("비밀번호가 올바르지 않습니다.")
+        return self.login(attrs, user)
+
+    def get_user(self, attrs):
+        """로그인할 사용자 조회 (비밀번호 확인 전 단계, async_login_view와 공유)"""
         user_id = attrs.get('user_id')
         password = attrs.get('password')
         user_type = attrs.get('user_type')
@@ -18,22 +27,19 @@ class LoginSerializer(serializers.Serializer):
             raise serializers.ValidationError('사용자 ID와 비밀번호를 모두 입력해주세요.')
 
         try:
-            user = User.objects.get(user_id=user_id, user_type=user_type)
-            
-            if user.check_password(password):
-                # 계정 활성화 상태 확인
-                if not user.is_active:
-                    raise serializers.ValidationError("비활성화된 계정입니다. 관리자에게 문의하세요.")
-                
-                attrs['user'] = user
-                attrs['user_type'] = user_type
-                return attrs
-            else:
-                raise serializers.ValidationError("비밀번호가 올바르지 않습니다.")
-                
+            return User.objects.get(user_id=user_id, user_type=user_type)
         except User.DoesNotExist:
             raise serializers.ValidationError("존재하지 않는 사용자입니다.")
 
+    def login(self, attrs, user):
+        """비밀번호가 확인된 사용자의 로그인 처리"""
+        # 계정 활성화 상태 확인
+        if not user.is_active:
+            raise serializers.ValidationError("비활성화된 계정입니다. 관리자에게 문의하세요.")
+
+        attrs['user'] = user
+        return attrs
+
 
 class TokenRefreshSerializer(serializers.Serializer):
     """JWT 토큰 갱신 Serializer"""
@@ -48,7 +54,10 @@ class TokenRefreshSerializer(serializers.Serializer):
         try:
             # 토큰 유효성 검사 및 새 액세스 토큰 생성
             refresh = RefreshToken(refresh_token)
+            refresh.check_version()
             attrs['access'] = str(refresh.access_token)
+            if api_settings.ROTATE_REFRESH_TOKENS:
+                refresh.rotate()
             attrs['refresh'] = str(refresh)
             return attrs
         except TokenError as e:
@@ -62,4 +71,23 @@ class UserSerializer(serializers.ModelSerializer):
         model = User
         fields = ['id', 'user_id', 'name', 'user_type', 'contact', 'address', 
                  'is_active', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'user_id', 'created_at', 'updated_at']
\ No newline at end of file
+        read_only_fields = ['id', 'user_id', 'created_at', 'updated_at']
+
+
+class CachedUserField(serializers.Field):
+    """
+    사용자 id(source='designer_id' 등)를 캐시된 사용자의 UserSerializer 형식으로 출력하는 읽기 전용 필드
+
+    사용자 행을 JOIN/조회하지 않고 apps.accounts.cache의 사용자 캐시를 사용합니다.
+    목록에서는 get_users()로 페이지의 사용자를 미리 읽어 두면 DB 조회가 한 번으로 줄어듭니다.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        user = value if isinstance(value, User) else get_user(value)
+        if user is None:
+            return None
+        return UserSerializer(user, context=self.context).data
@@ -4,10 +4,10 @@ accounts 앱의 비즈니스 로직을 담당하는 서비스 레이어
 
 from django.contrib.auth import authenticate
 from rest_framework import serializers
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
 from .models import User
 from .serializers import UserSerializer
+from .tokens import RefreshToken
 
 
 class AuthService:
@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.contrib.auth.models import Group
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_users
+from .models import User
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_user_cache(sender, instance, update_fields=None, **kwargs):
+    """사용자 정보가 바뀌면 모든 워커의 사용자/권한 캐시 무효화 (로그인 시각만 바뀐 경우 제외)"""
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    invalidate_users()
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_deleted_user_cache(sender, instance, **kwargs):
+    invalidate_users()
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+@receiver(m2m_changed, sender=Group.permissions.through)
+def invalidate_permission_cache(sender, action, **kwargs):
+    """사용자/그룹 권한 변경 시 권한 캐시 무효화"""
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_users()
@@ -0,0 +1,16 @@
+"""
+accounts 주기 작업 (Celery beat 일정은 settings.prod의 CELERY_BEAT_SCHEDULE)
+"""
+from celery import shared_task
+from django.conf import settings
+
+from .blacklist import compact_expired_tokens
+
+
+@shared_task(ignore_result=True)
+def compact_expired_tokens_task():
+    """만료된 리프레시 토큰 정리 (compact_tokens 명령과 같은 작업)"""
+    return compact_expired_tokens(
+        batch_size=getattr(settings, 'TOKEN_COMPACTION_BATCH_SIZE', 1000),
+        sleep=getattr(settings, 'TOKEN_COMPACTION_SLEEP', 0.1),
+    )
@@ -0,0 +1,167 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from .blacklist import (
+    COMPACTION_LOCK_KEY, BloomFilter, CacheBlacklistStore, compact_expired_tokens, reset_blacklist_store, writer,
+)
+from .models import User
+from .tokens import RefreshToken
+
+
+class BloomFilterTest(TestCase):
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(1000, error_rate=0.01)
+        items = [f'jti-{i}' for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        self.assertTrue(all(item in bloom for item in items))
+        false_positives = sum(f'other-{i}' in bloom for i in range(10000))
+        self.assertLess(false_positives, 300)
+
+
+@override_settings(TOKEN_BLACKLIST_ASYNC_WRITES=False)
+class BlacklistStoreTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        reset_blacklist_store()
+        self.addCleanup(reset_blacklist_store)
+        self.client = APIClient()
+        self.designer = User.objects.create_user(
+            user_id='designer1', name='디자이너', user_type='designer', password='testpass123'
+        )
+
+    def refresh(self, token):
+        return self.client.post(reverse('accounts:token_refresh'), {'refresh': str(token)})
+
+    def test_refresh_rotates_and_blacklists(self):
+        token = RefreshToken.for_user(self.designer)
+
+        response = self.refresh(token)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rotated = response.data['tokens']['refresh']
+        self.assertNotEqual(rotated, str(token))
+        self.assertTrue(BlacklistedToken.objects.filter(token__jti=token['jti']).exists())
+        self.assertTrue(OutstandingToken.objects.filter(jti=RefreshToken(rotated)['jti']).exists())
+        self.assertEqual(self.refresh(token).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.refresh(rotated).status_code, status.HTTP_200_OK)
+
+    def test_logout_blacklists(self):
+        token = RefreshToken.for_user(self.designer)
+        self.client.force_authenticate(self.designer)
+
+        response = self.client.post(reverse('accounts:logout'), {'refresh': str(token)})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.refresh(token).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_negative_check_skips_database(self):
+        store = CacheBlacklistStore()
+        store.sync()
+
+        with self.assertNumQueries(0):
+            self.assertFalse(store.contains('unknown-jti'))
+
+    def test_other_worker_synced_from_shared_log(self):
+        worker = CacheBlacklistStore()
+        worker.sync()
+        token = RefreshToken.for_user(self.designer)
+
+        CacheBlacklistStore().add(token)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(worker.contains(token['jti']))
+
+    def test_database_is_source_of_truth(self):
+        token = RefreshToken.for_user(self.designer)
+        CacheBlacklistStore().add(token)
+        cache.clear()
+
+        # 캐시가 비워지면 DB로 블룸 필터를 다시 만들고 DB에서 확인
+        self.assertTrue(CacheBlacklistStore().contains(token['jti']))
+
+    def test_async_writes(self):
+        token = RefreshToken.for_user(self.designer)
+        store = CacheBlacklistStore()
+
+        with mock.patch.object(writer, 'submit') as submit:
+            store.add(token)
+
+        # DB 기록 전에도 캐시로 즉시 거부
+        self.assertFalse(BlacklistedToken.objects.filter(token__jti=token['jti']).exists())
+        self.assertTrue(store.contains(token['jti']))
+        func, record = submit.call_args.args
+        func(record)
+        self.assertTrue(BlacklistedToken.objects.filter(token__jti=token['jti']).exists())
+
+
+class CompactExpiredTokensTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.designer = User.objects.create_user(
+            user_id='designer1', name='디자이너', user_type='designer', password='testpass123'
+        )
+        now = timezone.now()
+        self.expired = [self.create_token(f'expired-{i}', now - timedelta(days=3)) for i in range(5)]
+        # 유예 시간(60초) 안에 만료된 토큰
+        self.recent = self.create_token('recent', now - timedelta(days=1, seconds=30))
+        self.live = self.create_token('live', now)
+        for token in (self.expired[0], self.live):
+            BlacklistedToken.objects.create(token=token)
+
+    def create_token(self, jti, created_at, lifetime=timedelta(days=1)):
+        return OutstandingToken.objects.create(
+            user=self.designer, jti=jti, token='x' * 200, created_at=created_at, expires_at=created_at + lifetime,
+        )
+
+    def test_deletes_expired_in_batches(self):
+        stats = compact_expired_tokens(batch_size=2, grace=60)
+
+        self.assertEqual((stats['outstanding'], stats['blacklisted']), (5, 1))
+        self.assertEqual(stats['batches'], 3)
+        self.assertGreater(stats['bytes'], 5 * 200)
+        # 유예 시간 안에 만료된 토큰과 유효한 토큰(블랙리스트 포함)은 유지
+        self.assertEqual(set(OutstandingToken.objects.values_list('jti', flat=True)), {'recent', 'live'})
+        self.assertTrue(BlacklistedToken.objects.filter(token=self.live).exists())
+
+    def test_stops_before_unexpirable_tokens(self):
+        for i in range(10):
+            self.create_token(f'live-{i}', timezone.now())
+
+        stats = compact_expired_tokens(batch_size=2, grace=60)
+
+        # 만료될 수 없는 토큰(REFRESH_TOKEN_LIFETIME 안에 발급)이 있는 배치에서 중단
+        self.assertEqual(stats['outstanding'], 5)
+        self.assertEqual(stats['scanned'], 6)
+
+    def test_max_batches(self):
+        stats = compact_expired_tokens(batch_size=2, grace=60, max_batches=1)
+
+        self.assertEqual(stats['outstanding'], 2)
+        self.assertEqual(OutstandingToken.objects.count(), 5)
+
+    def test_skips_when_running(self):
+        cache.add(COMPACTION_LOCK_KEY, 1)
+
+        self.assertIsNone(compact_expired_tokens())
+        with self.assertRaises(CommandError):
+            call_command('compact_tokens', stdout=StringIO())
+
+    def test_command(self):
+        out = StringIO()
+
+        call_command('compact_tokens', '--batch-size', '10', '--sleep', '0', '--grace', '0', stdout=out)
+
+        self.assertIn('토큰 6건', out.getvalue())
+        self.assertEqual(list(OutstandingToken.objects.values_list('jti', flat=True)), ['live'])
@@ -0,0 +1,155 @@
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.manufacturing.tests.factories import create_product
+
+from .backends import CachedModelBackend
+from .cache import (
+    LocalCache, TwoTierCache, get_user, get_user_cache_stats, get_users, permission_cache, user_cache,
+    _load_users,
+)
+from .models import User
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class LocalCacheTest(TestCase):
+    def test_lru_eviction(self):
+        local = LocalCache(maxsize=2, timeout=60)
+        local.set('a', 1)
+        local.set('b', 2)
+        local.get('a')
+        local.set('c', 3)
+
+        self.assertEqual(local.get('a'), 1)
+        self.assertIsNone(local.get('b'))
+        self.assertEqual(local.get('c'), 3)
+
+    def test_ttl(self):
+        clock = FakeClock()
+        local = LocalCache(timeout=10, clock=clock)
+        local.set('a', 1)
+
+        clock.now = 9
+        self.assertEqual(local.get('a'), 1)
+        clock.now = 10
+        self.assertIsNone(local.get('a'))
+
+
+class UserCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        for tier in (user_cache, permission_cache):
+            tier.clear_local()
+            tier.reset_stats()
+        self.designer = User.objects.create_user(
+            user_id='designer1', name='디자이너', user_type='designer', password='testpass123'
+        )
+
+
+class TwoTierCacheTest(UserCacheTestCase):
+    def test_local_then_shared_then_database(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(get_user(self.designer.pk).name, '디자이너')
+        with self.assertNumQueries(0):
+            get_user(self.designer.pk)
+        user_cache.local.clear()
+        with self.assertNumQueries(0):
+            get_user(self.designer.pk)
+
+        stats = get_user_cache_stats()['user']
+        self.assertEqual((stats['local_hits'], stats['shared_hits'], stats['misses']), (1, 1, 1))
+        self.assertAlmostEqual(stats['hit_rate'], 2 / 3)
+
+    def test_missing_user_cached(self):
+        with self.assertNumQueries(1):
+            self.assertIsNone(get_user(999))
+        with self.assertNumQueries(0):
+            self.assertIsNone(get_user(999))
+
+    def test_get_users_single_query(self):
+        other = User.objects.create_user(user_id='designer2', name='디자이너2', user_type='designer')
+
+        with self.assertNumQueries(1):
+            users = get_users([self.designer.pk, other.pk, 999])
+
+        self.assertEqual(set(users), {self.designer.pk, other.pk})
+
+    def test_save_invalidates_other_workers(self):
+        # 다른 워커의 캐시 (같은 공유 캐시, 별도 프로세스 내 캐시)
+        clock = FakeClock()
+        worker = TwoTierCache('user', _load_users, clock=clock)
+        self.assertEqual(worker.get(self.designer.pk).name, '디자이너')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.designer.name = '새 이름'
+            self.designer.save()
+
+        # 확인 간격 안에서는 프로세스 내 캐시 사용
+        self.assertEqual(worker.get(self.designer.pk).name, '디자이너')
+        clock.now = 1
+        self.assertEqual(worker.get(self.designer.pk).name, '새 이름')
+
+    def test_last_login_update_keeps_cache(self):
+        get_user(self.designer.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.designer.save(update_fields=['last_login'])
+
+        with self.assertNumQueries(0):
+            get_user(self.designer.pk)
+
+
+class CachedModelBackendTest(UserCacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.permission = Permission.objects.get(codename='view_product')
+        self.backend = CachedModelBackend()
+
+    def fresh_user(self):
+        return User.objects.get(pk=self.designer.pk)
+
+    def test_permissions_cached(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.designer.user_permissions.add(self.permission)
+
+        self.assertTrue(self.backend.has_perm(self.fresh_user(), 'manufacturing.view_product'))
+        user = self.fresh_user()
+        with self.assertNumQueries(0):
+            self.assertTrue(self.backend.has_perm(user, 'manufacturing.view_product'))
+            self.assertFalse(self.backend.has_perm(user, 'manufacturing.delete_product'))
+
+    def test_permission_change_invalidates(self):
+        self.assertFalse(self.backend.has_perm(self.fresh_user(), 'manufacturing.view_product'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.designer.user_permissions.add(self.permission)
+
+        self.assertTrue(self.backend.has_perm(self.fresh_user(), 'manufacturing.view_product'))
+
+
+class DesignerInfoTest(UserCacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.client.force_authenticate(self.designer)
+        self.product = create_product(self.designer)
+
+    def test_designer_info_from_cache(self):
+        url = reverse('product-detail', args=[self.product.pk])
+        self.assertEqual(self.client.get(url).data['designer_info']['name'], '디자이너')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.designer.name = '새 이름'
+            self.designer.save()
+
+        self.assertEqual(self.client.get(url).data['designer_info']['name'], '새 이름')
@@ -0,0 +1,94 @@
+from unittest import mock
+
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from .models import User
+from .passwords import PasswordPool, verify_password
+from .tokens import RefreshToken
+
+
+class VerifyPasswordTest(TestCase):
+    def test_verify(self):
+        encoded = make_password('secret')
+
+        self.assertEqual(verify_password('secret', encoded), (True, None))
+        self.assertEqual(verify_password('wrong', encoded), (False, None))
+
+    @override_settings(PASSWORD_HASHERS=[
+        'django.contrib.auth.hashers.PBKDF2PasswordHasher', 'django.contrib.auth.hashers.MD5PasswordHasher',
+    ])
+    def test_returns_upgraded_hash(self):
+        valid, upgraded = verify_password('secret', make_password('secret', hasher='md5'))
+
+        self.assertTrue(valid)
+        self.assertTrue(upgraded.startswith('pbkdf2_sha256$'))
+
+
+class AsyncLoginViewTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.pool = PasswordPool(workers=1, queue_size=1)
+        cls.addClassCleanup(cls.pool.shutdown)
+
+    def setUp(self):
+        cache.clear()
+        self.designer = User.objects.create_user(
+            user_id='designer1', name='디자이너', user_type='designer', password='testpass123'
+        )
+        self.url = reverse('accounts:login_async')
+        patcher = mock.patch('apps.accounts.views.get_password_pool', return_value=self.pool)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def login(self, password='testpass123', **extra):
+        return self.client.post(
+            self.url, {'userId': 'designer1', 'password': password, 'userType': 'designer', **extra},
+            content_type='application/json',
+        )
+
+    def test_login(self):
+        response = self.login()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertTrue(data['success'])
+        self.assertEqual(data['userType'], 'designer')
+        self.assertEqual(data['user']['userId'], 'designer1')
+        self.assertEqual(RefreshToken(data['tokens']['refresh'])['user_type'], 'designer')
+
+    def test_wrong_password(self):
+        response = self.login('wrong')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['errors']['nonFieldErrors'], ['비밀번호가 올바르지 않습니다.'])
+
+    def test_field_errors(self):
+        response = self.client.post(self.url, {'userId': 'designer1'}, content_type='application/json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(response.json()['errors']), {'password', 'userType'})
+
+    def test_inactive_user(self):
+        self.designer.is_active = False
+        self.designer.save()
+
+        self.assertEqual(self.login().status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(LOGIN_RETRY_AFTER=3)
+    def test_busy_pool_returns_503(self):
+        for _ in range(self.pool.capacity):
+            self.pool.slots.acquire()
+        try:
+            response = self.login()
+        finally:
+            for _ in range(self.pool.capacity):
+                self.pool.slots.release()
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response['Retry-After'], '3')
+        self.assertEqual(self.login().status_code, status.HTTP_200_OK)
@@ -0,0 +1,144 @@
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken as SimpleRefreshToken
+
+from .cache import get_token_version, revoke_tokens
+from .models import User
+from .tokens import RefreshToken
+
+
+class StatelessJWTAuthenticationTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.designer = User.objects.create_user(
+            user_id='designer1', name='디자이너', user_type='designer', password='testpass123'
+        )
+        self.products_url = reverse('product-list')
+
+    def authenticate(self, token):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def access_token(self, user=None):
+        return RefreshToken.for_user(user or self.designer).access_token
+
+    def user_queries(self, context):
+        """인증용 사용자 행 조회 쿼리 (목록 쿼리의 JOIN 제외)"""
+        return [query['sql'] for query in context.captured_queries if 'FROM "accounts_user" WHERE' in query['sql']]
+
+    def test_login_token_claims(self):
+        response = self.client.post(reverse('accounts:login'), {
+            'user_id': 'designer1', 'password': 'testpass123', 'user_type': 'designer',
+        })
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        token = RefreshToken(response.data['tokens']['refresh']).access_token
+        self.assertEqual(token['user_type'], 'designer')
+        self.assertTrue(token['is_active'])
+        self.assertEqual(token['tv'], 0)
+
+    def test_request_without_user_lookup(self):
+        self.authenticate(self.access_token())
+        self.client.get(self.products_url)  # 토큰 버전 캐시 채우기
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.products_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.user_queries(context), [])
+
+    def test_revoked_token_rejected(self):
+        self.authenticate(self.access_token())
+        self.assertEqual(self.client.get(self.products_url).status_code, status.HTTP_200_OK)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            revoke_tokens(self.designer.pk)
+
+        self.assertEqual(self.client.get(self.products_url).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.designer.refresh_from_db()
+        self.authenticate(self.access_token())
+        self.assertEqual(self.client.get(self.products_url).status_code, status.HTTP_200_OK)
+
+    def test_claim_change_bumps_version(self):
+        self.authenticate(self.access_token())
+        self.client.get(self.products_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.designer.user_type = 'factory'
+            self.designer.save()
+
+        self.assertEqual(self.designer.token_version, 1)
+        self.assertEqual(get_token_version(self.designer.pk), 1)
+        self.assertEqual(self.client.get(self.products_url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_last_login_update_keeps_version(self):
+        self.designer.name = '새 이름'
+        self.designer.save(update_fields=['name'])
+        self.designer.set_password('newpass123')
+        self.designer.save(update_fields=['last_login'])
+
+        self.assertEqual(User.objects.get(pk=self.designer.pk).token_version, 0)
+
+    def test_password_change_bumps_version(self):
+        user = User.objects.get(pk=self.designer.pk)
+        user.set_password('newpass123')
+        user.save(update_fields=['password'])
+
+        self.assertEqual(User.objects.get(pk=self.designer.pk).token_version, 1)
+
+    @override_settings(PASSWORD_HASHERS=[
+        'django.contrib.auth.hashers.PBKDF2PasswordHasher', 'django.contrib.auth.hashers.MD5PasswordHasher',
+    ])
+    def test_password_rehash_keeps_version(self):
+        User.objects.filter(pk=self.designer.pk).update(password=make_password('testpass123', hasher='md5'))
+        user = User.objects.get(pk=self.designer.pk)
+
+        self.assertTrue(user.check_password('testpass123'))
+        user = User.objects.get(pk=self.designer.pk)
+        self.assertTrue(user.password.startswith('pbkdf2_sha256$'))
+        self.assertEqual(user.token_version, 0)
+
+        # 비동기 로그인 뷰는 풀 프로세스에서 계산한 해시를 set_upgraded_password로 저장
+        user.set_upgraded_password(make_password('testpass123'))
+        self.assertEqual(User.objects.get(pk=self.designer.pk).token_version, 0)
+
+    def test_inactive_user_rejected(self):
+        self.authenticate(self.access_token())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.designer.is_active = False
+            self.designer.save()
+
+        self.assertEqual(self.client.get(self.products_url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_revoked_refresh_token_rejected(self):
+        refresh = RefreshToken.for_user(self.designer)
+        with self.captureOnCommitCallbacks(execute=True):
+            revoke_tokens(self.designer.pk)
+
+        response = self.client.post(reverse('accounts:token_refresh'), {'refresh': str(refresh)})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_legacy_token_falls_back_to_database(self):
+        self.authenticate(SimpleRefreshToken.for_user(self.designer).access_token)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.products_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(self.user_queries(context)), 1)
+
+    def test_profile_reads_user(self):
+        self.authenticate(self.access_token())
+
+        response = self.client.get(reverse('accounts:user_profile'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['user']['name'], '디자이너')
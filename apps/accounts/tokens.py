@@ -0,0 +1,58 @@
+"""
+FabLink JWT 토큰
+
+액세스 토큰에 user_type, is_active, tv(토큰 버전) 클레임을 담아 인증 시 사용자 행을
+읽지 않아도 되게 합니다. 리프레시 토큰의 클레임은 새 액세스 토큰에 그대로 복사됩니다.
+리프레시 토큰의 블랙리스트 확인/등록은 블랙리스트 저장소(apps.accounts.blacklist)를 사용합니다.
+"""
+from rest_framework_simplejwt import tokens
+from rest_framework_simplejwt.exceptions import TokenError
+
+from .blacklist import get_blacklist_store
+from .cache import get_token_version
+
+USER_TYPE_CLAIM = 'user_type'
+IS_ACTIVE_CLAIM = 'is_active'
+TOKEN_VERSION_CLAIM = 'tv'
+
+
+class RefreshToken(tokens.RefreshToken):
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token[USER_TYPE_CLAIM] = user.user_type
+        token[IS_ACTIVE_CLAIM] = user.is_active
+        token[TOKEN_VERSION_CLAIM] = user.token_version
+        return token
+
+    def check_version(self):
+        """폐기된(토큰 버전이 지난) 토큰이면 TokenError (tv 클레임이 없는 이전 토큰은 통과)"""
+        if TOKEN_VERSION_CLAIM not in self.payload:
+            return
+        user_id = self.payload.get(tokens.api_settings.USER_ID_CLAIM)
+        if get_token_version(user_id) != self.payload[TOKEN_VERSION_CLAIM]:
+            raise TokenError('폐기된 토큰입니다.')
+
+    def check_blacklist(self):
+        if get_blacklist_store().contains(self.payload[tokens.api_settings.JTI_CLAIM]):
+            raise TokenError('블랙리스트에 등록된 토큰입니다.')
+
+    def blacklist(self):
+        get_blacklist_store().add(self)
+
+    def outstand(self):
+        get_blacklist_store().outstand(self)
+
+    def rotate(self):
+        """
+        새 jti/만료 시각으로 교체 (ROTATE_REFRESH_TOKENS)
+
+        BLACKLIST_AFTER_ROTATION이면 이전 토큰을 블랙리스트에 등록합니다.
+        """
+        if tokens.api_settings.BLACKLIST_AFTER_ROTATION:
+            self.blacklist()
+        self.set_jti()
+        self.set_exp()
+        self.set_iat()
+        self.outstand()
@@ -6,6 +6,7 @@ app_name = 'accounts'
 urlpatterns = [
     # ==================== 통합 인증 ====================
     path('login/', views.login_view, name='login'),
+    path('login/async/', views.async_login_view, name='login_async'),
     path('logout/', views.logout_view, name='logout'),
     path('token/refresh/', views.token_refresh_view, name='token_refresh'),
     
@@ -1,17 +1,28 @@
+from io import BytesIO
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotAllowed
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import serializers
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework.exceptions import ParseError
 from rest_framework_simplejwt.exceptions import TokenError
 
+from apps.core.parsers import CamelCaseFormParser, ORJSONCamelCaseParser
+from apps.core.renderers import ORJSONCamelCaseRenderer
+
 from .serializers import (
     LoginSerializer, 
     UserSerializer,
     TokenRefreshSerializer
 )
+from .cache import get_user
 from .models import User
+from .passwords import PasswordPoolBusy, get_password_pool
+from .tokens import RefreshToken
 
 
 # ==================== 통합 로그인/로그아웃 ====================
@@ -42,21 +53,7 @@ def login_view(request):
     try:
         user = serializer.validated_data['user']
         user_type = serializer.validated_data['user_type']
-        refresh = RefreshToken.for_user(user)
-        
-        # 사용자 정보 직렬화
-        user_data = UserSerializer(user, context={'request': request}).data
-        
-        return Response({
-            'success': True,
-            'message': f'{user_type} 로그인 성공',
-            'user_type': user_type,
-            'tokens': {
-                'access': str(refresh.access_token),
-                'refresh': str(refresh)
-            },
-            'user': user_data
-        }, status=status.HTTP_200_OK)
+        return Response(login_response_data(user, user_type, request), status=status.HTTP_200_OK)
         
     except Exception as e:
         return Response({
@@ -65,6 +62,87 @@ def login_view(request):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+def login_response_data(user, user_type, request):
+    """로그인 성공 응답 (토큰 발급 + 사용자 정보)"""
+    refresh = RefreshToken.for_user(user)
+
+    # 사용자 정보 직렬화
+    user_data = UserSerializer(user, context={'request': request}).data
+
+    return {
+        'success': True,
+        'message': f'{user_type} 로그인 성공',
+        'user_type': user_type,
+        'tokens': {
+            'access': str(refresh.access_token),
+            'refresh': str(refresh)
+        },
+        'user': user_data
+    }
+
+
+def render_json(data, status_code):
+    """DRF 밖의 (비동기) 뷰용 camelCase JSON 응답"""
+    return HttpResponse(
+        ORJSONCamelCaseRenderer().render(data), status=status_code, content_type='application/json'
+    )
+
+
+async def async_login_view(request):
+    """
+    비동기 통합 로그인 API (ASGI 서버에서 사용, 요청/응답 형식은 login_view와 같음)
+    POST /api/accounts/login/async/
+
+    비밀번호 확인은 프로세스 풀(apps.accounts.passwords)에서 실행하므로 로그인이 몰려도
+    이벤트 루프는 다른 요청을 계속 처리합니다. 풀 대기열이 가득 차면 503과 Retry-After를 반환합니다.
+    """
+    if request.method != 'POST':
+        return HttpResponseNotAllowed(['POST'])
+
+    parser = ORJSONCamelCaseParser() if request.content_type == 'application/json' else CamelCaseFormParser()
+    try:
+        data = parser.parse(BytesIO(request.body))
+    except ParseError as e:
+        return render_json({'success': False, 'message': str(e.detail)}, status.HTTP_400_BAD_REQUEST)
+
+    serializer = LoginSerializer(data=data)
+    try:
+        attrs = serializer.to_internal_value(data)
+        user = await sync_to_async(serializer.get_user)(attrs)
+        valid, upgraded = await get_password_pool().check(attrs['password'], user.password)
+        if not valid:
+            raise serializers.ValidationError("비밀번호가 올바르지 않습니다.")
+        attrs = serializer.login(attrs, user)
+    except serializers.ValidationError as e:
+        return render_json({
+            'success': False,
+            'message': '로그인 실패',
+            'errors': serializers.as_serializer_error(e),
+        }, status.HTTP_400_BAD_REQUEST)
+    except PasswordPoolBusy:
+        response = render_json({
+            'success': False,
+            'message': '로그인 요청이 많습니다. 잠시 후 다시 시도해주세요.',
+        }, status.HTTP_503_SERVICE_UNAVAILABLE)
+        response['Retry-After'] = str(getattr(settings, 'LOGIN_RETRY_AFTER', 1))
+        return response
+
+    try:
+        if upgraded:
+            await sync_to_async(user.set_upgraded_password)(upgraded)
+        data = await sync_to_async(login_response_data)(user, attrs['user_type'], request)
+    except Exception as e:
+        return render_json({
+            'success': False,
+            'message': f'로그인 실패: {str(e)}',
+        }, status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return render_json(data, status.HTTP_200_OK)
+
+
+# Django 4.2의 csrf_exempt/require_POST 데코레이터는 비동기 뷰를 감싸지 못하므로 속성으로 지정
+async_login_view.csrf_exempt = True
+
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def logout_view(request):
@@ -143,7 +221,14 @@ def user_profile_view(request):
     GET /api/accounts/profile/
     """
     try:
-        serializer = UserSerializer(request.user, context={'request': request})
+        # 토큰 인증 사용자(StatelessUser)는 클레임만 가지고 있으므로 프로필은 사용자 캐시에서 읽음
+        user = get_user(request.user.pk)
+        if user is None:
+            return Response({
+                'success': False,
+                'message': '사용자를 찾을 수 없습니다.'
+            }, status=status.HTTP_404_NOT_FOUND)
+        serializer = UserSerializer(user, context={'request': request})
         
         return Response({
             'success': True,
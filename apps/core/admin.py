@@ -0,0 +1,127 @@
+import json
+
+from django.contrib.admin.utils import lookup_spawns_duplicates
+from django.core.exceptions import FieldDoesNotExist
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+from django.utils.text import smart_split, unescape_string_literal
+
+
+class TrigramSearchMixin:
+    """
+    pg_trgm GIN 인덱스를 탈 수 있는 형태로 관리자 검색 쿼리를 만드는 믹스인
+
+    기본 ModelAdmin 검색은 search_fields 전체를 JOIN 후 OR로 묶은 ILIKE 조건을 만들어
+    테이블마다 있는 트라이그램 인덱스를 쓰지 못합니다. 이 믹스인은
+    - 자기 테이블 필드: name ILIKE '%..%' (트라이그램 인덱스)
+    - 한 단계 관계 필드(designer__name 등): designer_id IN (SELECT id FROM users WHERE name ILIKE ...)
+    로 바꿔 각 조건이 해당 테이블의 인덱스를 사용하게 합니다.
+
+    exact_search_fields에 지정한 필드(주문 번호 등)는 검색어 전체와 정확히 일치하는 행이
+    있으면 유니크 인덱스 조회 결과만 반환합니다. exact_search_pattern(정규식)을 지정하면
+    패턴에 맞는 검색어일 때만 정확 일치를 먼저 확인합니다.
+
+    search_fields에는 접두어(^, =, @) 없는 필드 경로만 사용합니다.
+    """
+    exact_search_fields = ()
+    exact_search_pattern = None
+
+    def get_search_results(self, request, queryset, search_term):
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+
+        exact = self.get_exact_search_results(queryset, search_term)
+        if exact is not None:
+            return exact, False
+
+        search_fields = self.get_search_fields(request)
+        if not search_fields:
+            return queryset, False
+
+        for term in smart_split(search_term):
+            if term.startswith(('"', "'")) and term[0] == term[-1]:
+                term = unescape_string_literal(term)
+            queryset = queryset.filter(self.get_term_condition(search_fields, term))
+
+        may_have_duplicates = any(lookup_spawns_duplicates(self.opts, path) for path in search_fields)
+        return queryset, may_have_duplicates
+
+    def get_exact_search_results(self, queryset, search_term):
+        """정확히 일치하는 행이 있으면 그 queryset, 없으면 None"""
+        if not self.exact_search_fields:
+            return None
+        if self.exact_search_pattern and not self.exact_search_pattern.match(search_term):
+            return None
+
+        condition = Q()
+        for field in self.exact_search_fields:
+            condition |= Q(**{field: search_term})
+        exact = queryset.filter(condition)
+        return exact if exact.exists() else None
+
+    def get_term_condition(self, search_fields, term):
+        """검색어 하나에 대한 조건 (필드/관계별 조건의 OR)"""
+        local_fields = []
+        related_fields = {}
+        for path in search_fields:
+            relation, _, field = path.partition('__')
+            if field and '__' not in field and self.is_forward_relation(relation):
+                related_fields.setdefault(relation, []).append(field)
+            else:
+                local_fields.append(path)
+
+        condition = Q()
+        for path in local_fields:
+            condition |= Q(**{f'{path}__icontains': term})
+        for relation, fields in related_fields.items():
+            related_model = self.opts.get_field(relation).related_model
+            related_condition = Q()
+            for field in fields:
+                related_condition |= Q(**{f'{field}__icontains': term})
+            subquery = related_model._base_manager.filter(related_condition).values('pk')
+            condition |= Q(**{f'{relation}__in': subquery})
+        return condition
+
+    def is_forward_relation(self, name):
+        """IN 서브쿼리로 바꿀 수 있는 정방향 FK/OneToOne 관계인지 확인"""
+        try:
+            field = self.opts.get_field(name)
+        except FieldDoesNotExist:
+            return False
+        return field.concrete and (field.many_to_one or field.one_to_one)
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    대용량 테이블 관리자 목록용 페이지네이터
+
+    PostgreSQL에서는 COUNT(*) 대신 플래너의 예상 행 수(EXPLAIN)를 사용하고,
+    예상 값이 exact_count_threshold보다 작을 때만 실제로 셉니다.
+    ModelAdmin.show_full_result_count = False와 함께 사용합니다.
+    """
+    exact_count_threshold = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return super().count
+
+        estimate = self.estimate_count(queryset, connection)
+        if estimate < self.exact_count_threshold:
+            return super().count
+        return estimate
+
+    def estimate_count(self, queryset, connection):
+        sql, params = queryset.order_by().query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+
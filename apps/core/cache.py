@@ -0,0 +1,73 @@
+"""
+응답 캐시용 세대(generation) 카운터와 적중률 지표
+
+캐시 키에 세대 번호를 포함시키고, 데이터가 바뀌면 해당 범위의 세대 번호만 올려
+이전 캐시 항목을 한 번에 무효화합니다. (항목을 직접 삭제하지 않음)
+"""
+import time
+
+from django.core.cache import cache
+
+GENERATION_PREFIX = 'gen'
+METRICS_PREFIX = 'metrics'
+
+
+def generation_key(namespace, scope):
+    return f'{GENERATION_PREFIX}:{namespace}:{scope}'
+
+
+def get_generations(namespace, scopes):
+    """범위별 현재 세대 번호 반환 (없으면 새로 생성)"""
+    keys = [generation_key(namespace, scope) for scope in scopes]
+    values = cache.get_many(keys)
+    generations = []
+    for key in keys:
+        value = values.get(key)
+        if value is None:
+            value = _initial_generation()
+            if not cache.add(key, value, timeout=None):
+                value = cache.get(key, value)
+        generations.append(value)
+    return generations
+
+
+def bump_generations(namespace, scopes):
+    """범위별 세대 번호 증가 → 해당 범위의 캐시 항목 무효화"""
+    for scope in set(scopes):
+        key = generation_key(namespace, scope)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # 키가 없거나 제거된 경우: 이전에 쓰인 번호와 겹치지 않도록 시각 기반으로 시작
+            cache.set(key, _initial_generation(), timeout=None)
+
+
+def _initial_generation():
+    return time.time_ns() // 1000
+
+
+def record_cache_result(namespace, hit):
+    """캐시 적중/실패 횟수 기록 (모든 워커가 공유)"""
+    key = f"{METRICS_PREFIX}:{namespace}:{'hits' if hit else 'misses'}"
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def get_cache_metrics(namespace):
+    """캐시 적중/실패 횟수와 적중률 반환"""
+    values = cache.get_many([f'{METRICS_PREFIX}:{namespace}:hits', f'{METRICS_PREFIX}:{namespace}:misses'])
+    hits = values.get(f'{METRICS_PREFIX}:{namespace}:hits', 0)
+    misses = values.get(f'{METRICS_PREFIX}:{namespace}:misses', 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': hits / total if total else 0.0,
+    }
+
+
+def reset_cache_metrics(namespace):
+    cache.delete_many([f'{METRICS_PREFIX}:{namespace}:hits', f'{METRICS_PREFIX}:{namespace}:misses'])
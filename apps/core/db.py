@@ -0,0 +1,44 @@
+"""
+PostgreSQL 전용 마이그레이션 오퍼레이션
+
+GIN 인덱스, 확장(extension) 등 PostgreSQL에만 있는 기능은 로컬 테스트용 SQLite에서
+실행할 수 없으므로, 다른 DB에서는 건너뛰는 오퍼레이션으로 감쌉니다.
+모델 상태(state)는 바꾸지 않으므로 모델 Meta.indexes에는 선언하지 않습니다.
+"""
+from django.db import migrations
+
+
+def is_postgresql(connection):
+    return connection.vendor == 'postgresql'
+
+
+class PostgresOnlyAddIndex(migrations.AddIndex):
+    """PostgreSQL에서만 생성하는 인덱스 (GIN, opclass 지정 인덱스 등)"""
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if is_postgresql(schema_editor.connection):
+            model = to_state.apps.get_model(app_label, self.model_name)
+            schema_editor.add_index(model, self.index)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if is_postgresql(schema_editor.connection):
+            model = from_state.apps.get_model(app_label, self.model_name)
+            schema_editor.remove_index(model, self.index)
+
+    def describe(self):
+        return f'{super().describe()} (PostgreSQL only)'
+
+
+class PostgresOnlyRunPython(migrations.RunPython):
+    """PostgreSQL에서만 실행하는 데이터 마이그레이션"""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if is_postgresql(schema_editor.connection):
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if is_postgresql(schema_editor.connection):
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
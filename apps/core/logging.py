@@ -0,0 +1,219 @@
+"""
+비동기 로깅 파이프라인
+
+요청 스레드에서는 기록(record)을 큐에 넣기만 하고, 파일/콘솔 쓰기는 백그라운드
+QueueListener 스레드가 처리합니다. 큐에 넣기 전에 핸들러 필터로
+- SamplingFilter: logger별로 INFO 이하 기록의 일부만 통과
+- RateLimitFilter: logger별 초당 기록 수 제한 (토큰 버킷)
+를 적용해 매 요청마다 찍히는 로그가 I/O를 점유하지 않게 합니다.
+
+LazyPayload는 요청/응답 데이터를 로그 인자로 넘길 때 사용합니다. 기록이 실제로
+출력될 때만 문자열로 변환하고, 업로드 파일은 이름/크기로, 긴 값은 잘라서 표시합니다.
+
+설정 예 (LOGGING):
+    'handlers': {
+        'file': {...},
+        'queue': {
+            'class': 'apps.core.logging.QueueLogHandler',
+            'handlers': ['console', 'file'],
+            'filters': ['sampling', 'rate_limit'],
+        },
+    }
+dictConfig는 핸들러를 이름 순으로 만들기 때문에 큐 핸들러 이름은 대상 핸들러
+이름보다 뒤에 오도록 지정합니다.
+"""
+import atexit
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+
+
+def _level(value):
+    if isinstance(value, str):
+        return logging.getLevelName(value.upper())
+    return value
+
+
+def _match_prefix(name, prefixes):
+    """logger 이름에 가장 구체적으로 일치하는 접두어 ('apps'는 'apps.core'와 일치)"""
+    for prefix in prefixes:
+        if name == prefix or name.startswith(prefix + '.'):
+            return prefix
+    return None
+
+
+class QueueLogHandler(QueueHandler):
+    """
+    기록을 큐에 넣고 백그라운드 스레드에서 대상 핸들러로 전달하는 핸들러
+
+    handlers: 대상 핸들러 이름 목록 (같은 LOGGING 설정의 handlers 키)
+    리스너 스레드는 첫 기록 때 시작하고, 프로세스가 fork된 경우(gunicorn preload 등)
+    자식 프로세스에서 다시 시작합니다. 종료 시 남은 기록을 모두 쓴 뒤 멈춥니다.
+    """
+
+    def __init__(self, handlers=(), queue_size=10000, respect_handler_level=True):
+        super().__init__(queue.Queue(queue_size))
+        self.targets = [self.resolve_handler(name) for name in handlers]
+        self.respect_handler_level = respect_handler_level
+        self.listener = None
+        self.listener_pid = None
+        self.dropped = 0
+        self.start_lock = threading.Lock()
+        atexit.register(self.stop)
+
+    @staticmethod
+    def resolve_handler(name):
+        if isinstance(name, logging.Handler):
+            return name
+        # dictConfig로 만든 핸들러는 이름으로 등록됨
+        handler = logging._handlers.get(name)
+        if handler is None:
+            raise ValueError(f'로그 핸들러 {name!r}를 찾을 수 없습니다. 큐 핸들러보다 먼저 설정해야 합니다.')
+        return handler
+
+    def start(self):
+        with self.start_lock:
+            if self.listener is not None and self.listener_pid == os.getpid():
+                return
+            self.listener = QueueListener(
+                self.queue, *self.targets, respect_handler_level=self.respect_handler_level
+            )
+            self.listener.start()
+            self.listener_pid = os.getpid()
+
+    def stop(self):
+        """남은 기록을 모두 쓰고 리스너 스레드 종료"""
+        with self.start_lock:
+            if self.listener is not None and self.listener_pid == os.getpid():
+                self.listener.stop()
+            self.listener = None
+            self.listener_pid = None
+
+    def enqueue(self, record):
+        if self.listener_pid != os.getpid():
+            self.start()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # 대상 I/O가 밀린 경우 요청 스레드를 막지 않고 버림
+            self.dropped += 1
+
+    def close(self):
+        self.stop()
+        super().close()
+
+
+class SamplingFilter(logging.Filter):
+    """
+    logger별 샘플링 필터
+
+    rates: {logger 이름(접두어): 통과 비율(0~1)}
+    max_level 이하(기본 INFO) 기록에만 적용하고, 그보다 높은 기록은 항상 통과합니다.
+    """
+
+    def __init__(self, rates=None, max_level='INFO'):
+        super().__init__()
+        self.rates = dict(rates or {})
+        self.prefixes = sorted(self.rates, key=len, reverse=True)
+        self.max_level = _level(max_level)
+        self.name_rates = {}
+
+    def get_rate(self, name):
+        rate = self.name_rates.get(name)
+        if rate is None:
+            prefix = _match_prefix(name, self.prefixes)
+            rate = self.rates[prefix] if prefix is not None else 1.0
+            self.name_rates[name] = rate
+        return rate
+
+    def filter(self, record):
+        if record.levelno > self.max_level:
+            return True
+        rate = self.get_rate(record.name)
+        return rate >= 1 or random.random() < rate
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    logger별 초당 기록 수 제한 (토큰 버킷)
+
+    limits: {logger 이름(접두어): 초당 기록 수}
+    burst: 순간 허용량 (기본: 초당 기록 수와 같음)
+    max_level 이하(기본 WARNING) 기록에만 적용합니다. 제한으로 버려진 기록 수는
+    다음에 통과하는 기록의 suppressed 속성에 담깁니다.
+    """
+
+    def __init__(self, limits=None, burst=None, max_level='WARNING', clock=time.monotonic):
+        super().__init__()
+        self.limits = dict(limits or {})
+        self.prefixes = sorted(self.limits, key=len, reverse=True)
+        self.burst = burst
+        self.max_level = _level(max_level)
+        self.clock = clock
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno > self.max_level:
+            return True
+        prefix = _match_prefix(record.name, self.prefixes)
+        if prefix is None:
+            return True
+
+        rate = self.limits[prefix]
+        capacity = self.burst or rate
+        now = self.clock()
+        with self.lock:
+            tokens, updated, suppressed = self.buckets.get(prefix, (capacity, now, 0))
+            tokens = min(capacity, tokens + (now - updated) * rate)
+            if tokens < 1:
+                self.buckets[prefix] = (tokens, now, suppressed + 1)
+                return False
+            self.buckets[prefix] = (tokens - 1, now, 0)
+        record.suppressed = suppressed
+        return True
+
+
+class LazyPayload:
+    """
+    출력될 때만 문자열로 변환되는 로그 인자
+
+        logger.debug('요청 데이터: %s', LazyPayload(request.data))
+
+    업로드 파일은 <file 이름 (크기)>로, 긴 문자열은 max_value_length로 잘라 표시하고
+    전체 결과도 max_length를 넘지 않게 합니다.
+    """
+
+    def __init__(self, data, max_length=1000, max_value_length=100):
+        self.data = data
+        self.max_length = max_length
+        self.max_value_length = max_value_length
+
+    def __str__(self):
+        text = repr(self.summarize(self.data))
+        if len(text) > self.max_length:
+            text = f'{text[:self.max_length]}...(+{len(text) - self.max_length})'
+        return text
+
+    __repr__ = __str__
+
+    def summarize(self, value):
+        if hasattr(value, 'read') and hasattr(value, 'size'):
+            return f'<file {getattr(value, "name", "")} ({value.size} bytes)>'
+        if hasattr(value, 'lists'):
+            # QueryDict/MultiValueDict: 같은 키의 값 목록 유지
+            return {
+                key: self.summarize(items[0]) if len(items) == 1 else [self.summarize(item) for item in items]
+                for key, items in value.lists()
+            }
+        if isinstance(value, dict):
+            return {key: self.summarize(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self.summarize(item) for item in value]
+        if isinstance(value, (str, bytes)) and len(value) > self.max_value_length:
+            return f'{value[:self.max_value_length]!s}...(+{len(value) - self.max_value_length})'
+        return value
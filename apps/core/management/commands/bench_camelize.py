@@ -0,0 +1,81 @@
+"""
+camelCase 렌더러 벤치마크: djangorestframework_camel_case 렌더러 vs 프로젝트 렌더러
+
+대량 주문 목록 응답과 같은 구조의 데이터를 만들어 렌더링 시간을 비교합니다.
+(library: 라이브러리 렌더러, cached: 키 변환 캐시, orjson: 키 변환 캐시 + orjson 인코딩)
+
+사용법:
+    python manage.py bench_camelize
+    python manage.py bench_camelize --rows 100 1000 5000 --repeat 10
+"""
+import time
+from collections import OrderedDict
+
+from django.core.management.base import BaseCommand
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer as LibraryRenderer
+
+from apps.core.renderers import CamelCaseJSONRenderer, ORJSONCamelCaseRenderer
+
+
+def build_order_list(rows):
+    """OrderSerializer 목록 응답과 같은 구조의 데이터 생성"""
+    results = []
+    for i in range(rows):
+        results.append(OrderedDict([
+            ('id', i),
+            ('order_id', f'ORD-20260101-{i:08X}'),
+            ('product', i),
+            ('product_info', OrderedDict([
+                ('id', i), ('name', f'제품 {i}'), ('season', 'summer'), ('target', 'twenties'),
+                ('concept', '컨셉 설명'), ('image_path', None), ('image_url', None),
+                ('quantity', 100), ('due_date', '2026-12-01'), ('designer', 1),
+                ('designer_name', '디자이너'), ('created_at', '2026-01-01T09:00:00+09:00'),
+            ])),
+            ('status', 'pending'), ('quantity', 10), ('unit_price', '15000.00'),
+            ('total_price', '150000.00'), ('receipt_path', None), ('receipt_url', None),
+            ('notes', None), ('customer_name', '고객'), ('customer_contact', '010-0000-0000'),
+            ('customer_email', None), ('shipping_address', '서울'), ('shipping_method', '택배'),
+            ('shipping_cost', '3000.00'), ('created_at', '2026-01-01T09:00:00+09:00'),
+            ('updated_at', '2026-01-01T09:00:00+09:00'),
+        ]))
+    return OrderedDict([('count', rows), ('next', None), ('previous', None), ('results', results)])
+
+
+class Command(BaseCommand):
+    help = 'camelCase 렌더러의 렌더링 시간을 라이브러리 렌더러와 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, nargs='+', default=[100, 1000, 5000], help='주문 행 수')
+        parser.add_argument('--repeat', type=int, default=10, help='반복 횟수 (최소값 사용)')
+
+    def handle(self, *args, **options):
+        renderers = (
+            ('library', LibraryRenderer()),
+            ('cached', CamelCaseJSONRenderer()),
+            ('orjson', ORJSONCamelCaseRenderer()),
+        )
+
+        self.stdout.write(f"{'rows':>7}" + ''.join(f'{name + "(ms)":>14}' for name, _ in renderers))
+        for rows in options['rows']:
+            data = build_order_list(rows)
+            outputs, timings = {}, {}
+            for name, renderer in renderers:
+                outputs[name] = renderer.render(data)
+                timings[name] = self.measure(lambda: renderer.render(data), options['repeat'])
+
+            for name, _ in renderers:
+                if outputs[name] != outputs['library']:
+                    self.stdout.write(self.style.ERROR(f'{rows}행: {name} 렌더링 결과가 다릅니다.'))
+
+            self.stdout.write(f'{rows:>7}' + ''.join(
+                f"{timings[name] * 1000:>9.2f}({timings['library'] / timings[name]:.1f}x)"
+                for name, _ in renderers
+            ))
+
+    def measure(self, func, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        return min(timings)
@@ -1 +1,241 @@
+import hashlib
 
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+from .cache import record_cache_result
+from .serializers import ValuesPlan
+
+
+class QueryPlanMixin:
+    """
+    ViewSet이 사용하는 시리얼라이저별로 쿼리 플랜을 선언하기 위한 믹스인
+
+    시리얼라이저가 중첩 객체(designer, product 등)를 읽을 때 발생하는 N+1 쿼리를
+    막기 위해, 각 시리얼라이저가 필요로 하는 select_related/prefetch_related/only
+    설정을 ViewSet에 선언해 두고 get_queryset에서 한 번에 적용합니다.
+
+    시리얼라이저가 SparseFieldsetMixin을 사용하면 `?fields=`/`?omit=`로 요청된
+    필드에 필요한 컬럼만 .only()로 조회하고, 필요 없는 select_related는 생략합니다.
+
+    예시:
+        query_plans = {
+            OrderSerializer: {
+                'select_related': ('product__designer',),
+            },
+        }
+    """
+    query_plans = {}
+
+    def get_query_plan(self):
+        """현재 액션의 시리얼라이저에 해당하는 쿼리 플랜 반환"""
+        return self.query_plans.get(self.get_serializer_class(), {})
+
+    def get_sparse_columns(self):
+        """요청된 필드에 필요한 컬럼 목록 반환 (필드 제한이 없으면 None)"""
+        serializer_class = self.get_serializer_class()
+        if not hasattr(serializer_class, 'get_sparse_columns'):
+            return None
+        columns = serializer_class.get_sparse_columns(self.request)
+        if columns is None:
+            return None
+
+        # 페이지네이션 커서 생성에 쓰이는 정렬 컬럼은 항상 조회
+        ordering = getattr(self.paginator, 'ordering', None) or ()
+        columns |= {'pk'} | {field.lstrip('-') for field in ordering}
+        return columns
+
+    def apply_query_plan(self, queryset):
+        """쿼리 플랜을 queryset에 적용"""
+        plan = self.get_query_plan()
+        select_related = plan.get('select_related', ())
+        only = plan.get('only', ())
+
+        columns = self.get_sparse_columns()
+        if columns is not None:
+            select_related = [path for path in select_related if path.split('__')[0] in columns]
+            only = sorted(columns)
+
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if plan.get('prefetch_related'):
+            queryset = queryset.prefetch_related(*plan['prefetch_related'])
+        if only:
+            queryset = queryset.only(*only)
+        return queryset
+
+
+class CompiledListMixin:
+    """
+    list 액션을 .values() + 컴파일된 필드 플랜(ValuesPlan)으로 직렬화하는 믹스인
+
+    모델 인스턴스 생성과 DRF 필드별 to_representation 호출을 건너뛰어
+    대량 목록 응답의 CPU 비용을 줄입니다. 출력은 기존 시리얼라이저와 동일합니다.
+    `compiled_list = False`로 두면 기존 ModelSerializer 경로를 사용합니다.
+    """
+    compiled_list = True
+
+    def list(self, request, *args, **kwargs):
+        if not self.compiled_list:
+            return super().list(request, *args, **kwargs)
+
+        serializer = self.get_serializer()
+        plan = ValuesPlan.for_serializer(serializer)
+
+        # 페이지네이션 커서 생성에 쓰이는 정렬 컬럼도 함께 조회
+        ordering = getattr(self.paginator, 'ordering', None) or ()
+        columns = list(plan.columns)
+        columns += [field.lstrip('-') for field in ordering if field.lstrip('-') not in columns]
+
+        queryset = self.filter_queryset(self.get_queryset()).values(*columns)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(plan.render(page, request))
+        return Response(plan.render(queryset, request))
+
+
+class ConditionalGetMixin:
+    """
+    retrieve/list 액션에 ETag / Last-Modified 조건부 GET을 지원하는 믹스인
+
+    검증자는 직렬화 없이 가벼운 조회로 만듭니다.
+    - retrieve: 해당 행의 conditional_fields (Last-Modified 포함)
+      중첩 시리얼라이저가 다른 모델을 읽는다면 해당 모델의 updated_at 경로도 추가합니다.
+    - list: 목록 캐시 세대 번호(CachedListMixin.get_list_cache_generations)가 있으면
+      DB 조회 없이 세대 번호로, 없으면 기본 테이블의 COUNT(*) + MAX(updated_at)로 만듭니다.
+      (관련 모델 변경은 세대 번호 증가로 반영, 삭제는 MAX로 드러나지 않으므로
+      목록에는 Last-Modified를 보내지 않음)
+
+    ETag에는 사용자, 쿼리 파라미터(페이지, fields 등), 응답 형식이 함께 반영되고,
+    클라이언트의 If-None-Match가 일치하면 직렬화 없이 304를 반환합니다.
+    """
+    conditional_fields = ('updated_at',)
+
+    def get_conditional_stats(self, queryset):
+        aggregates = {f'max_{i}': Max(field) for i, field in enumerate(self.conditional_fields)}
+        stats = queryset.order_by().aggregate(count=Count('pk'), **aggregates)
+        timestamps = [stats[f'max_{i}'] for i in range(len(self.conditional_fields))]
+        return stats['count'], timestamps
+
+    def get_list_validators(self):
+        generations = []
+        if hasattr(self, 'get_list_cache_generations'):
+            generations = self.get_list_cache_generations()
+        if generations:
+            return generations
+        queryset = self.filter_queryset(self.get_queryset())
+        stats = queryset.order_by().aggregate(count=Count('pk'), last_modified=Max('updated_at'))
+        return [stats['count'], stats['last_modified']]
+
+    def make_etag(self, *parts):
+        request = self.request
+        accepted = getattr(request, 'accepted_media_type', '')
+        key = '|'.join(str(part) for part in (
+            self.basename, self.action, request.user.pk, request.get_full_path(), accepted, *parts,
+        ))
+        return quote_etag(hashlib.md5(key.encode('utf-8')).hexdigest())
+
+    def conditional_response(self, request, etag, last_modified=None):
+        """조건이 맞으면 304/412 응답, 아니면 None"""
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        response = get_conditional_response(request._request, etag=etag, last_modified=timestamp)
+        if response is not None:
+            self.set_validators(response, etag, last_modified)
+        return response
+
+    def set_validators(self, response, etag, last_modified=None):
+        response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(int(last_modified.timestamp()))
+        # 사용자마다 응답이 다르므로 공유 캐시는 사용하지 않고 매번 재검증
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            queryset = self.filter_queryset(self.get_queryset()).filter(
+                **{self.lookup_field: kwargs[lookup_url_kwarg]}
+            )
+            count, timestamps = self.get_conditional_stats(queryset)
+        except (TypeError, ValueError, ValidationError):
+            # 숫자가 아닌 pk 등 잘못된 lookup 값: get_object()와 같이 404로 처리
+            count = 0
+        if not count:
+            return super().retrieve(request, *args, **kwargs)
+
+        last_modified = max(ts for ts in timestamps if ts is not None)
+        etag = self.make_etag(*timestamps)
+        response = self.conditional_response(request, etag, last_modified)
+        if response is not None:
+            return response
+        return self.set_validators(super().retrieve(request, *args, **kwargs), etag, last_modified)
+
+    def list(self, request, *args, **kwargs):
+        etag = self.make_etag(*self.get_list_validators())
+        response = self.conditional_response(request, etag)
+        if response is not None:
+            return response
+        return self.set_validators(super().list(request, *args, **kwargs), etag)
+
+
+class CachedListMixin:
+    """
+    사용자별 list 응답 캐시 믹스인 (CACHES 설정의 default 캐시 사용)
+
+    캐시 키는 사용자, user_type, 전체 URL(쿼리 파라미터/페이지 포함), 응답 형식과
+    ViewSet이 get_list_cache_generations()로 돌려주는 세대 번호로 구성됩니다.
+    데이터가 바뀌면 시그널에서 세대 번호를 올려 관련 캐시를 무효화합니다.
+    응답에는 X-Cache: HIT/MISS 헤더가 붙고, 적중률은 apps.core.cache.get_cache_metrics로 확인합니다.
+    """
+    list_cache_metrics_namespace = 'list_cache'
+
+    def get_list_cache_generations(self):
+        """캐시 키에 포함할 세대 번호 목록"""
+        return []
+
+    def get_list_cache_key(self):
+        request = self.request
+        user = request.user
+        raw = '|'.join(str(part) for part in (
+            request.build_absolute_uri(),
+            getattr(request, 'accepted_media_type', ''),
+            getattr(user, 'user_type', ''),
+        ))
+        generations = '.'.join(str(generation) for generation in self.get_list_cache_generations())
+        digest = hashlib.md5(raw.encode('utf-8')).hexdigest()
+        return f'list:{self.basename}:{user.pk}:{generations}:{digest}'
+
+    def list(self, request, *args, **kwargs):
+        key = self.get_list_cache_key()
+        data = cache.get(key)
+        if data is not None:
+            record_cache_result(self.list_cache_metrics_namespace, hit=True)
+            response = Response(data)
+            response['X-Cache'] = 'HIT'
+            return response
+
+        record_cache_result(self.list_cache_metrics_namespace, hit=False)
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, self.to_cacheable(response.data), getattr(settings, 'LIST_CACHE_TIMEOUT', 300))
+        response['X-Cache'] = 'MISS'
+        return response
+
+    def to_cacheable(self, data):
+        """시리얼라이저 참조를 가진 ReturnDict/ReturnList를 일반 컨테이너로 변환"""
+        if isinstance(data, ReturnList):
+            return list(data)
+        if isinstance(data, ReturnDict):
+            data = dict(data)
+        if isinstance(data, dict) and isinstance(data.get('results'), ReturnList):
+            data = data.copy()
+            data['results'] = list(data['results'])
+        return data
@@ -0,0 +1,162 @@
+import base64
+import json
+from collections import OrderedDict
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(PageNumberPagination):
+    """
+    기존 페이지 번호 방식과 키셋(커서) 방식을 함께 지원하는 페이지네이션
+
+    기본 동작은 PageNumberPagination과 동일합니다. `?pagination=cursor`를 주거나
+    `cursor` 파라미터가 있으면 (-created_at, id) 키셋 페이지네이션으로 동작하여
+    COUNT(*)와 OFFSET 없이 인덱스 범위 스캔으로 다음 페이지를 가져옵니다.
+
+    응답 형식 (키셋 모드):
+    {
+        "next": "...?cursor=<opaque>",
+        "previous": "...?cursor=<opaque>",
+        "results": [...]
+    }
+    """
+    mode_query_param = 'pagination'
+    cursor_query_param = 'cursor'
+    keyset_mode = 'cursor'
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    # 모델 Meta.ordering(-created_at)에 동률 처리를 위한 id를 더한 정렬
+    ordering = ('-created_at', 'id')
+    invalid_cursor_message = '유효하지 않은 커서입니다.'
+    keyset = False
+
+    def use_keyset(self, request):
+        """키셋 모드 요청인지 확인"""
+        return (
+            request.query_params.get(self.mode_query_param) == self.keyset_mode
+            or self.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = self.use_keyset(request)
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        position, reverse = self.decode_cursor(request)
+        time_field, id_field = self.ordering[0].lstrip('-'), self.ordering[1]
+
+        if reverse:
+            queryset = queryset.order_by(time_field, '-' + id_field)
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if position is not None:
+            created_at, pk = position
+            if reverse:
+                queryset = queryset.filter(
+                    Q(**{f'{time_field}__gt': created_at})
+                    | Q(**{time_field: created_at, f'{id_field}__lt': pk})
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(**{f'{time_field}__lt': created_at})
+                    | Q(**{time_field: created_at, f'{id_field}__gt': pk})
+                )
+
+        # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+
+        self.page_results = results
+        return results
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_next_link(self):
+        if not self.keyset:
+            return super().get_next_link()
+        if not self.has_next or not self.page_results:
+            return None
+        return self.build_link(self.page_results[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.keyset:
+            return super().get_previous_link()
+        if not self.has_previous or not self.page_results:
+            return None
+        return self.build_link(self.page_results[0], reverse=True)
+
+    def build_link(self, item, reverse):
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.mode_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(item, reverse))
+
+    def get_position(self, item):
+        """행에서 (created_at, id) 위치 추출 (모델 인스턴스와 dict 모두 지원)"""
+        time_field, id_field = self.ordering[0].lstrip('-'), self.ordering[1]
+        if isinstance(item, dict):
+            return item[time_field], item[id_field]
+        return getattr(item, time_field), getattr(item, id_field)
+
+    def encode_cursor(self, item, reverse):
+        created_at, pk = self.get_position(item)
+        payload = json.dumps([created_at.isoformat(), pk, int(reverse)], separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode('ascii')).decode('ascii').rstrip('=')
+
+    def decode_cursor(self, request):
+        """커서 문자열을 ((created_at, id), reverse)로 변환"""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            padded = encoded + '=' * (-len(encoded) % 4)
+            created_at, pk, reverse = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+            return (datetime.fromisoformat(created_at), int(pk)), bool(reverse)
+        except (TypeError, ValueError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_html_context(self):
+        if not self.keyset:
+            return super().get_html_context()
+        return {
+            'previous_url': self.get_previous_link(),
+            'next_url': self.get_next_link(),
+        }
+
+    def to_html(self):
+        if self.keyset:
+            self.template = 'rest_framework/pagination/previous_and_next.html'
+        return super().to_html()
+
+
+class RankedPagination(PageNumberPagination):
+    """검색 결과처럼 관련도 순 정렬을 유지해야 하는 목록용 페이지 번호 페이지네이션"""
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
@@ -0,0 +1,141 @@
+"""
+camelCase 요청 파서
+
+djangorestframework_camel_case의 파서와 같은 결과를 내지만,
+camelCase → snake_case 키 변환 결과를 캐시합니다.
+orjson이 설치되어 있으면 ORJSONCamelCaseParser가 orjson으로 디코딩합니다.
+"""
+import json
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.files import File
+from django.http import QueryDict
+from django.http.multipartparser import MultiPartParser as DjangoMultiPartParser, MultiPartParserError
+from django.utils.datastructures import MultiValueDict
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import camel_to_underscore, is_iterable
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import DataAndFiles, FormParser, MultiPartParser
+
+from .renderers import PRIMITIVE_TYPES, orjson
+
+
+@lru_cache(maxsize=4096)
+def underscore_key(key, no_underscore_before_number=False):
+    """camelCase 키를 snake_case로 변환 (결과 캐시)"""
+    return camel_to_underscore(key, no_underscore_before_number=no_underscore_before_number)
+
+
+def underscoreize(data, no_underscore_before_number=False, ignore_fields=None, ignore_keys=None, **options):
+    """djangorestframework_camel_case.util.underscoreize와 동일한 결과를 내는 변환 함수"""
+    return _underscoreize(data, bool(no_underscore_before_number), ignore_fields or (), ignore_keys or ())
+
+
+def _underscoreize(data, no_number, ignore_fields, ignore_keys):
+    if isinstance(data, PRIMITIVE_TYPES):
+        return data
+    if isinstance(data, dict):
+        if type(data) == MultiValueDict:
+            new_data = MultiValueDict()
+            for key in data:
+                new_data.setlist(underscore_key(key, no_number), data.getlist(key))
+            return new_data
+
+        new_dict = {}
+        items = data.lists() if isinstance(data, QueryDict) else data.items()
+        for key, value in items:
+            new_key = underscore_key(key, no_number) if isinstance(key, str) else key
+
+            if key not in ignore_fields and new_key not in ignore_fields:
+                result = _underscoreize(value, no_number, ignore_fields, ignore_keys)
+            else:
+                result = value
+            if key in ignore_keys or new_key in ignore_keys:
+                new_dict[key] = result
+            else:
+                new_dict[new_key] = result
+
+        if isinstance(data, QueryDict):
+            new_query = QueryDict(mutable=True)
+            for key, value in new_dict.items():
+                new_query.setlist(key, value)
+            return new_query
+        return new_dict
+    if is_iterable(data) and not isinstance(data, (str, File)):
+        return [_underscoreize(item, no_number, ignore_fields, ignore_keys) for item in data]
+    return data
+
+
+class CamelCaseJSONParser(api_settings.PARSER_CLASS):
+    """키 변환을 캐시하는 camelCase JSON 파서"""
+    json_underscoreize = api_settings.JSON_UNDERSCOREIZE
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        try:
+            data = stream.read().decode(encoding)
+            return underscoreize(json.loads(data), **self.json_underscoreize)
+        except ValueError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
+
+
+class ORJSONCamelCaseParser(CamelCaseJSONParser):
+    """
+    orjson 기반 camelCase JSON 파서
+
+    orjson이 없거나 orjson이 거부하는 입력(NaN, 64비트를 넘는 정수 등)은
+    표준 json으로 다시 파싱하므로 CamelCaseJSONParser와 같은 결과를 냅니다.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        try:
+            raw = stream.read()
+            if orjson is not None and encoding.lower().replace('-', '') == 'utf8':
+                try:
+                    data = orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    data = json.loads(raw.decode(encoding))
+            else:
+                data = json.loads(raw.decode(encoding))
+            return underscoreize(data, **self.json_underscoreize)
+        except ValueError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
+
+
+class CamelCaseFormParser(FormParser):
+    """키 변환을 캐시하는 form 파서"""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        return underscoreize(
+            super().parse(stream, media_type, parser_context),
+            **api_settings.JSON_UNDERSCOREIZE,
+        )
+
+
+class CamelCaseMultiPartParser(MultiPartParser):
+    """키 변환을 캐시하는 multipart 파서 (파일 업로드 포함)"""
+    media_type = 'multipart/form-data'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        request = parser_context['request']
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        meta = request.META.copy()
+        meta['CONTENT_TYPE'] = media_type
+        upload_handlers = request.upload_handlers
+
+        try:
+            parser = DjangoMultiPartParser(meta, stream, upload_handlers, encoding)
+            data, files = parser.parse()
+            return DataAndFiles(
+                underscoreize(data, **api_settings.JSON_UNDERSCOREIZE),
+                underscoreize(files, **api_settings.JSON_UNDERSCOREIZE),
+            )
+        except MultiPartParserError as exc:
+            raise ParseError('Multipart form parse error - %s' % str(exc))
@@ -0,0 +1,135 @@
+"""
+camelCase 응답 렌더러
+
+djangorestframework_camel_case의 렌더러와 같은 결과를 내지만, 키 변환 결과를
+캐시하고 이미 원시 타입인 값은 다시 순회하지 않습니다. 시리얼라이저가 만드는
+키 집합은 작고 고정되어 있으므로 대부분의 키 변환이 캐시에서 처리됩니다.
+
+orjson이 설치되어 있으면 ORJSONCamelCaseRenderer가 orjson으로 인코딩하고,
+없으면 표준 json 인코더로 동작합니다.
+"""
+import re
+from collections import OrderedDict
+from functools import lru_cache
+
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import camelize_re, is_iterable, underscore_to_camel
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.utils import encoders
+from rest_framework.utils.serializer_helpers import ReturnDict
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson은 선택 의존성
+    orjson = None
+
+# 다시 순회할 필요가 없는 값 타입
+PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
+
+@lru_cache(maxsize=4096)
+def camelize_key(key):
+    """snake_case 키를 camelCase로 변환 (결과 캐시)"""
+    if '_' not in key:
+        return key
+    return re.sub(camelize_re, underscore_to_camel, key)
+
+
+def camelize(data, ignore_fields=None, ignore_keys=None, **options):
+    """djangorestframework_camel_case.util.camelize와 동일한 결과를 내는 변환 함수"""
+    ignore_fields = ignore_fields or ()
+    ignore_keys = ignore_keys or ()
+    return _camelize(data, ignore_fields, ignore_keys)
+
+
+def _camelize(data, ignore_fields, ignore_keys):
+    if isinstance(data, PRIMITIVE_TYPES):
+        return data
+    if isinstance(data, Promise):
+        return force_str(data)
+    if isinstance(data, dict):
+        if isinstance(data, ReturnDict):
+            new_dict = ReturnDict(serializer=data.serializer)
+        else:
+            new_dict = OrderedDict()
+        for key, value in data.items():
+            if isinstance(key, Promise):
+                key = force_str(key)
+            new_key = camelize_key(key) if isinstance(key, str) else key
+
+            if isinstance(value, PRIMITIVE_TYPES) or key in ignore_fields or new_key in ignore_fields:
+                result = value
+            else:
+                result = _camelize(value, ignore_fields, ignore_keys)
+
+            if ignore_keys and (key in ignore_keys or new_key in ignore_keys):
+                new_dict[key] = result
+            else:
+                new_dict[new_key] = result
+        return new_dict
+    if isinstance(data, (list, tuple)) or (is_iterable(data) and not isinstance(data, str)):
+        return [_camelize(item, ignore_fields, ignore_keys) for item in data]
+    return data
+
+
+class CamelCaseJSONRenderer(api_settings.RENDERER_CLASS):
+    """키 변환을 캐시하는 camelCase JSON 렌더러"""
+    json_underscoreize = api_settings.JSON_UNDERSCOREIZE
+
+    def render(self, data, *args, **kwargs):
+        return super().render(camelize(data, **self.json_underscoreize), *args, **kwargs)
+
+
+class CamelCaseBrowsableAPIRenderer(BrowsableAPIRenderer):
+    """키 변환을 캐시하는 camelCase Browsable API 렌더러"""
+
+    def render(self, data, *args, **kwargs):
+        return super().render(camelize(data, **api_settings.JSON_UNDERSCOREIZE), *args, **kwargs)
+
+
+class ORJSONCamelCaseRenderer(CamelCaseJSONRenderer):
+    """
+    orjson 기반 camelCase JSON 렌더러
+
+    표준 json 렌더러(CamelCaseJSONRenderer)와 같은 JSON 값을 냅니다.
+    지수 표기가 필요 없는 값은 바이트 단위로도 같습니다.
+    - str/int/dict/list/UUID는 orjson이 직접 인코딩
+    - datetime/date/time, Decimal 등은 DRF JSONEncoder.default로 변환
+      (DRF와 같은 포맷: UTC는 'Z' 접미사, Decimal은 float)
+    - 들여쓰기 요청, ensure_ascii/비압축 설정 등 orjson이 같은 출력을 보장할 수 없는
+      경우와 orjson이 설치되지 않은 경우에는 표준 json 렌더러로 처리
+    - 단, NaN/Infinity는 표준 렌더러처럼 오류를 내지 않고 null로 인코딩됨
+    - float(Decimal 포함)의 지수 표기는 orjson 형식을 따름
+      (예: 1e16 -> 표준 '1e+16' / orjson '1e16', 0.00001 -> 표준 '1e-05' / orjson '0.00001')
+      파싱하면 같은 값이므로 클라이언트 결과는 같고 바이트만 다름
+    """
+    orjson_options = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME if orjson is not None else 0
+    )
+    orjson_default = staticmethod(encoders.JSONEncoder().default)
+
+    def can_use_orjson(self, accepted_media_type, renderer_context):
+        return (
+            orjson is not None
+            and self.ensure_ascii is False
+            and self.compact
+            and not self.get_indent(accepted_media_type, renderer_context or {})
+        )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None or not self.can_use_orjson(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        data = camelize(data, **self.json_underscoreize)
+        try:
+            ret = orjson.dumps(data, default=self.orjson_default, option=self.orjson_options)
+        except TypeError:
+            # 64비트를 넘는 정수 등 orjson이 처리하지 못하는 값 (이미 camelize됨)
+            return super(CamelCaseJSONRenderer, self).render(data, accepted_media_type, renderer_context)
+
+        # JSONRenderer와 동일하게 U+2028/U+2029를 이스케이프
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
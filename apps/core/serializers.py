@@ -0,0 +1,206 @@
+import copy
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from djangorestframework_camel_case.util import camel_to_underscore
+from rest_framework import serializers
+
+
+def split_field_names(value):
+    """쉼표로 구분된 필드 목록을 snake_case 이름 집합으로 변환"""
+    if not value:
+        return set()
+    return {camel_to_underscore(name.strip()) for name in value.split(',') if name.strip()}
+
+
+class SparseFieldsetMixin:
+    """
+    `?fields=` / `?omit=` 쿼리 파라미터로 응답 필드를 줄이는 시리얼라이저 믹스인
+
+    GET 요청에서만 동작하며, camelCase 필드명(예: designerInfo)도 받습니다.
+    ViewSet은 get_sparse_columns()로 실제 필요한 모델 컬럼만 .only()로 조회합니다.
+
+    예시:
+        GET /api/manufacturing/products/?fields=id,name,imageUrl
+        GET /api/manufacturing/products/?omit=concept,detail,memo
+    """
+    fields_query_param = 'fields'
+    omit_query_param = 'omit'
+    # 시리얼라이저 필드명과 모델 컬럼이 다른 경우의 매핑
+    sparse_field_sources = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        names = self.get_sparse_field_names(self.context.get('request'))
+        if names is not None:
+            for name in set(self.fields) - names:
+                self.fields.pop(name)
+
+    @classmethod
+    def get_sparse_field_names(cls, request):
+        """요청에 포함할 필드명 집합 반환 (필드 제한이 없으면 None)"""
+        if request is None or request.method not in ('GET', 'HEAD'):
+            return None
+        fields = split_field_names(request.query_params.get(cls.fields_query_param))
+        omit = split_field_names(request.query_params.get(cls.omit_query_param))
+        if not fields and not omit:
+            return None
+
+        names = set(cls.Meta.fields)
+        if fields:
+            names &= fields
+        return names - omit
+
+    @classmethod
+    def get_sparse_columns(cls, request):
+        """요청된 필드를 만드는 데 필요한 모델 컬럼 집합 반환 (제한이 없으면 None)"""
+        names = cls.get_sparse_field_names(request)
+        if names is None:
+            return None
+
+        model_fields = {field.name for field in cls.Meta.model._meta.concrete_fields}
+        columns = set()
+        for name in names:
+            if name in cls.sparse_field_sources:
+                columns.update(cls.sparse_field_sources[name])
+            elif name in model_fields:
+                columns.add(name)
+        return columns
+
+
+class ValuesPlan:
+    """
+    읽기 전용 시리얼라이저를 .values() 행 → dict 변환 단계로 컴파일한 결과
+
+    ModelSerializer의 필드별 get_attribute/to_representation 호출 대신, 필드 구성을
+    한 번만 분석해 (출력 키, values 컬럼, 변환 함수) 목록으로 만들어 두고 행마다
+    그대로 적용합니다. 출력은 원래 시리얼라이저와 동일해야 합니다.
+
+    지원하는 필드:
+    - 모델 필드에서 생성된 일반 필드, PrimaryKeyRelatedField, 점(.) 표기 source
+    - FileField/ImageField 및 시리얼라이저의 `file_url_fields`에 선언된 URL 메서드 필드
+    - 중첩 시리얼라이저 (many=False)
+    """
+    # 변환 없이 DB 값을 그대로 출력해도 되는 필드 타입
+    IDENTITY_FIELDS = (
+        serializers.CharField,
+        serializers.IntegerField,
+        serializers.BooleanField,
+        serializers.ChoiceField,
+        serializers.JSONField,
+        serializers.ReadOnlyField,
+        serializers.PrimaryKeyRelatedField,
+    )
+
+    FIELD = 'field'
+    FILE = 'file'
+    NESTED = 'nested'
+
+    # (시리얼라이저 클래스, 필드 이름 집합) -> 컴파일 결과 (LRU, VALUES_PLAN_CACHE_SIZE개까지)
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    def __init__(self, serializer, prefix=''):
+        self.steps = []
+        self.columns = []
+        self.compile(serializer, prefix)
+
+    @classmethod
+    def for_serializer(cls, serializer):
+        """
+        시리얼라이저 클래스와 (sparse 적용 후) 필드 구성별로 컴파일 결과 캐시
+
+        필드 순서는 시리얼라이저 선언 순서로 정해지므로 키는 필드 이름 집합만 사용합니다.
+        ?fields=/?omit= 조합은 클라이언트가 정하므로 최근 사용한 것만 유지합니다.
+        """
+        key = (type(serializer), frozenset(serializer.fields))
+        with cls._cache_lock:
+            plan = cls._cache.get(key)
+            if plan is not None:
+                cls._cache.move_to_end(key)
+                return plan
+
+        plan = cls(serializer)
+        with cls._cache_lock:
+            cls._cache[key] = plan
+            while len(cls._cache) > getattr(settings, 'VALUES_PLAN_CACHE_SIZE', 256):
+                cls._cache.popitem(last=False)
+        return plan
+
+    def add_column(self, column):
+        if column not in self.columns:
+            self.columns.append(column)
+        return column
+
+    def compile(self, serializer, prefix):
+        model = serializer.Meta.model
+        file_url_fields = getattr(serializer, 'file_url_fields', {})
+
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+
+            if name in file_url_fields:
+                source = file_url_fields[name]
+                storage = model._meta.get_field(source).storage
+                column = self.add_column(prefix + source)
+                self.steps.append((name, self.FILE, column, storage))
+                continue
+
+            if isinstance(field, serializers.SerializerMethodField):
+                raise ImproperlyConfigured(
+                    f'{type(serializer).__name__}.{name}: 컴파일할 수 없는 SerializerMethodField입니다. '
+                    f'file_url_fields에 선언하거나 컴파일 모드를 사용하지 마세요.'
+                )
+
+            column = prefix + field.source.replace('.', '__')
+
+            if isinstance(field, serializers.BaseSerializer):
+                if isinstance(field, serializers.ListSerializer):
+                    raise ImproperlyConfigured(
+                        f'{type(serializer).__name__}.{name}: many=True 중첩 시리얼라이저는 지원하지 않습니다.'
+                    )
+                # FK 컬럼이 NULL이면 중첩 객체도 None
+                self.add_column(column)
+                nested = ValuesPlan(field, prefix=column + '__')
+                for nested_column in nested.columns:
+                    self.add_column(nested_column)
+                self.steps.append((name, self.NESTED, column, nested))
+                continue
+
+            if isinstance(field, serializers.FileField):
+                storage = model._meta.get_field(field.source).storage
+                self.add_column(column)
+                self.steps.append((name, self.FILE, column, storage))
+                continue
+
+            converter = None
+            if not isinstance(field, self.IDENTITY_FIELDS):
+                # 요청마다 만들어지는 필드(부모 시리얼라이저, context, request 참조)를 캐시에 남기지
+                # 않도록 같은 인자로 만든 바인딩되지 않은 복사본의 변환 함수를 보관
+                converter = copy.deepcopy(field).to_representation
+            self.add_column(column)
+            self.steps.append((name, self.FIELD, column, converter))
+
+    def render_row(self, row, request=None):
+        data = OrderedDict()
+        for name, kind, column, extra in self.steps:
+            value = row[column]
+            if value is None:
+                data[name] = None
+            elif kind == self.FIELD:
+                data[name] = value if extra is None else extra(value)
+            elif kind == self.FILE:
+                if not value:
+                    data[name] = None
+                else:
+                    url = extra.url(value)
+                    data[name] = request.build_absolute_uri(url) if request is not None else url
+            else:
+                data[name] = extra.render_row(row, request)
+        return data
+
+    def render(self, rows, request=None):
+        return [self.render_row(row, request) for row in rows]
@@ -0,0 +1,134 @@
+import logging
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.http import QueryDict
+from django.test import SimpleTestCase
+
+from apps.core.logging import LazyPayload, QueueLogHandler, RateLimitFilter, SamplingFilter
+
+
+class ListHandler(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def make_record(name='apps.accounts.authentication', level=logging.DEBUG, msg='message', args=()):
+    return logging.LogRecord(name, level, __file__, 0, msg, args, None)
+
+
+class QueueLogHandlerTest(SimpleTestCase):
+    def setUp(self):
+        self.target = ListHandler(logging.INFO)
+        self.handler = QueueLogHandler(handlers=[self.target])
+        self.logger = logging.getLogger('apps.tests.queue')
+        self.logger.addHandler(self.handler)
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.addCleanup(self.handler.close)
+        self.addCleanup(self.logger.removeHandler, self.handler)
+
+    def test_records_written_by_listener_thread(self):
+        self.logger.info('주문 %s 생성', 'ORD-1')
+        self.handler.stop()
+
+        self.assertEqual([record.getMessage() for record in self.target.records], ['주문 ORD-1 생성'])
+
+    def test_target_handler_level_respected(self):
+        self.logger.debug('debug')
+        self.logger.warning('warning')
+        self.handler.stop()
+
+        self.assertEqual([record.getMessage() for record in self.target.records], ['warning'])
+
+    def test_full_queue_drops_without_blocking(self):
+        handler = QueueLogHandler(handlers=[self.target], queue_size=1)
+        self.addCleanup(handler.close)
+        with mock.patch.object(handler, 'start'):
+            handler.listener_pid = None
+            handler.emit(make_record(level=logging.INFO))
+            handler.emit(make_record(level=logging.INFO))
+
+        self.assertEqual(handler.dropped, 1)
+
+    def test_unknown_handler_name(self):
+        with self.assertRaises(ValueError):
+            QueueLogHandler(handlers=['missing-handler'])
+
+
+class SamplingFilterTest(SimpleTestCase):
+    def test_most_specific_prefix_rate(self):
+        sampling = SamplingFilter(rates={'apps': 1, 'apps.accounts': 0})
+
+        self.assertFalse(sampling.filter(make_record('apps.accounts.authentication')))
+        self.assertTrue(sampling.filter(make_record('apps.manufacturing.views')))
+        self.assertTrue(sampling.filter(make_record('django.request')))
+
+    def test_partial_rate(self):
+        sampling = SamplingFilter(rates={'apps.accounts': 0.25})
+
+        with mock.patch('apps.core.logging.random.random', side_effect=[0.1, 0.5]):
+            self.assertTrue(sampling.filter(make_record()))
+            self.assertFalse(sampling.filter(make_record()))
+
+    def test_warnings_never_sampled(self):
+        sampling = SamplingFilter(rates={'apps.accounts': 0})
+
+        self.assertTrue(sampling.filter(make_record(level=logging.WARNING)))
+
+
+class RateLimitFilterTest(SimpleTestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.limit = RateLimitFilter(limits={'apps': 2}, clock=lambda: self.now)
+
+    def test_limits_records_per_second(self):
+        results = [self.limit.filter(make_record()) for _ in range(4)]
+        self.assertEqual(results, [True, True, False, False])
+
+        self.now = 1.0
+        record = make_record()
+        self.assertTrue(self.limit.filter(record))
+        self.assertEqual(record.suppressed, 2)
+
+    def test_other_loggers_and_errors_not_limited(self):
+        for _ in range(5):
+            self.assertTrue(self.limit.filter(make_record('django.request')))
+        for _ in range(5):
+            self.assertTrue(self.limit.filter(make_record(level=logging.ERROR)))
+
+
+class LazyPayloadTest(SimpleTestCase):
+    def test_not_rendered_when_record_filtered(self):
+        logger = logging.getLogger('apps.tests.lazy')
+        logger.setLevel(logging.INFO)
+        self.addCleanup(logger.setLevel, logging.NOTSET)
+
+        with mock.patch.object(LazyPayload, 'summarize') as summarize:
+            logger.debug('data: %s', LazyPayload({'name': '셔츠'}))
+
+        summarize.assert_not_called()
+
+    def test_files_and_long_values_summarized(self):
+        data = QueryDict(mutable=True)
+        data.update({'name': '린넨 셔츠', 'detail': 'x' * 300})
+        data.setlist('size', ['S', 'M'])
+        data['image'] = SimpleUploadedFile('shirt.png', b'0' * 2048, content_type='image/png')
+
+        text = str(LazyPayload(data))
+
+        self.assertIn("'name': '린넨 셔츠'", text)
+        self.assertIn("'size': ['S', 'M']", text)
+        self.assertIn('<file shirt.png (2048 bytes)>', text)
+        self.assertIn('...(+200)', text)
+        self.assertNotIn('x' * 101, text)
+
+    def test_total_length_limited(self):
+        text = str(LazyPayload(list(range(1000)), max_length=50))
+
+        self.assertTrue(text.startswith('[0, 1, 2'))
+        self.assertLess(len(text), 70)
@@ -0,0 +1,143 @@
+import datetime
+import io
+import json
+import uuid
+from collections import OrderedDict
+from decimal import Decimal
+from unittest import mock, skipUnless
+
+from django.http import QueryDict
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy as _
+from djangorestframework_camel_case import util as camel_util
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer as LibraryRenderer
+
+from apps.core.parsers import CamelCaseJSONParser, ORJSONCamelCaseParser, underscoreize
+from apps.core.renderers import CamelCaseJSONRenderer, ORJSONCamelCaseRenderer, camelize, orjson
+
+
+def sample_payload():
+    """주문 목록 응답과 비슷한 구조의 테스트 데이터"""
+    return OrderedDict([
+        ('count', 1),
+        ('next', None),
+        ('results', [OrderedDict([
+            ('order_id', 'ORD-1'),
+            ('unit_price', '15000.00'),
+            ('created_at', datetime.datetime(2026, 1, 1, 9, 0)),
+            ('total_price', Decimal('150000.00')),
+            ('product_info', OrderedDict([
+                ('designer_name', '디자이너'),
+                ('image_url', None),
+                ('fabric', {'fabric_type': 'cotton', 'yarn_count_2': '30수', 'tags': ['a_b', {'x_y': 1}]}),
+            ])),
+            (_('lazy_key'), _('lazy_value')),
+            (1, 'int_key'),
+            ('is_active', True),
+            ('size_2xl', 'value_1'),
+            ('tuple_value', ('a_b', {'c_d': 2})),
+        ])]),
+    ])
+
+
+class CamelizeParityTest(SimpleTestCase):
+    """라이브러리 camelize/underscoreize와 같은 결과인지 확인"""
+
+    def test_camelize_matches_library(self):
+        self.assertEqual(camelize(sample_payload()), camel_util.camelize(sample_payload()))
+
+    def test_camelize_ignore_options(self):
+        options = {'ignore_fields': ('product_info',), 'ignore_keys': ('order_id',)}
+        self.assertEqual(
+            camelize(sample_payload(), **options),
+            camel_util.camelize(sample_payload(), **options),
+        )
+
+    def test_underscoreize_matches_library(self):
+        data = {'orderId': 'a', 'productInfo': {'designerName': 'b', 'size2Xl': [{'fieldA1': 1}]}, 'HTTPStatus': 2}
+        for options in ({}, {'no_underscore_before_number': True}, {'ignore_fields': ('productInfo',)}):
+            self.assertEqual(underscoreize(data, **options), camel_util.underscoreize(data, **options))
+
+    def test_underscoreize_querydict(self):
+        query = QueryDict('orderId=1&orderId=2&customerName=kim')
+        result = underscoreize(query)
+        expected = camel_util.underscoreize(query)
+        self.assertEqual(dict(result.lists()), dict(expected.lists()))
+
+    def test_renderer_bytes_match_library(self):
+        self.assertEqual(
+            CamelCaseJSONRenderer().render(sample_payload()),
+            LibraryRenderer().render(sample_payload()),
+        )
+
+
+def typed_payload():
+    """DRF 인코더가 변환하는 타입을 포함한 테스트 데이터"""
+    seoul = datetime.timezone(datetime.timedelta(hours=9))
+    return OrderedDict([
+        ('unit_price', Decimal('15000.00')),
+        ('shipping_cost', Decimal('3000.5')),
+        ('created_at', datetime.datetime(2026, 1, 1, 9, 0, 0, 123456, tzinfo=seoul)),
+        ('updated_at', datetime.datetime(2026, 1, 1, 0, 0, tzinfo=datetime.timezone.utc)),
+        ('naive_at', datetime.datetime(2026, 1, 1, 9, 30)),
+        ('due_date', datetime.date(2026, 12, 1)),
+        ('pickup_time', datetime.time(13, 5, 7)),
+        ('token_id', uuid.UUID('12345678-1234-5678-1234-567812345678')),
+        ('memo', '줄 바꿈 "따옴표" \\ 역슬래시 \t탭 😀'),
+        ('ratio', 0.1),
+        ('numbers', [1, -2, 3.5, 10 ** 12, True, None]),
+        (3, 'int_key'),
+        ('lazy', _('lazy_value')),
+    ])
+
+
+@skipUnless(orjson, 'orjson이 설치되지 않음')
+class ORJSONRendererTest(SimpleTestCase):
+    """orjson 렌더러/파서가 표준 json 경로와 같은 결과를 내는지 확인"""
+
+    def test_render_matches_stdlib_bytes(self):
+        # 지수 표기가 필요 없는 값은 바이트 단위로 같음
+        for payload in (typed_payload(), sample_payload(), [], {}, 'text', 1):
+            self.assertEqual(
+                ORJSONCamelCaseRenderer().render(payload),
+                CamelCaseJSONRenderer().render(payload),
+            )
+
+    def test_float_exponent_format_differs_from_stdlib(self):
+        # 지수 표기 형식만 다르고 JSON 값은 같음 (렌더러 docstring 참고)
+        payload = {'total_revenue': Decimal('1E+16'), 'progress_rate': 0.00001}
+        rendered = ORJSONCamelCaseRenderer().render(payload)
+        stdlib = CamelCaseJSONRenderer().render(payload)
+
+        self.assertEqual(rendered, b'{"totalRevenue":1e16,"progressRate":0.00001}')
+        self.assertEqual(stdlib, b'{"totalRevenue":1e+16,"progressRate":1e-05}')
+        self.assertEqual(json.loads(rendered), json.loads(stdlib))
+
+    def test_indent_falls_back_to_stdlib(self):
+        context = {'indent': 4}
+        self.assertEqual(
+            ORJSONCamelCaseRenderer().render(typed_payload(), renderer_context=context),
+            CamelCaseJSONRenderer().render(typed_payload(), renderer_context=context),
+        )
+
+    def test_big_int_falls_back_to_stdlib(self):
+        payload = {'big_value': 2 ** 70}
+        self.assertEqual(
+            ORJSONCamelCaseRenderer().render(payload),
+            CamelCaseJSONRenderer().render(payload),
+        )
+
+    def test_render_without_orjson(self):
+        with mock.patch('apps.core.renderers.orjson', None):
+            self.assertEqual(
+                ORJSONCamelCaseRenderer().render(typed_payload()),
+                CamelCaseJSONRenderer().render(typed_payload()),
+            )
+
+    def test_parse_matches_stdlib(self):
+        body = json.dumps({'orderId': 'ORD-1', 'unitPrice': '1.50', 'items': [{'productId': 1}],
+                           'memo': '메모', 'big': 2 ** 70}).encode()
+        self.assertEqual(
+            ORJSONCamelCaseParser().parse(io.BytesIO(body)),
+            CamelCaseJSONParser().parse(io.BytesIO(body)),
+        )
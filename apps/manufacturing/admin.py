@@ -1,12 +1,23 @@
-from django.contrib import admin
-from .models import Product, Order
+import re
+
+from django.contrib import admin, messages
+from rest_framework import serializers
+
+from apps.core.admin import EstimatedCountPaginator, TrigramSearchMixin
+from .models import Product, Order, ProductionStage
+from .services import OrderService
 
 @admin.register(Product)
-class ProductAdmin(admin.ModelAdmin):
+class ProductAdmin(TrigramSearchMixin, admin.ModelAdmin):
     list_display = ('name', 'designer', 'season', 'target', 'created_at')
     list_filter = ('season', 'target', 'created_at')
     search_fields = ('name', 'designer__name', 'designer__user_id')
     readonly_fields = ('created_at', 'updated_at')
+    # 대용량 테이블 대응: designer 컬럼(__str__) JOIN, 드롭다운 대신 자동완성, 예상 건수 사용
+    list_select_related = ('designer',)
+    autocomplete_fields = ('designer',)
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     
     fieldsets = (
         ('기본 정보', {
@@ -26,16 +37,32 @@ class ProductAdmin(admin.ModelAdmin):
         }),
     )
 
+class ProductionStageInline(admin.TabularInline):
+    model = ProductionStage
+    extra = 0
+    fields = ('phase', 'stage_index', 'status', 'end_date', 'delivery_code')
+
+
 @admin.register(Order)
-class OrderAdmin(admin.ModelAdmin):
+class OrderAdmin(TrigramSearchMixin, admin.ModelAdmin):
+    inlines = [ProductionStageInline]
     list_display = ('order_id', 'product', 'status', 'quantity', 'total_price', 'created_at')
     list_filter = ('status', 'created_at')
     search_fields = ('order_id', 'product__name')
+    # product 컬럼의 __str__이 product.designer.name까지 읽음
+    list_select_related = ('product__designer',)
+    autocomplete_fields = ('product', 'factory')
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+    actions = ['mark_confirmed', 'mark_in_production', 'mark_completed', 'mark_cancelled']
+    # 주문 번호 전체를 입력하면 유니크 인덱스로 바로 조회
+    exact_search_fields = ('order_id',)
+    exact_search_pattern = re.compile(r'^ORD-\d{8}-[0-9A-Fa-f]{8}$')
     readonly_fields = ('order_id', 'total_price', 'created_at', 'updated_at')
     
     fieldsets = (
         ('주문 정보', {
-            'fields': ('order_id', 'product', 'status', 'quantity')
+            'fields': ('order_id', 'product', 'factory', 'status', 'quantity')
         }),
         ('가격 정보', {
             'fields': ('unit_price', 'total_price')
@@ -46,4 +73,36 @@ class OrderAdmin(admin.ModelAdmin):
         ('시스템 정보', {
             'fields': ('created_at', 'updated_at')
         }),
-    )
\ No newline at end of file
+    )
+
+    def transition(self, request, queryset, status):
+        """선택한 주문 상태 일괄 변경 (허용되지 않는 상태 전이는 건너뜀)"""
+        try:
+            result = OrderService.bulk_transition_status(list(queryset.values_list('pk', flat=True)), status)
+        except serializers.ValidationError as e:
+            self.message_user(request, ' '.join(str(detail) for detail in e.detail), messages.ERROR)
+            return
+        skipped = len(result['results']) - result['updated']
+        label = dict(Order.STATUS_CHOICES)[status]
+        self.message_user(request, f"{result['updated']}건을 '{label}' 상태로 변경했습니다.", messages.SUCCESS)
+        if skipped:
+            self.message_user(
+                request, f"{skipped}건은 현재 상태에서 '{label}'(으)로 변경할 수 없어 건너뛰었습니다.", messages.WARNING
+            )
+
+    @admin.action(description='선택한 주문을 확인됨으로 변경')
+    def mark_confirmed(self, request, queryset):
+        self.transition(request, queryset, 'confirmed')
+
+    @admin.action(description='선택한 주문을 생산중으로 변경')
+    def mark_in_production(self, request, queryset):
+        self.transition(request, queryset, 'in_production')
+
+    @admin.action(description='선택한 주문을 완료로 변경')
+    def mark_completed(self, request, queryset):
+        self.transition(request, queryset, 'completed')
+
+    @admin.action(description='선택한 주문을 취소됨으로 변경')
+    def mark_cancelled(self, request, queryset):
+        self.transition(request, queryset, 'cancelled')
+
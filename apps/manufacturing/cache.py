@@ -0,0 +1,48 @@
+"""
+manufacturing 목록 응답 캐시의 세대 범위
+
+- 디자이너: 자신의 제품/주문만 보므로 'designer:<id>' 범위
+- 공장주: 전체 제품/주문을 보므로 'all' 범위
+
+제품/주문이 바뀌면 해당 디자이너 범위와 'all' 범위의 세대 번호만 올리므로
+다른 디자이너의 캐시는 유지됩니다.
+"""
+from django.db import transaction
+
+from apps.core.cache import bump_generations, get_generations
+
+PRODUCT_NAMESPACE = 'mfg:product'
+ORDER_NAMESPACE = 'mfg:order'
+ALL_SCOPE = 'all'
+
+
+def designer_scope(designer_id):
+    return f'designer:{designer_id}'
+
+
+def user_scope(user):
+    """사용자가 보는 목록의 캐시 범위"""
+    if getattr(user, 'user_type', None) == 'designer':
+        return designer_scope(user.pk)
+    return ALL_SCOPE
+
+
+def get_list_generations(namespace, user):
+    return get_generations(namespace, [user_scope(user)])
+
+
+def invalidate_lists(namespaces, designer_ids):
+    """
+    디자이너들의 목록과 전체 목록 캐시 무효화
+
+    트랜잭션 안에서 호출하면 즉시 한 번, 커밋 후에 한 번 더 올립니다.
+    (커밋 전에 다른 요청이 이전 행을 새 세대 번호로 캐시한 경우까지 무효화)
+    """
+    scopes = [ALL_SCOPE] + [designer_scope(designer_id) for designer_id in designer_ids if designer_id]
+
+    def bump():
+        for namespace in namespaces:
+            bump_generations(namespace, scopes)
+    bump()
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(bump)
@@ -0,0 +1,103 @@
+"""
+manufacturing 목록 필터
+
+제품의 원단(fabric)/부자재(material) JSON 속성으로 제품을 찾는 필터입니다.
+PostgreSQL에서는 products.fabric / products.material의 jsonb_path_ops GIN 인덱스를 사용합니다.
+
+쿼리 형태와 인덱스 사용 여부 (PostgreSQL):
+    ?fabric={"type": "cotton", "count": "30수"}     포함(@>) 검색       -> 인덱스 사용
+    ?fabric_attr=type:cotton,count:30수             키=값 목록, 포함(@>)으로 변환 -> 인덱스 사용
+    ?material={"zipper": "YKK"}&fabric_attr=type:cotton  조건마다 인덱스 사용 후 AND
+    ?fabric_has_key=stretch                         키 존재(?) 검색     -> 인덱스 미사용
+      (jsonb_path_ops는 ? 연산자를 지원하지 않으므로 다른 조건과 함께 쓰는 것을 권장)
+
+예) "30수 면 원단에 YKK 지퍼를 쓰는 제품":
+    GET /api/manufacturing/products/?fabric_attr=type:cotton,count:30수&material_attr=zipper:YKK
+
+그 외 DB(로컬 테스트용 SQLite)는 JSON 포함 연산을 지원하지 않으므로 키 경로별 값 비교
+(fabric__type='cotton' AND ...)로 대체합니다. 이 경우 목록(list) 값은 포함이 아니라
+완전히 같은 목록일 때만 일치합니다.
+"""
+import django_filters
+from django import forms
+from django.db import connections
+from django.db.models import Q
+
+from .models import Product
+
+
+class JSONObjectField(forms.JSONField):
+    """JSON 객체(dict)만 허용하는 폼 필드"""
+    default_error_messages = {
+        'not_object': 'JSON 객체 형식이어야 합니다. 예) {"type": "cotton"}',
+    }
+
+    def to_python(self, value):
+        value = super().to_python(value)
+        if value is not None and not isinstance(value, dict):
+            raise forms.ValidationError(self.error_messages['not_object'], code='not_object')
+        return value
+
+
+class AttributeListField(forms.CharField):
+    """'key:value,key:value' 문자열을 dict로 변환하는 폼 필드 (값은 문자열)"""
+    default_error_messages = {
+        'invalid_pair': "'키:값' 형식이어야 합니다: %(pair)s",
+    }
+
+    def to_python(self, value):
+        value = super().to_python(value)
+        if not value:
+            return None
+        attributes = {}
+        for pair in value.split(','):
+            key, sep, item = pair.partition(':')
+            if not sep or not key.strip():
+                raise forms.ValidationError(
+                    self.error_messages['invalid_pair'], code='invalid_pair', params={'pair': pair}
+                )
+            attributes[key.strip()] = item.strip()
+        return attributes
+
+
+def flatten_containment(value, prefix):
+    """{'a': {'b': 1}} -> {'<prefix>__a__b': 1} (포함 연산 대체용 키 경로 조건)"""
+    lookups = {}
+    for key, item in value.items():
+        path = f'{prefix}__{key}'
+        if isinstance(item, dict) and item:
+            lookups.update(flatten_containment(item, path))
+        else:
+            lookups[path] = item
+    return lookups
+
+
+class JSONContainsFilter(django_filters.Filter):
+    """JSON 포함(@>) 필터 (PostgreSQL 외 DB에서는 키 경로별 값 비교로 대체)"""
+    field_class = JSONObjectField
+
+    def filter(self, qs, value):
+        if not value:
+            return qs
+        if connections[qs.db].vendor == 'postgresql':
+            return qs.filter(**{f'{self.field_name}__contains': value})
+        return qs.filter(Q(**flatten_containment(value, self.field_name)))
+
+
+class JSONAttributeFilter(JSONContainsFilter):
+    """'key:value,...' 형식의 키/값 목록을 JSON 포함 조건으로 변환하는 필터"""
+    field_class = AttributeListField
+
+
+class ProductFilter(django_filters.FilterSet):
+    """제품 원단/부자재 속성 필터"""
+    fabric = JSONContainsFilter(field_name='fabric')
+    material = JSONContainsFilter(field_name='material')
+    fabric_attr = JSONAttributeFilter(field_name='fabric')
+    material_attr = JSONAttributeFilter(field_name='material')
+    fabric_has_key = django_filters.CharFilter(field_name='fabric', lookup_expr='has_key')
+    material_has_key = django_filters.CharFilter(field_name='material', lookup_expr='has_key')
+
+    class Meta:
+        model = Product
+        fields = []
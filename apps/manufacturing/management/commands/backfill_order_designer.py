@@ -0,0 +1,58 @@
+"""
+주문의 비정규화 컬럼(designer_id)을 제품의 디자이너로 채우는 명령
+
+운영 테이블에서 긴 잠금을 피하기 위해 id 범위 단위로 나누어 갱신합니다.
+
+사용법:
+    python manage.py backfill_order_designer --batch-size 5000
+    python manage.py backfill_order_designer --all  # 이미 채워진 행도 재동기화
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F, OuterRef, Q, Subquery
+
+from apps.manufacturing.models import Product, Order
+
+
+class Command(BaseCommand):
+    help = '주문의 designer_id를 제품 디자이너 기준으로 배치 단위로 채웁니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='배치당 처리할 주문 수')
+        parser.add_argument('--sleep', type=float, default=0.0, help='배치 사이 대기 시간(초)')
+        parser.add_argument('--all', action='store_true', help='designer_id가 채워진 주문도 재동기화')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        designer_subquery = Subquery(
+            Product.objects.filter(pk=OuterRef('product_id')).values('designer_id')[:1]
+        )
+
+        queryset = Order.objects.all()
+        if not options['all']:
+            queryset = queryset.filter(Q(designer__isnull=True) | ~Q(designer_id=F('product__designer_id')))
+
+        last_id = 0
+        total = 0
+        while True:
+            ids = list(
+                queryset.filter(pk__gt=last_id)
+                .order_by('pk')
+                .values_list('pk', flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+
+            with transaction.atomic():
+                updated = Order.objects.filter(pk__in=ids).update(designer_id=designer_subquery)
+
+            total += updated
+            last_id = ids[-1]
+            self.stdout.write(f'  ~{last_id}: {updated}건 갱신 (누적 {total}건)')
+
+            if options['sleep']:
+                time.sleep(options['sleep'])
+
+        self.stdout.write(self.style.SUCCESS(f'주문 디자이너 백필 완료: {total}건'))
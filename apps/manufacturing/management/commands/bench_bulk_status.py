@@ -0,0 +1,82 @@
+"""
+주문 상태 일괄 변경 벤치마크: 주문별 save() vs 단일 조건부 UPDATE
+
+벤치마크용 데이터는 트랜잭션 안에서 생성 후 롤백되므로 DB에 남지 않습니다.
+
+사용법:
+    python manage.py bench_bulk_status
+    python manage.py bench_bulk_status --sizes 1000 10000 --skip-per-row
+"""
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import connection, reset_queries, transaction
+from django.test.utils import CaptureQueriesContext
+
+from apps.accounts.models import User
+from apps.manufacturing.models import Product, Order
+from apps.manufacturing.services import OrderService
+
+
+class Command(BaseCommand):
+    help = '주문 상태 일괄 변경 API의 서비스 로직을 주문별 save()와 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000], help='측정할 주문 건수')
+        parser.add_argument('--skip-per-row', action='store_true', help='주문별 save() 측정 생략')
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{'orders':>8}{'per-row(ms)':>14}{'bulk(ms)':>11}{'queries':>9}{'speedup':>9}")
+        for size in sorted(options['sizes']):
+            per_row = None
+            if not options['skip_per_row']:
+                per_row = self.run(size, self.per_row)[0]
+            bulk, queries = self.run(size, self.bulk)
+
+            per_row_text = f'{per_row * 1000:>14.1f}' if per_row is not None else f"{'-':>14}"
+            speedup_text = f'{per_row / bulk:>8.1f}x' if per_row is not None else f"{'-':>9}"
+            self.stdout.write(f'{size:>8}{per_row_text}{bulk * 1000:>11.1f}{queries:>9}{speedup_text}')
+
+    def run(self, size, func):
+        """주문을 만들고 confirmed -> in_production 변경 시간을 측정한 뒤 롤백"""
+        with transaction.atomic():
+            ids = self.create_orders(size)
+            # 쿼리 로그(최대 9000건)가 가득 차면 건수가 0으로 집계되므로 비움
+            reset_queries()
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                func(ids)
+                elapsed = time.perf_counter() - started
+            transaction.set_rollback(True)
+        return elapsed, len(queries)
+
+    def per_row(self, ids):
+        for order in Order.objects.filter(id__in=ids).select_related('product'):
+            order.status = 'in_production'
+            order.save()
+
+    def bulk(self, ids):
+        result = OrderService.bulk_transition_status(ids, 'in_production')
+        assert result['updated'] == len(ids), result['updated']
+
+    def create_orders(self, count):
+        designer = User.objects.create_user(
+            user_id='bench_designer', name='벤치마크', user_type='designer'
+        )
+        product = Product.objects.create(
+            designer=designer, name='벤치마크 제품', season='summer', target='twenties', concept='컨셉'
+        )
+        orders = Order.objects.bulk_create([
+            Order(
+                order_id=f'BENCH-{i:08d}',
+                product=product,
+                designer=designer,
+                status='confirmed',
+                quantity=10,
+                unit_price=Decimal('15000.00'),
+                total_price=Decimal('150000.00'),
+            )
+            for i in range(count)
+        ], batch_size=1000)
+        return [order.pk for order in orders]
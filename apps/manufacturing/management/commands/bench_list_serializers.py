@@ -0,0 +1,99 @@
+"""
+목록 직렬화 마이크로벤치마크: ModelSerializer 경로 vs 컴파일된 ValuesPlan 경로
+
+벤치마크용 데이터는 트랜잭션 안에서 생성 후 롤백되므로 DB에 남지 않습니다.
+
+사용법:
+    python manage.py bench_list_serializers
+    python manage.py bench_list_serializers --rows 20 100 1000 --repeat 20
+"""
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import RequestFactory
+from rest_framework.request import Request
+
+from apps.accounts.models import User
+from apps.core.serializers import ValuesPlan
+from apps.manufacturing.models import Product, Order
+from apps.manufacturing.serializers import ProductSerializer, OrderSerializer
+
+
+class Command(BaseCommand):
+    help = 'ModelSerializer 목록 직렬화와 컴파일된 목록 직렬화의 속도를 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, nargs='+', default=[20, 100, 1000], help='측정할 행 수')
+        parser.add_argument('--repeat', type=int, default=10, help='반복 횟수 (최소값 사용)')
+
+    def handle(self, *args, **options):
+        rows = sorted(options['rows'])
+        request = Request(RequestFactory().get('/api/manufacturing/', HTTP_HOST='localhost'))
+        context = {'request': request}
+
+        with transaction.atomic():
+            self.create_rows(max(rows))
+
+            targets = (
+                ('products', ProductSerializer, Product.objects.select_related('designer')),
+                ('orders', OrderSerializer, Order.objects.select_related('product__designer')),
+            )
+            self.stdout.write(f"{'target':<10}{'rows':>7}{'serializer(ms)':>16}{'compiled(ms)':>14}{'speedup':>9}")
+            for name, serializer_class, queryset in targets:
+                plan = ValuesPlan.for_serializer(serializer_class(context=context))
+                for count in rows:
+                    regular = self.measure(
+                        lambda: serializer_class(list(queryset[:count]), many=True, context=context).data,
+                        options['repeat'],
+                    )
+                    compiled = self.measure(
+                        lambda: plan.render(queryset.values(*plan.columns)[:count], request),
+                        options['repeat'],
+                    )
+                    self.stdout.write(
+                        f'{name:<10}{count:>7}{regular * 1000:>16.2f}{compiled * 1000:>14.2f}'
+                        f'{regular / compiled:>8.1f}x'
+                    )
+
+            transaction.set_rollback(True)
+
+    def create_rows(self, count):
+        designer = User.objects.create_user(
+            user_id='bench_designer', name='벤치마크', user_type='designer'
+        )
+        products = Product.objects.bulk_create([
+            Product(
+                designer=designer,
+                name=f'벤치마크 제품 {i}',
+                season='summer',
+                target='twenties',
+                concept='컨셉 설명 ' * 20,
+                detail='포인트 설명 ' * 10,
+                image_path=f'design_image/{i}.png',
+                quantity=100,
+                fabric={'type': 'cotton', 'count': '30수'},
+                material={'zipper': 'YKK'},
+            )
+            for i in range(count)
+        ])
+        Order.objects.bulk_create([
+            Order(
+                order_id=f'BENCH-{i:08d}',
+                product=product,
+                designer=designer,
+                quantity=10,
+                unit_price=Decimal('15000.00'),
+                total_price=Decimal('150000.00'),
+            )
+            for i, product in enumerate(products)
+        ])
+
+    def measure(self, func, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        return min(timings)
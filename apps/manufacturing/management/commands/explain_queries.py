@@ -0,0 +1,112 @@
+"""
+주요 조회 쿼리의 실행 계획(EXPLAIN)을 기록/비교하는 벤치마크 명령
+
+사용법:
+    # 인덱스 적용 전/후 실행 계획 기록
+    python manage.py explain_queries --label before
+    python manage.py migrate manufacturing
+    python manage.py explain_queries --label after
+
+    # 두 기록 비교 (Seq Scan 재등장 등 회귀 확인)
+    python manage.py explain_queries --compare before after
+"""
+import difflib
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from apps.accounts.models import User
+from apps.manufacturing.models import Product, Order
+
+
+class Command(BaseCommand):
+    help = '제품/주문 주요 조회 쿼리의 EXPLAIN 결과를 기록하거나 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--label', default='current', help='기록 이름 (예: before, after)')
+        parser.add_argument(
+            '--output-dir',
+            default=str(Path(settings.BASE_DIR) / 'benchmarks' / 'explain'),
+            help='기록 파일 저장 위치',
+        )
+        parser.add_argument('--designer', type=int, help='조회에 사용할 디자이너 id')
+        parser.add_argument('--analyze', action='store_true', help='EXPLAIN ANALYZE 실행 (PostgreSQL)')
+        parser.add_argument('--compare', nargs=2, metavar=('BASE', 'TARGET'), help='두 기록 비교')
+
+    def get_queries(self, designer_id):
+        """대시보드에서 실제로 실행되는 조회 경로"""
+        return {
+            'designer_products': Product.objects.filter(designer_id=designer_id)[:20],
+            'designer_orders': Order.objects.filter(designer_id=designer_id)[:20],
+            'status_orders': Order.objects.filter(status='in_production')[:20],
+            'open_orders': Order.objects.filter(
+                status__in=['pending', 'confirmed', 'in_production']
+            )[:20],
+            'orders_keyset_page': Order.objects.order_by('-created_at', 'id')[:21],
+            'products_keyset_page': Product.objects.order_by('-created_at', 'id')[:21],
+        }
+
+    def handle(self, *args, **options):
+        output_dir = Path(options['output_dir'])
+
+        if options['compare']:
+            return self.compare(output_dir, *options['compare'])
+
+        designer_id = options['designer']
+        if designer_id is None:
+            designer_id = (
+                User.objects.filter(user_type='designer').values_list('id', flat=True).first() or 0
+            )
+
+        explain_options = {}
+        if connection.vendor == 'postgresql' and options['analyze']:
+            explain_options = {'analyze': True, 'buffers': True}
+
+        plans = {}
+        for name, queryset in self.get_queries(designer_id).items():
+            plans[name] = {
+                'sql': str(queryset.query),
+                'plan': queryset.explain(**explain_options),
+            }
+            self.stdout.write(self.style.MIGRATE_HEADING(f'[{name}]'))
+            self.stdout.write(plans[name]['plan'])
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        path = output_dir / f"{options['label']}.json"
+        path.write_text(json.dumps({
+            'vendor': connection.vendor,
+            'designer_id': designer_id,
+            'plans': plans,
+        }, ensure_ascii=False, indent=2))
+        self.stdout.write(self.style.SUCCESS(f'실행 계획 기록 완료: {path}'))
+
+    def compare(self, output_dir, base_label, target_label):
+        try:
+            base = json.loads((output_dir / f'{base_label}.json').read_text())['plans']
+            target = json.loads((output_dir / f'{target_label}.json').read_text())['plans']
+        except FileNotFoundError as e:
+            raise CommandError(f'기록 파일을 찾을 수 없습니다: {e.filename}')
+
+        regressions = []
+        for name in sorted(set(base) | set(target)):
+            before = base.get(name, {}).get('plan', '')
+            after = target.get(name, {}).get('plan', '')
+            self.stdout.write(self.style.MIGRATE_HEADING(f'[{name}]'))
+            if before == after:
+                self.stdout.write('  변경 없음')
+                continue
+            for line in difflib.unified_diff(
+                before.splitlines(), after.splitlines(),
+                fromfile=base_label, tofile=target_label, lineterm='',
+            ):
+                self.stdout.write(f'  {line}')
+            if 'Seq Scan' in after and 'Seq Scan' not in before:
+                regressions.append(name)
+
+        if regressions:
+            self.stdout.write(self.style.ERROR(f"Seq Scan 회귀: {', '.join(regressions)}"))
+        else:
+            self.stdout.write(self.style.SUCCESS('회귀 없음'))
@@ -0,0 +1,59 @@
+"""
+주문 집계(OrderRollup)를 주문 테이블에서 처음부터 다시 만드는 명령
+
+증분 갱신된 집계가 주문 테이블의 GROUP BY 결과와 같은지 확인(--verify)하거나,
+어긋난 경우 전체를 재생성합니다.
+
+사용법:
+    python manage.py rebuild_order_rollups --verify   # 비교만 하고 차이가 있으면 실패 코드로 종료
+    python manage.py rebuild_order_rollups            # 집계 테이블 전체 재생성
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.manufacturing.models import OrderRollup
+from apps.manufacturing.rollups import compute_rollups
+
+
+class Command(BaseCommand):
+    help = '주문 집계 테이블을 주문 데이터로 재생성하거나 검증합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--verify', action='store_true', help='재생성하지 않고 현재 집계와 비교만 수행')
+        parser.add_argument('--batch-size', type=int, default=1000, help='재생성 시 INSERT 배치 크기')
+
+    def handle(self, *args, **options):
+        expected = compute_rollups()
+
+        if options['verify']:
+            actual = self.load_current()
+            differences = sorted(set(expected) | set(actual), key=repr)
+            differences = [key for key in differences if expected.get(key) != actual.get(key)]
+            for key in differences[:50]:
+                self.stdout.write(f'  {dict(key)}: 기대값 {expected.get(key)} / 현재 {actual.get(key)}')
+            if differences:
+                raise CommandError(f'주문 집계 불일치: {len(differences)}건')
+            self.stdout.write(self.style.SUCCESS(f'주문 집계 일치: {len(expected)}건'))
+            return
+
+        with transaction.atomic():
+            deleted, _ = OrderRollup.objects.all().delete()
+            OrderRollup.objects.bulk_create(
+                [
+                    OrderRollup(**dict(key), order_count=count, revenue=revenue)
+                    for key, (count, revenue) in expected.items()
+                ],
+                batch_size=options['batch_size'],
+            )
+        self.stdout.write(self.style.SUCCESS(f'주문 집계 재생성 완료: 삭제 {deleted}건, 생성 {len(expected)}건'))
+
+    def load_current(self):
+        rows = OrderRollup.objects.values(
+            'owner_type', 'owner_id', 'day', 'status', 'season', 'target', 'order_count', 'revenue'
+        )
+        return {
+            tuple(sorted((name, row[name]) for name in (
+                'owner_type', 'owner_id', 'day', 'status', 'season', 'target'
+            ))): (row['order_count'], row['revenue'])
+            for row in rows
+        }
@@ -0,0 +1,52 @@
+"""
+주문 진행 현황 스냅샷을 주문/제품/생산 단계 데이터로 다시 만드는 명령
+
+스냅샷 도입 이전 주문을 채우거나, 문서 형식이 바뀌었을 때 전체를 재생성합니다.
+
+사용법:
+    python manage.py rebuild_progress_snapshots            # 스냅샷이 없는 주문만
+    python manage.py rebuild_progress_snapshots --all      # 모든 주문 재생성
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.manufacturing.models import Order, OrderProgressSnapshot
+from apps.manufacturing.progress import make_snapshot
+
+
+class Command(BaseCommand):
+    help = '주문 진행 현황 스냅샷을 배치 단위로 생성/재생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='배치당 처리할 주문 수')
+        parser.add_argument('--sleep', type=float, default=0.0, help='배치 사이 대기 시간(초)')
+        parser.add_argument('--all', action='store_true', help='스냅샷이 있는 주문도 재생성')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        queryset = Order.objects.select_related('product__designer', 'factory').prefetch_related('stages')
+        if not options['all']:
+            queryset = queryset.filter(progress_snapshot__isnull=True)
+
+        last_id = 0
+        total = 0
+        while True:
+            orders = list(queryset.filter(pk__gt=last_id).order_by('pk')[:batch_size])
+            if not orders:
+                break
+
+            snapshots = [make_snapshot(order, order.stages.all()) for order in orders]
+            with transaction.atomic():
+                OrderProgressSnapshot.objects.filter(pk__in=[order.pk for order in orders]).delete()
+                OrderProgressSnapshot.objects.bulk_create(snapshots)
+
+            total += len(snapshots)
+            last_id = orders[-1].pk
+            self.stdout.write(f'  ~{last_id}: {len(snapshots)}건 생성 (누적 {total}건)')
+
+            if options['sleep']:
+                time.sleep(options['sleep'])
+
+        self.stdout.write(self.style.SUCCESS(f'진행 현황 스냅샷 생성 완료: {total}건'))
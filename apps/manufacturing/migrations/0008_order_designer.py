@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-18 05:40
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('manufacturing', '0007_product_order_access_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='designer',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='designer_orders', to=settings.AUTH_USER_MODEL, verbose_name='디자이너'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['designer', '-created_at'], name='orders_designer_created_idx'),
+        ),
+    ]
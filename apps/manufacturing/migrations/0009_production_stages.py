@@ -0,0 +1,45 @@
+# Generated by Django 4.2.7 on 2026-10-18 05:51
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('manufacturing', '0008_order_designer'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='factory',
+            field=models.ForeignKey(blank=True, limit_choices_to={'user_type': 'factory'}, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='factory_orders', to=settings.AUTH_USER_MODEL, verbose_name='공장'),
+        ),
+        migrations.CreateModel(
+            name='ProductionStage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('phase', models.CharField(choices=[('sample', '샘플 생산'), ('main', '본 생산')], default='sample', max_length=10, verbose_name='생산 구분')),
+                ('stage_index', models.PositiveSmallIntegerField(choices=[(1, '1차 가봉'), (2, '부자재 부착'), (3, '마킹 및 재단'), (4, '봉제'), (5, '검사 및 다림질'), (6, '배송')], verbose_name='단계 번호')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('in_progress', '진행중'), ('done', '완료')], default='pending', max_length=20, verbose_name='진행 상태')),
+                ('end_date', models.DateField(blank=True, null=True, verbose_name='완료일')),
+                ('delivery_code', models.CharField(blank=True, max_length=50, null=True, verbose_name='송장 번호')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+                ('order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stages', to='manufacturing.order', verbose_name='주문')),
+            ],
+            options={
+                'verbose_name': '생산 단계',
+                'verbose_name_plural': '생산 단계들',
+                'db_table': 'production_stages',
+                'ordering': ['order', 'phase', 'stage_index'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='productionstage',
+            constraint=models.UniqueConstraint(fields=('order', 'stage_index', 'phase'), name='stages_order_index_phase_uniq'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-18 05:52
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('manufacturing', '0009_production_stages'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderProgressSnapshot',
+            fields=[
+                ('order', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='progress_snapshot', serialize=False, to='manufacturing.order', verbose_name='주문')),
+                ('document', models.JSONField(default=dict, verbose_name='진행 현황 문서')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+                ('designer', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='디자이너')),
+                ('factory', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='공장')),
+            ],
+            options={
+                'verbose_name': '주문 진행 현황 스냅샷',
+                'verbose_name_plural': '주문 진행 현황 스냅샷들',
+                'db_table': 'order_progress_snapshots',
+            },
+        ),
+    ]
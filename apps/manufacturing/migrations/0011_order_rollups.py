@@ -0,0 +1,39 @@
+# Generated by Django 4.2.7 on 2026-10-18 05:54
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('manufacturing', '0010_order_progress_snapshots'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('owner_type', models.CharField(choices=[('designer', '디자이너'), ('factory', '공장')], max_length=10, verbose_name='소유자 구분')),
+                ('day', models.DateField(verbose_name='주문 일자')),
+                ('status', models.CharField(choices=[('pending', '대기중'), ('confirmed', '확인됨'), ('in_production', '생산중'), ('completed', '완료'), ('cancelled', '취소됨')], max_length=20, verbose_name='주문 상태')),
+                ('season', models.CharField(choices=[('spring', '봄'), ('summer', '여름'), ('autumn', '가을'), ('winter', '겨울'), ('all-season', '사계절')], max_length=20, verbose_name='시즌')),
+                ('target', models.CharField(choices=[('teens', '10대'), ('twenties', '20대'), ('thirties', '30대'), ('forties', '40대'), ('fifties-plus', '50대 이상'), ('all-ages', '전 연령')], max_length=20, verbose_name='타겟 고객층')),
+                ('order_count', models.IntegerField(default=0, verbose_name='주문 수')),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=16, verbose_name='매출')),
+                ('owner', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='order_rollups', to=settings.AUTH_USER_MODEL, verbose_name='소유자')),
+            ],
+            options={
+                'verbose_name': '주문 집계',
+                'verbose_name_plural': '주문 집계들',
+                'db_table': 'order_rollups',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='orderrollup',
+            constraint=models.UniqueConstraint(fields=('owner_type', 'owner', 'day', 'status', 'season', 'target'), name='order_rollups_key_uniq'),
+        ),
+    ]
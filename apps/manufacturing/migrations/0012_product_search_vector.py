@@ -0,0 +1,35 @@
+# Generated by Django 4.2.7 on 2026-10-18 05:57
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+from apps.core.db import PostgresOnlyAddIndex, PostgresOnlyRunPython
+
+
+def fill_search_vectors(apps, schema_editor):
+    from apps.manufacturing.search import build_search_vector
+
+    Product = apps.get_model('manufacturing', 'Product')
+    for product in Product.objects.only('pk', 'name', 'concept', 'detail').iterator(chunk_size=1000):
+        Product.objects.filter(pk=product.pk).update(search_vector=build_search_vector(product))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('manufacturing', '0011_order_rollups'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True, verbose_name='검색 벡터'),
+        ),
+        PostgresOnlyAddIndex(
+            model_name='product',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='products_search_vector_gin'),
+        ),
+        PostgresOnlyRunPython(fill_search_vectors, migrations.RunPython.noop),
+    ]
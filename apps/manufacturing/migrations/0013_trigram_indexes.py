@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-18 06:05
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+from apps.core.db import PostgresOnlyAddIndex
+
+
+class Migration(migrations.Migration):
+    """관리자 검색(제품명, 주문 번호 부분 일치)용 pg_trgm 인덱스"""
+
+    dependencies = [
+        ('accounts', '0003_user_trigram_indexes'),
+        ('manufacturing', '0012_product_search_vector'),
+    ]
+
+    operations = [
+        # PostgreSQL이 아니면 건너뜀
+        TrigramExtension(),
+        PostgresOnlyAddIndex(
+            model_name='product',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['name'], name='products_name_trgm', opclasses=['gin_trgm_ops'],
+            ),
+        ),
+        PostgresOnlyAddIndex(
+            model_name='order',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['order_id'], name='orders_order_id_trgm', opclasses=['gin_trgm_ops'],
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-10-18 06:12
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+from apps.core.db import PostgresOnlyAddIndex
+
+
+class Migration(migrations.Migration):
+    """원단/부자재 JSON 포함(@>) 검색용 jsonb_path_ops GIN 인덱스 (filters.ProductFilter)"""
+
+    dependencies = [
+        ('manufacturing', '0013_trigram_indexes'),
+    ]
+
+    operations = [
+        PostgresOnlyAddIndex(
+            model_name='product',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['fabric'], name='products_fabric_gin', opclasses=['jsonb_path_ops'],
+            ),
+        ),
+        PostgresOnlyAddIndex(
+            model_name='product',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['material'], name='products_material_gin', opclasses=['jsonb_path_ops'],
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-18 06:26
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    """제품 designer FK 단독 인덱스 제거 ((designer, -created_at) 복합 인덱스가 대신함)"""
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('manufacturing', '0014_product_json_gin_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='product',
+            name='designer',
+            field=models.ForeignKey(db_index=False, limit_choices_to={'user_type': 'designer'}, on_delete=django.db.models.deletion.CASCADE, related_name='products', to=settings.AUTH_USER_MODEL, verbose_name='디자이너'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.7 on 2026-10-18 06:26
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    """생산 단계 order FK 단독 인덱스 제거 ((order, stage_index, phase) 유니크 제약 인덱스가 대신함)"""
+
+    dependencies = [
+        ('manufacturing', '0015_product_designer_drop_fk_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='productionstage',
+            name='order',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='stages', to='manufacturing.order', verbose_name='주문'),
+        ),
+    ]
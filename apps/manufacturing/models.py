@@ -1,5 +1,6 @@
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinValueValidator
 from django.utils import timezone
 import uuid
@@ -7,6 +8,14 @@ import uuid
 # accounts 앱의 User 모델 import
 from apps.accounts.models import User
 
+
+class ProductManager(models.Manager):
+    """검색 전용 컬럼(search_vector)은 기본 조회에서 제외"""
+
+    def get_queryset(self):
+        return super().get_queryset().defer('search_vector')
+
+
 class Product(models.Model):
     """제품 모델"""
     SEASON_CHOICES = (
@@ -30,6 +39,7 @@ class Product(models.Model):
         User, 
         on_delete=models.CASCADE, 
         related_name='products',
+        db_index=False,  # (designer, -created_at) 복합 인덱스가 대신함
         verbose_name="디자이너",
         limit_choices_to={'user_type': 'designer'}
     )
@@ -66,18 +76,50 @@ class Product(models.Model):
         blank=True, 
         verbose_name="작업지시서"
     )
+    # 제품명/컨셉/설명 전문 검색용 (apps.manufacturing.search에서 저장 시 갱신, PostgreSQL GIN 인덱스)
+    search_vector = SearchVectorField(null=True, blank=True, editable=False, verbose_name="검색 벡터")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일시")
 
+    objects = ProductManager()
+
     class Meta:
         db_table = 'products'
         verbose_name = "제품"
         verbose_name_plural = "제품들"
         ordering = ['-created_at']
+        indexes = [
+            # 디자이너별 제품 목록: filter(designer=...).order_by('-created_at')
+            models.Index(fields=['designer', '-created_at'], name='products_designer_created_idx'),
+            # 키셋 페이지네이션: order_by('-created_at', 'id')
+            models.Index(fields=['-created_at', 'id'], name='products_created_id_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.designer.name}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 디자이너 변경 감지를 위해 로드 시점의 designer_id 보관
+        instance._loaded_designer_id = instance.__dict__.get('designer_id')
+        # 주문 집계 키(시즌, 타겟) 변경 감지용
+        instance._loaded_season = instance.__dict__.get('season')
+        instance._loaded_target = instance.__dict__.get('target')
+        return instance
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+            # 제품의 디자이너가 바뀌면 주문의 비정규화된 designer_id도 함께 갱신
+            loaded_designer_id = getattr(self, '_loaded_designer_id', None)
+            if loaded_designer_id is not None and loaded_designer_id != self.designer_id:
+                self.orders.update(designer_id=self.designer_id)
+        self._loaded_designer_id = self.designer_id
+        self._loaded_season = self.season
+        self._loaded_target = self.target
+
 
 class Order(models.Model):
     """주문 모델"""
@@ -88,6 +130,14 @@ class Order(models.Model):
         ('completed', '완료'),
         ('cancelled', '취소됨'),
     )
+    # 현재 상태 -> 변경 가능한 상태
+    ALLOWED_TRANSITIONS = {
+        'pending': ('confirmed', 'cancelled'),
+        'confirmed': ('in_production', 'cancelled'),
+        'in_production': ('completed', 'cancelled'),
+        'completed': (),
+        'cancelled': (),
+    }
     
     order_id = models.CharField(max_length=50, unique=True, verbose_name="주문 번호")
     product = models.ForeignKey(
@@ -96,6 +146,27 @@ class Order(models.Model):
         related_name='orders',
         verbose_name="제품"
     )
+    # product.designer의 비정규화 컬럼 (디자이너 주문 목록 조회 시 products 조인 제거용)
+    designer = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='designer_orders',
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=False,  # (designer, -created_at) 복합 인덱스가 대신함
+        verbose_name="디자이너"
+    )
+    # 주문을 맡은 공장 (공장 선정 전에는 비어 있음)
+    factory = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        related_name='factory_orders',
+        null=True,
+        blank=True,
+        limit_choices_to={'user_type': 'factory'},
+        verbose_name="공장"
+    )
     status = models.CharField(
         max_length=20, 
         choices=STATUS_CHOICES, 
@@ -146,17 +217,213 @@ class Order(models.Model):
         verbose_name = "주문"
         verbose_name_plural = "주문들"
         ordering = ['-created_at']
+        indexes = [
+            # 상태별 주문 목록: filter(status=...).order_by('-created_at')
+            models.Index(fields=['status', '-created_at'], name='orders_status_created_idx'),
+            # 제품별 주문 목록: filter(product=...).order_by('-created_at')
+            models.Index(fields=['product', '-created_at'], name='orders_product_created_idx'),
+            # 디자이너별 주문 목록: filter(designer=...).order_by('-created_at')
+            models.Index(fields=['designer', '-created_at'], name='orders_designer_created_idx'),
+            # 키셋 페이지네이션: order_by('-created_at', 'id')
+            models.Index(fields=['-created_at', 'id'], name='orders_created_id_idx'),
+            # 진행 중인 주문만 보는 공장 대시보드용 부분 인덱스
+            models.Index(
+                fields=['-created_at'],
+                name='orders_open_created_idx',
+                condition=models.Q(status__in=['pending', 'confirmed', 'in_production']),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.order_id} - {self.product.name}"
 
+    @classmethod
+    def source_statuses(cls, status):
+        """주어진 상태로 변경할 수 있는 현재 상태 목록"""
+        return [source for source, targets in cls.ALLOWED_TRANSITIONS.items() if status in targets]
+
+    @staticmethod
+    def generate_order_id(date=None):
+        """주문 번호 생성 (ORD-YYYYMMDD-XXXXXXXX)"""
+        date = date or timezone.now()
+        return f"ORD-{date.strftime('%Y%m%d')}-{uuid.uuid4().hex[:8].upper()}"
+
+    @staticmethod
+    def compute_total_price(unit_price, quantity):
+        """단가와 수량으로 총 금액 계산 (둘 중 하나라도 없으면 None)"""
+        if unit_price and quantity:
+            return unit_price * quantity
+        return None
+
     def save(self, *args, **kwargs):
         # 주문 번호 자동 생성
         if not self.order_id:
-            self.order_id = f"ORD-{timezone.now().strftime('%Y%m%d')}-{uuid.uuid4().hex[:8].upper()}"
+            self.order_id = self.generate_order_id()
         
         # 총 금액 자동 계산
-        if self.unit_price and self.quantity:
-            self.total_price = self.unit_price * self.quantity
-            
-        super().save(*args, **kwargs)
\ No newline at end of file
+        total_price = self.compute_total_price(self.unit_price, self.quantity)
+        if total_price is not None:
+            self.total_price = total_price
+
+        # 제품 디자이너 동기화
+        if self.product_id is not None:
+            self.designer_id = self.product.designer_id
+
+        # 시그널에서 갱신하는 집계(OrderRollup)가 주문 저장과 함께 커밋/롤백되도록 묶음
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+
+class ProductionStage(models.Model):
+    """
+    주문의 생산 단계 진행 현황
+
+    샘플 생산과 본 생산 각각 6단계(1차 가봉 ~ 배송)로 구성되며, 단계마다 한 행을 저장합니다.
+    아직 저장되지 않은 단계는 대기 상태로 간주합니다.
+    """
+    PHASE_CHOICES = (
+        ('sample', '샘플 생산'),
+        ('main', '본 생산'),
+    )
+    STATUS_CHOICES = (
+        ('pending', '대기'),
+        ('in_progress', '진행중'),
+        ('done', '완료'),
+    )
+    STAGE_NAMES = {
+        1: '1차 가봉',
+        2: '부자재 부착',
+        3: '마킹 및 재단',
+        4: '봉제',
+        5: '검사 및 다림질',
+        6: '배송',
+    }
+    DELIVERY_STAGE = 6
+
+    order = models.ForeignKey(
+        Order,
+        on_delete=models.CASCADE,
+        related_name='stages',
+        db_index=False,  # (order, stage_index, phase) 유니크 제약 인덱스가 대신함
+        verbose_name="주문"
+    )
+    phase = models.CharField(max_length=10, choices=PHASE_CHOICES, default='sample', verbose_name="생산 구분")
+    stage_index = models.PositiveSmallIntegerField(
+        choices=list(STAGE_NAMES.items()),
+        verbose_name="단계 번호"
+    )
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending', verbose_name="진행 상태")
+    end_date = models.DateField(null=True, blank=True, verbose_name="완료일")
+    delivery_code = models.CharField(max_length=50, null=True, blank=True, verbose_name="송장 번호")
+
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일시")
+
+    class Meta:
+        db_table = 'production_stages'
+        verbose_name = "생산 단계"
+        verbose_name_plural = "생산 단계들"
+        ordering = ['order', 'phase', 'stage_index']
+        constraints = [
+            # (order_id, stage_index, phase) 순서의 유니크 인덱스가
+            # 주문별 단계 조회(order_id, stage_index) 인덱스 역할도 함께 함
+            models.UniqueConstraint(
+                fields=['order', 'stage_index', 'phase'],
+                name='stages_order_index_phase_uniq',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.order_id} - {self.get_phase_display()} {self.stage_index}. {self.name}"
+
+    @property
+    def name(self):
+        return self.STAGE_NAMES[self.stage_index]
+
+
+class OrderProgressSnapshot(models.Model):
+    """
+    디자이너 주문 진행 현황 문서 스냅샷 (designer_order_schema.json 형식)
+
+    주문/제품/생산 단계/공장 정보가 바뀔 때마다 apps.manufacturing.progress에서
+    해당 부분만 갱신하며, 조회 API는 이 테이블의 PK 한 건만 읽습니다.
+    designer/factory는 조회 권한 확인과 사용자 정보 변경 시 대상 스냅샷 조회용 비정규화 컬럼입니다.
+    """
+    order = models.OneToOneField(
+        Order,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='progress_snapshot',
+        verbose_name="주문"
+    )
+    designer = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='+',
+        null=True,
+        blank=True,
+        verbose_name="디자이너"
+    )
+    factory = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        related_name='+',
+        null=True,
+        blank=True,
+        verbose_name="공장"
+    )
+    document = models.JSONField(default=dict, verbose_name="진행 현황 문서")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일시")
+
+    class Meta:
+        db_table = 'order_progress_snapshots'
+        verbose_name = "주문 진행 현황 스냅샷"
+        verbose_name_plural = "주문 진행 현황 스냅샷들"
+
+    def __str__(self):
+        return f"{self.order_id} 진행 현황"
+
+
+class OrderRollup(models.Model):
+    """
+    주문 집계 테이블 (대시보드용)
+
+    (소유자, 일자, 주문 상태, 제품 시즌, 타겟) 단위의 주문 수와 매출(total_price 합계)을
+    주문 생성/수정/상태 변경 시 apps.manufacturing.rollups에서 증분 갱신합니다.
+    주문 하나는 디자이너 행과 (배정된 경우) 공장 행에 각각 반영됩니다.
+    """
+    OWNER_TYPE_CHOICES = (
+        ('designer', '디자이너'),
+        ('factory', '공장'),
+    )
+
+    owner_type = models.CharField(max_length=10, choices=OWNER_TYPE_CHOICES, verbose_name="소유자 구분")
+    owner = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='order_rollups',
+        db_index=False,  # 유니크 인덱스의 (owner_type, owner) 접두어로 대신함
+        verbose_name="소유자"
+    )
+    day = models.DateField(verbose_name="주문 일자")
+    status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES, verbose_name="주문 상태")
+    season = models.CharField(max_length=20, choices=Product.SEASON_CHOICES, verbose_name="시즌")
+    target = models.CharField(max_length=20, choices=Product.TARGET_CHOICES, verbose_name="타겟 고객층")
+    order_count = models.IntegerField(default=0, verbose_name="주문 수")
+    revenue = models.DecimalField(max_digits=16, decimal_places=2, default=0, verbose_name="매출")
+
+    class Meta:
+        db_table = 'order_rollups'
+        verbose_name = "주문 집계"
+        verbose_name_plural = "주문 집계들"
+        constraints = [
+            # 소유자별 기간 조회: filter(owner_type=..., owner=..., day__range=...)
+            models.UniqueConstraint(
+                fields=['owner_type', 'owner', 'day', 'status', 'season', 'target'],
+                name='order_rollups_key_uniq',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.owner_type}:{self.owner_id} {self.day} {self.status} {self.season}/{self.target}"
+
@@ -0,0 +1,305 @@
+"""
+디자이너 주문 진행 현황 문서(designer_order_schema.json) 생성 및 부분 갱신
+
+문서 전체 생성(build_document)은 스냅샷이 없을 때만 사용하고, 이후에는 바뀐 행
+(주문, 제품, 생산 단계, 공장/디자이너 사용자)에 해당하는 부분만 patch_* 함수로 고친 뒤
+refresh_document로 단계별 상태와 현재 단계를 다시 계산합니다.
+"""
+from datetime import date
+from decimal import Decimal
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Order, OrderProgressSnapshot, ProductionStage
+
+STEP_NAMES = {
+    1: '샘플 제작 업체 선정',
+    2: '샘플 생산 현황',
+    3: '샘플 생산 배송 조회',
+    4: '샘플 피드백',
+    5: '본 생산 업체 선정',
+    6: '본 생산 현황',
+    7: '본 생산 배송 조회',
+}
+# 생산 구분 -> (생산 현황 단계, 배송 조회 단계)
+PHASE_STEPS = {'sample': (2, 3), 'main': (6, 7)}
+FACTORY_SELECTION_STEPS = (1, 5)
+
+PENDING, IN_PROGRESS, DONE = 'pending', 'in_progress', 'done'
+
+
+def _date(value):
+    return value.isoformat() if value else None
+
+
+def _number(value):
+    """Decimal을 JSON 숫자로 변환"""
+    if value is None:
+        return None
+    if isinstance(value, Decimal) and value == value.to_integral_value():
+        return int(value)
+    return float(value)
+
+
+def _step(document, index):
+    return document['steps'][index - 1]
+
+
+def _stage_entry(phase, stage_index, stage=None):
+    entry = {
+        'name': ProductionStage.STAGE_NAMES[stage_index],
+        'status': stage.status if stage else PENDING,
+        'end_date': _date(stage.end_date) if stage else None,
+    }
+    # 스키마상 샘플 단계에만 index/delivery_code가 있음
+    if phase == 'sample':
+        entry = {'index': stage_index, **entry}
+        if stage_index == ProductionStage.DELIVERY_STAGE:
+            entry['delivery_code'] = stage.delivery_code if stage else None
+    return entry
+
+
+def empty_document():
+    """단계 구조만 있는 빈 문서"""
+    steps = [{'index': index, 'name': name, 'status': PENDING} for index, name in STEP_NAMES.items()]
+    for index in FACTORY_SELECTION_STEPS:
+        steps[index - 1]['factory_list'] = []
+    for phase, (stage_step, delivery_step) in PHASE_STEPS.items():
+        if phase == 'sample':
+            steps[stage_step - 1].update({'factory_name': None, 'order_date': None, 'factory_contact': None})
+        steps[stage_step - 1]['stage'] = [
+            _stage_entry(phase, stage_index) for stage_index in ProductionStage.STAGE_NAMES
+        ]
+        steps[delivery_step - 1].update({
+            'product_name': None,
+            'product_quantity': None,
+            'factory_name': None,
+            'factory_contact': None,
+            'delivery_status': PENDING,
+            'delivery_code': None,
+        })
+    steps[3]['feedback_history'] = []
+    return {
+        'order_id': None,
+        'designer_id': None,
+        'product_id': None,
+        'current_step_index': 1,
+        'overall_status': IN_PROGRESS,
+        'last_updated': None,
+        'steps': steps,
+    }
+
+
+def patch_order(document, order):
+    """주문 행의 값(주문 번호, 수량, 상태, 공장 배정) 반영"""
+    document['order_id'] = order.order_id
+    document['product_id'] = str(order.product_id)
+    _step(document, 2)['order_date'] = _date(timezone.localdate(order.created_at)) if order.created_at else None
+    for _, delivery_step in PHASE_STEPS.values():
+        _step(document, delivery_step)['product_quantity'] = order.quantity
+    patch_order_status(document, order.status)
+    patch_factory(document, order.factory, work_price=order.unit_price)
+
+
+def patch_order_status(document, status):
+    if status in ('completed', 'cancelled'):
+        document['overall_status'] = status
+    else:
+        document['overall_status'] = IN_PROGRESS
+
+
+def patch_product(document, product):
+    for _, delivery_step in PHASE_STEPS.values():
+        _step(document, delivery_step)['product_name'] = product.name
+
+
+def patch_designer(document, designer):
+    document['designer_id'] = designer.user_id if designer else None
+
+
+def patch_factory(document, factory, work_price=None):
+    """
+    공장 정보 반영 (factory가 None이면 공장 미배정)
+
+    work_price를 주지 않으면 기존 업체 목록의 작업 단가를 유지합니다.
+    (공장 사용자 정보만 바뀐 경우)
+    """
+    if work_price is None:
+        existing = _step(document, 1)['factory_list']
+        work_price = existing[0]['work_price'] if existing else None
+    else:
+        work_price = _number(work_price)
+
+    name = factory.name if factory else None
+    contact = factory.contact if factory else None
+    if factory:
+        common = {
+            'profile_image': None,
+            'name': factory.name,
+            'contact': factory.contact,
+            'address': factory.address,
+            'work_price': work_price,
+        }
+        _step(document, 1)['factory_list'] = [
+            {'factory_id': factory.user_id, **common, 'currency': 'KRW', 'expect_work_day': None},
+        ]
+        _step(document, 5)['factory_list'] = [
+            {'id': factory.user_id, **common, 'work_duration': None},
+        ]
+    else:
+        for index in FACTORY_SELECTION_STEPS:
+            _step(document, index)['factory_list'] = []
+
+    _step(document, 2).update({'factory_name': name, 'factory_contact': contact})
+    for _, delivery_step in PHASE_STEPS.values():
+        _step(document, delivery_step).update({'factory_name': name, 'factory_contact': contact})
+
+
+def patch_stage(document, stage, deleted=False):
+    """생산 단계 한 건 반영 (삭제된 단계는 대기 상태로 되돌림)"""
+    stage_step, delivery_step = PHASE_STEPS[stage.phase]
+    entry = _stage_entry(stage.phase, stage.stage_index, None if deleted else stage)
+    _step(document, stage_step)['stage'][stage.stage_index - 1] = entry
+
+    if stage.stage_index == ProductionStage.DELIVERY_STAGE:
+        _step(document, delivery_step).update({
+            'delivery_status': entry['status'],
+            'delivery_code': None if deleted else stage.delivery_code,
+        })
+
+
+def stage_from_document(document, phase, stage_index, **values):
+    """
+    문서에 반영된 단계 값 위에 values를 덮어쓴 ProductionStage (DB 조회 없음, 저장하지 않음)
+
+    QuerySet.update()로 일부 필드만 기록한 단계를 다시 읽지 않고 문서에 반영할 때 사용합니다.
+    """
+    stage_step, delivery_step = PHASE_STEPS[phase]
+    entry = _step(document, stage_step)['stage'][stage_index - 1]
+    delivery_code = None
+    if stage_index == ProductionStage.DELIVERY_STAGE:
+        delivery_code = _step(document, delivery_step)['delivery_code']
+    stage = ProductionStage(
+        phase=phase,
+        stage_index=stage_index,
+        status=entry['status'],
+        end_date=date.fromisoformat(entry['end_date']) if entry['end_date'] else None,
+        delivery_code=delivery_code,
+    )
+    for name, value in values.items():
+        setattr(stage, name, value)
+    return stage
+
+
+def _stages_status(stages):
+    statuses = {stage['status'] for stage in stages}
+    if statuses == {DONE}:
+        return DONE
+    if statuses == {PENDING}:
+        return PENDING
+    return IN_PROGRESS
+
+
+def refresh_document(document):
+    """단계별 상태, 현재 단계, 갱신 시각 재계산"""
+    factory_selected = bool(_step(document, 1)['factory_list'])
+    sample_status = _stages_status(_step(document, 2)['stage'])
+    main_status = _stages_status(_step(document, 6)['stage'])
+    sample_delivery = _step(document, 3)['delivery_status']
+    main_started = main_status != PENDING
+
+    statuses = {
+        1: DONE if factory_selected else IN_PROGRESS,
+        2: sample_status,
+        3: sample_delivery,
+        4: DONE if main_started else (IN_PROGRESS if sample_delivery == DONE else PENDING),
+        5: DONE if main_started else PENDING,
+        6: main_status,
+        7: _step(document, 7)['delivery_status'],
+    }
+    for index, status in statuses.items():
+        _step(document, index)['status'] = status
+
+    document['current_step_index'] = next(
+        (index for index, status in statuses.items() if status != DONE), len(STEP_NAMES)
+    )
+    document['last_updated'] = timezone.now().isoformat().replace('+00:00', 'Z')
+    return document
+
+
+def build_document(order, stages=()):
+    """
+    주문 전체 정보로 문서 생성
+
+    order는 product, product.designer(또는 designer), factory를 미리 읽어 두는 것이 좋습니다.
+    """
+    document = empty_document()
+    patch_order(document, order)
+    patch_product(document, order.product)
+    patch_designer(document, order.product.designer)
+    for stage in stages:
+        patch_stage(document, stage)
+    return refresh_document(document)
+
+
+def make_snapshot(order, stages=()):
+    return OrderProgressSnapshot(
+        order_id=order.pk,
+        designer_id=order.designer_id,
+        factory_id=order.factory_id,
+        document=build_document(order, stages),
+    )
+
+
+def rebuild_snapshot(order_id):
+    """DB에서 주문 전체를 읽어 스냅샷 재생성 (주문이 없으면 None)"""
+    order = Order.objects.select_related('product__designer', 'factory').prefetch_related('stages').filter(
+        pk=order_id
+    ).first()
+    if order is None:
+        return None
+    snapshot = make_snapshot(order, order.stages.all())
+    OrderProgressSnapshot.objects.update_or_create(
+        order_id=order.pk,
+        defaults={
+            'designer_id': snapshot.designer_id,
+            'factory_id': snapshot.factory_id,
+            'document': snapshot.document,
+        },
+    )
+    return snapshot
+
+
+def update_snapshot(order_id, patch, **columns):
+    """
+    주문 한 건의 스냅샷 부분 갱신
+
+    스냅샷이 아직 없으면(기존 데이터 등) 전체를 새로 만듭니다.
+    columns로 designer_id/factory_id 같은 비정규화 컬럼도 함께 갱신할 수 있습니다.
+    """
+    with transaction.atomic():
+        snapshot = OrderProgressSnapshot.objects.select_for_update().filter(pk=order_id).first()
+        if snapshot is None:
+            return rebuild_snapshot(order_id)
+        patch(snapshot.document)
+        refresh_document(snapshot.document)
+        for name, value in columns.items():
+            setattr(snapshot, name, value)
+        snapshot.save(update_fields=['document', 'updated_at', *columns])
+    return snapshot
+
+
+def update_snapshots(queryset, patch, **columns):
+    """여러 스냅샷을 같은 방식으로 부분 갱신 (bulk_update 한 번)"""
+    now = timezone.now()
+    with transaction.atomic():
+        snapshots = list(queryset.select_for_update())
+        for snapshot in snapshots:
+            patch(snapshot.document)
+            refresh_document(snapshot.document)
+            snapshot.updated_at = now
+            for name, value in columns.items():
+                setattr(snapshot, name, value)
+        OrderProgressSnapshot.objects.bulk_update(snapshots, ['document', 'updated_at', *columns])
+    return len(snapshots)
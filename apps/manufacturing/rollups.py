@@ -0,0 +1,162 @@
+"""
+주문 집계(OrderRollup) 증분 갱신
+
+주문의 집계 상태(소유자, 일자, 상태, 시즌, 타겟, 금액)를 변경 전/후로 구해
+차이(delta)만 집계 행에 더합니다. 같은 트랜잭션 안에서 호출해야 주문 변경과
+집계가 함께 커밋/롤백됩니다.
+"""
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import Order, OrderRollup
+
+ZERO = Decimal('0')
+
+
+def order_state(order, product=None):
+    """주문 인스턴스의 집계 상태"""
+    product = product or order.product
+    return {
+        'designer_id': order.designer_id,
+        'factory_id': order.factory_id,
+        'day': timezone.localdate(order.created_at),
+        'status': order.status,
+        'season': product.season,
+        'target': product.target,
+        'total_price': order.total_price,
+    }
+
+
+def load_order_states(queryset):
+    """DB에 저장된 주문들의 집계 상태 {id: state}"""
+    rows = queryset.values(
+        'id', 'designer_id', 'factory_id', 'created_at', 'status', 'total_price',
+        season=F('product__season'), target=F('product__target'),
+    )
+    states = {}
+    for row in rows:
+        row['day'] = timezone.localdate(row.pop('created_at'))
+        states[row.pop('id')] = row
+    return states
+
+
+def state_keys(state):
+    """상태가 반영되는 집계 행 키 목록"""
+    common = {
+        'day': state['day'],
+        'status': state['status'],
+        'season': state['season'],
+        'target': state['target'],
+    }
+    keys = []
+    for owner_type, owner_id in (('designer', state['designer_id']), ('factory', state['factory_id'])):
+        if owner_id:
+            keys.append(tuple(sorted({'owner_type': owner_type, 'owner_id': owner_id, **common}.items())))
+    return keys
+
+
+class RollupDelta:
+    """집계 행 키별 (주문 수, 매출) 변화량"""
+
+    def __init__(self):
+        self.changes = defaultdict(lambda: [0, ZERO])
+
+    def add(self, state, sign=1, count=1, revenue=None):
+        if state is None:
+            return
+        revenue = state['total_price'] if revenue is None else revenue
+        for key in state_keys(state):
+            change = self.changes[key]
+            change[0] += sign * count
+            change[1] += sign * (revenue or ZERO)
+
+    def move(self, old, new):
+        """변경 전 상태를 빼고 변경 후 상태를 더함"""
+        self.add(old, -1)
+        self.add(new, 1)
+
+    def apply(self):
+        """변화량을 집계 테이블에 반영 (키 순서대로 갱신해 교착 상태 방지)"""
+        with transaction.atomic():
+            for key in sorted(self.changes, key=repr):
+                count, revenue = self.changes[key]
+                if not count and not revenue:
+                    continue
+                lookup = dict(key)
+                apply_change(lookup, count, revenue)
+                if count < 0:
+                    OrderRollup.objects.filter(**lookup, order_count__lte=0).delete()
+        self.changes.clear()
+
+
+def apply_change(lookup, count, revenue):
+    updated = OrderRollup.objects.filter(**lookup).update(
+        order_count=F('order_count') + count, revenue=F('revenue') + revenue
+    )
+    if updated or count <= 0:
+        # 없는 행에서 빼는 경우(소유자 삭제로 집계 행이 먼저 지워진 경우 등)는 무시
+        return
+    try:
+        with transaction.atomic():
+            OrderRollup.objects.create(**lookup, order_count=count, revenue=revenue)
+    except IntegrityError:
+        # 동시에 같은 키가 생성된 경우
+        OrderRollup.objects.filter(**lookup).update(
+            order_count=F('order_count') + count, revenue=F('revenue') + revenue
+        )
+
+
+def product_delta(product, old_values):
+    """
+    제품의 디자이너/시즌/타겟 변경으로 인한 변화량
+
+    old_values: 변경 전 {'designer_id', 'season', 'target'}
+    제품의 주문을 (공장, 일자, 상태) 단위로 한 번에 집계해 이전 키에서 새 키로 옮깁니다.
+    """
+    delta = RollupDelta()
+    rows = Order.objects.filter(product=product).values(
+        'factory_id', 'status', day=TruncDate('created_at', tzinfo=timezone.get_current_timezone()),
+    ).annotate(count=Count('id'), revenue=Sum('total_price')).order_by()
+
+    for row in rows:
+        base = {
+            'factory_id': row['factory_id'],
+            'day': row['day'],
+            'status': row['status'],
+            'total_price': row['revenue'],
+        }
+        delta.add({**base, **old_values}, -1, count=row['count'], revenue=row['revenue'] or ZERO)
+        delta.add({
+            **base,
+            'designer_id': product.designer_id,
+            'season': product.season,
+            'target': product.target,
+        }, 1, count=row['count'], revenue=row['revenue'] or ZERO)
+    return delta
+
+
+def compute_rollups():
+    """주문 테이블 전체를 GROUP BY로 집계 (검증/재생성용) {key: (count, revenue)}"""
+    day = TruncDate('created_at', tzinfo=timezone.get_current_timezone())
+    result = defaultdict(lambda: [0, ZERO])
+    for owner_type, owner_field in (('designer', 'designer_id'), ('factory', 'factory_id')):
+        rows = Order.objects.filter(**{f'{owner_field}__isnull': False}).values(
+            owner_field, 'status', season=F('product__season'), target=F('product__target'), day=day,
+        ).annotate(count=Count('id'), revenue=Sum('total_price')).order_by()
+        for row in rows:
+            key = tuple(sorted({
+                'owner_type': owner_type,
+                'owner_id': row[owner_field],
+                'day': row['day'],
+                'status': row['status'],
+                'season': row['season'],
+                'target': row['target'],
+            }.items()))
+            result[key][0] += row['count']
+            result[key][1] += row['revenue'] or ZERO
+    return {key: tuple(value) for key, value in result.items()}
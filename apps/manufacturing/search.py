@@ -0,0 +1,99 @@
+"""
+제품 검색 (PostgreSQL 전문 검색 + SQLite 대체 검색)
+
+PostgreSQL에서는 Product.search_vector(tsvector, GIN 인덱스)에 제품명(A), 컨셉(B),
+포인트 설명(C)을 가중치와 함께 저장하고, ts_rank 순으로 정렬합니다.
+
+한국어는 기본 사전이 없으므로 PRODUCT_SEARCH_STRATEGY로 방식을 고릅니다.
+- 'bigram' (기본): 한글 단어를 두 글자 단위(n-gram)로 나눠 'simple' 설정으로 색인/검색
+  예) '린넨셔츠' -> '린넨 넨셔 셔츠' 이므로 '셔츠'로도 검색됨
+- 'dictionary': 원문을 그대로 PRODUCT_SEARCH_CONFIG(예: mecab 기반 설정)에 맡김
+
+그 외 DB(로컬 테스트용 SQLite)에서는 icontains 조건과 단순 가중치 정렬로 대체합니다.
+"""
+import re
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection
+from django.db.models import Case, F, IntegerField, Q, TextField, Value, When
+
+WORD_RE = re.compile(r'\w+')
+HANGUL_RE = re.compile('[가-힣]')
+
+# (필드, 가중치)
+WEIGHTED_FIELDS = (('name', 'A'), ('concept', 'B'), ('detail', 'C'))
+
+
+def get_config():
+    return getattr(settings, 'PRODUCT_SEARCH_CONFIG', 'simple')
+
+
+def get_strategy():
+    return getattr(settings, 'PRODUCT_SEARCH_STRATEGY', 'bigram')
+
+
+def is_full_text_supported():
+    return connection.vendor == 'postgresql'
+
+
+def tokenize(text):
+    """검색 전략에 맞게 텍스트를 토큰 목록으로 변환"""
+    if not text:
+        return []
+    if get_strategy() != 'bigram':
+        return [text]
+
+    tokens = []
+    for word in WORD_RE.findall(text.lower()):
+        if len(word) > 2 and HANGUL_RE.search(word):
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def build_search_vector(product):
+    """제품 값으로 search_vector 표현식 생성 (가중치 포함)"""
+    vector = None
+    for field, weight in WEIGHTED_FIELDS:
+        document = ' '.join(tokenize(getattr(product, field) or ''))
+        part = SearchVector(Value(document, output_field=TextField()), config=get_config(), weight=weight)
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def update_search_vector(product):
+    """제품 한 건의 search_vector 갱신 (PostgreSQL에서만)"""
+    if not is_full_text_supported():
+        return
+    type(product)._base_manager.filter(pk=product.pk).update(search_vector=build_search_vector(product))
+
+
+def search_products(queryset, text):
+    """
+    검색어로 제품 필터링 후 관련도 순 정렬
+
+    PostgreSQL: search_vector @@ plainto_tsquery (모든 토큰 포함) + ts_rank
+    그 외: 모든 검색어가 이름/컨셉/설명 중 하나에 포함 + 이름 > 컨셉 > 설명 가중치
+    """
+    tokens = tokenize(text.strip())
+    if not tokens:
+        return queryset.none()
+
+    if is_full_text_supported():
+        query = SearchQuery(' '.join(tokens), config=get_config(), search_type='plain')
+        return queryset.filter(search_vector=query).annotate(
+            rank=SearchRank(F('search_vector'), query)
+        ).order_by('-rank', '-created_at', 'id')
+
+    terms = WORD_RE.findall(text.lower())
+    condition = Q()
+    for term in terms:
+        condition &= Q(name__icontains=term) | Q(concept__icontains=term) | Q(detail__icontains=term)
+    rank = sum(
+        Case(When(**{f'{field}__icontains': term}, then=Value(score)), default=Value(0), output_field=IntegerField())
+        for term in terms
+        for field, score in (('name', 3), ('concept', 2), ('detail', 1))
+    )
+    return queryset.filter(condition).annotate(rank=rank).order_by('-rank', '-created_at', 'id')
@@ -1,12 +1,26 @@
+from django.utils import timezone
 from rest_framework import serializers
-from .models import Product, Order
-from apps.accounts.serializers import UserSerializer
+from .models import Product, Order, ProductionStage
+from apps.accounts.serializers import CachedUserField
+from apps.core.serializers import SparseFieldsetMixin
 
-class ProductSerializer(serializers.ModelSerializer):
+class ProductSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """제품 시리얼라이저"""
-    designer_info = UserSerializer(source='designer', read_only=True)
+    # 디자이너 행을 JOIN하지 않고 사용자 캐시에서 읽음
+    designer_info = CachedUserField(source='designer_id')
     image_url = serializers.SerializerMethodField()
     work_sheet_url = serializers.SerializerMethodField()
+
+    sparse_field_sources = {
+        'designer_info': ('designer',),
+        'image_url': ('image_path',),
+        'work_sheet_url': ('work_sheet_path',),
+    }
+    # 컴파일된 목록 직렬화(ValuesPlan)용 파일 URL 필드
+    file_url_fields = {
+        'image_url': 'image_path',
+        'work_sheet_url': 'work_sheet_path',
+    }
     
     class Meta:
         model = Product
@@ -105,6 +119,10 @@ class ProductListSerializer(serializers.ModelSerializer):
     """제품 목록용 간단한 시리얼라이저"""
     designer_name = serializers.CharField(source='designer.name', read_only=True)
     image_url = serializers.SerializerMethodField()
+
+    file_url_fields = {
+        'image_url': 'image_path',
+    }
     
     class Meta:
         model = Product
@@ -124,15 +142,23 @@ class ProductListSerializer(serializers.ModelSerializer):
         return None
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """주문 시리얼라이저"""
     product_info = ProductListSerializer(source='product', read_only=True)
     receipt_url = serializers.SerializerMethodField()
+
+    sparse_field_sources = {
+        'product_info': ('product',),
+        'receipt_url': ('receipt_path',),
+    }
+    file_url_fields = {
+        'receipt_url': 'receipt_path',
+    }
     
     class Meta:
         model = Order
         fields = [
-            'id', 'order_id', 'product', 'product_info', 'status', 
+            'id', 'order_id', 'product', 'product_info', 'factory', 'status', 
             'quantity', 'unit_price', 'total_price', 'receipt_path', 
             'receipt_url', 'notes', 'customer_name', 'customer_contact', 
             'customer_email', 'shipping_address', 'shipping_method', 
@@ -156,7 +182,7 @@ class OrderCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Order
         fields = [
-            'product', 'quantity', 'unit_price', 'receipt_path', 'notes',
+            'product', 'factory', 'quantity', 'unit_price', 'receipt_path', 'notes',
             'customer_name', 'customer_contact', 'customer_email',
             'shipping_address', 'shipping_method', 'shipping_cost'
         ]
@@ -171,4 +197,97 @@ class OrderCreateSerializer(serializers.ModelSerializer):
         """단가 검증"""
         if value is not None and value <= 0:
             raise serializers.ValidationError("단가는 0보다 커야 합니다.")
-        return value
\ No newline at end of file
+        return value
+
+class PrefetchedProductField(serializers.PrimaryKeyRelatedField):
+    """
+    context['products']에 미리 조회해 둔 제품에서 찾는 PK 필드
+
+    대량 주문 생성 시 항목마다 제품을 조회하지 않도록 사용합니다.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        product = self.context.get('products', {}).get(pk)
+        if product is None:
+            self.fail('does_not_exist', pk_value=data)
+        return product
+
+
+class BulkOrderItemSerializer(OrderCreateSerializer):
+    """대량 주문 생성 항목 시리얼라이저 (검증 규칙은 OrderCreateSerializer와 동일)"""
+    product = PrefetchedProductField(queryset=Product.objects.all())
+
+    class Meta(OrderCreateSerializer.Meta):
+        pass
+
+
+class ProductionStageUpdateSerializer(serializers.ModelSerializer):
+    """생산 단계 수정용 시리얼라이저"""
+
+    class Meta:
+        model = ProductionStage
+        fields = ['status', 'end_date', 'delivery_code']
+
+    def validate(self, attrs):
+        """송장 번호는 배송 단계에서만 입력 가능"""
+        if attrs.get('delivery_code') and self.context.get('stage_index') != ProductionStage.DELIVERY_STAGE:
+            raise serializers.ValidationError("송장 번호는 배송 단계에서만 입력할 수 있습니다.")
+        return attrs
+
+
+class FactoryOrderSerializer(serializers.ModelSerializer):
+    """
+    공장 주문 관리 화면용 시리얼라이저 (factory_order_managing_schema.json 형식)
+
+    stage는 prefetch된 order.stages(요청한 phase만)로 6단계를 모두 채우며,
+    저장되지 않은 단계는 대기 상태로 반환합니다.
+    """
+    factory_id = serializers.CharField(source='factory.user_id', read_only=True, default=None)
+    title = serializers.SerializerMethodField()
+    product_name = serializers.CharField(source='product.name', read_only=True)
+    designer_name = serializers.CharField(source='product.designer.name', read_only=True)
+    designer_contact = serializers.CharField(source='product.designer.contact', read_only=True)
+    order_date = serializers.SerializerMethodField()
+    due_date = serializers.DateField(source='product.due_date', read_only=True)
+    stage = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Order
+        fields = [
+            'factory_id', 'order_id', 'title', 'product_name', 'designer_name',
+            'designer_contact', 'order_date', 'due_date', 'stage'
+        ]
+
+    def get_phase(self):
+        return self.context.get('phase', 'sample')
+
+    def get_title(self, obj):
+        return f"{dict(ProductionStage.PHASE_CHOICES)[self.get_phase()]} 현황"
+
+    def get_order_date(self, obj):
+        return timezone.localdate(obj.created_at).isoformat()
+
+    def get_stage(self, obj):
+        """prefetch된 단계로 1~6단계 목록 구성"""
+        phase = self.get_phase()
+        saved = {stage.stage_index: stage for stage in obj.stages.all() if stage.phase == phase}
+        stages = []
+        for index, name in ProductionStage.STAGE_NAMES.items():
+            stage = saved.get(index)
+            item = {
+                'index': index,
+                'name': name,
+                'status': stage.status if stage else 'pending',
+                'end_date': stage.end_date.isoformat() if stage and stage.end_date else None,
+            }
+            if index == ProductionStage.DELIVERY_STAGE:
+                item['delivery_code'] = stage.delivery_code if stage else None
+            stages.append(item)
+        return stages
+
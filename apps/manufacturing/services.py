@@ -0,0 +1,181 @@
+"""
+manufacturing 앱의 비즈니스 로직을 담당하는 서비스 레이어
+"""
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from . import progress, rollups
+from .cache import ORDER_NAMESPACE, invalidate_lists
+from .models import Product, Order, OrderProgressSnapshot
+from .serializers import BulkOrderItemSerializer
+
+
+class OrderService:
+    """
+    주문 관련 비즈니스 로직을 처리하는 서비스
+    """
+
+    @staticmethod
+    def bulk_create_orders(items: list, atomic: bool = False, context: dict = None) -> dict:
+        """
+        주문 대량 생성
+
+        항목별로 OrderCreateSerializer와 같은 규칙으로 검증한 뒤, 유효한 항목을
+        하나의 트랜잭션 안에서 bulk_create로 한 번에 INSERT 합니다.
+        Order.save()를 거치지 않으므로 order_id/total_price/designer를 여기서 채우고,
+        post_save 시그널이 발생하지 않으니 주문 집계, 진행 현황 스냅샷, 목록 캐시도 직접 갱신합니다.
+
+        Args:
+            items (list): 주문 데이터 목록
+            atomic (bool): True면 하나라도 실패 시 전체를 생성하지 않음
+            context (dict): 시리얼라이저 context (request 등)
+
+        Returns:
+            dict: {'created': [Order, ...], 'errors': [{'index': int, 'errors': dict}, ...]}
+
+        Raises:
+            serializers.ValidationError: 요청 형식이 잘못되었거나 최대 건수를 넘은 경우
+        """
+        if not isinstance(items, list) or not items:
+            raise serializers.ValidationError('주문 목록이 필요합니다.')
+
+        max_size = getattr(settings, 'ORDER_BULK_CREATE_MAX_SIZE', 500)
+        if len(items) > max_size:
+            raise serializers.ValidationError(f'한 번에 최대 {max_size}건까지 생성할 수 있습니다.')
+
+        # 항목별 제품 조회를 피하기 위해 참조된 제품을 한 번에 조회
+        product_ids = set()
+        for item in items:
+            if isinstance(item, dict):
+                try:
+                    product_ids.add(int(item.get('product')))
+                except (TypeError, ValueError):
+                    pass
+        products = Product.objects.select_related('designer').in_bulk(product_ids)
+
+        context = dict(context or {}, products=products)
+        orders, errors = [], []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                errors.append({'index': index, 'errors': {'non_field_errors': ['잘못된 주문 데이터입니다.']}})
+                continue
+            serializer = BulkOrderItemSerializer(data=item, context=context)
+            if not serializer.is_valid():
+                errors.append({'index': index, 'errors': serializer.errors})
+                continue
+            orders.append(Order(**serializer.validated_data))
+
+        if errors and atomic:
+            return {'created': [], 'errors': errors}
+        if not orders:
+            return {'created': [], 'errors': errors}
+
+        # Order.save()의 주문 번호/총 금액/디자이너 동기화를 일괄 적용
+        now = timezone.now()
+        for order in orders:
+            order.order_id = Order.generate_order_id(now)
+            order.total_price = Order.compute_total_price(order.unit_price, order.quantity)
+            order.designer_id = order.product.designer_id
+
+        with transaction.atomic():
+            created = Order.objects.bulk_create(orders)
+            OrderProgressSnapshot.objects.bulk_create([progress.make_snapshot(order) for order in created])
+
+            delta = rollups.RollupDelta()
+            for order in created:
+                delta.add(rollups.order_state(order))
+            delta.apply()
+
+        invalidate_lists([ORDER_NAMESPACE], {order.designer_id for order in created})
+
+        return {'created': created, 'errors': errors}
+
+    @staticmethod
+    def bulk_transition_status(order_ids: list, status: str) -> dict:
+        """
+        주문 상태 일괄 변경
+
+        현재 상태를 한 번에 조회해 ALLOWED_TRANSITIONS로 검증한 뒤, 변경 가능한 주문을
+        단일 조건부 UPDATE (... WHERE id IN (...) AND status IN (...))로 변경합니다.
+        조회와 UPDATE 사이에 다른 요청이 상태를 바꾼 주문은 conflict로 보고합니다.
+        QuerySet.update()는 시그널과 auto_now를 거치지 않으므로 updated_at,
+        주문 집계, 진행 현황 스냅샷 갱신, 목록 캐시 무효화는 여기서 처리합니다.
+
+        Args:
+            order_ids (list): 주문 ID 목록
+            status (str): 변경할 상태
+
+        Returns:
+            dict: {'status': str, 'updated': int, 'results': [{'id', 'outcome', 'status'}, ...]}
+                  outcome은 updated / not_found / invalid_transition / conflict 중 하나
+
+        Raises:
+            serializers.ValidationError: 상태 값이나 ID 목록이 잘못된 경우
+        """
+        if status not in dict(Order.STATUS_CHOICES):
+            raise serializers.ValidationError(f'알 수 없는 주문 상태입니다: {status}')
+        if not isinstance(order_ids, list) or not order_ids:
+            raise serializers.ValidationError('주문 ID 목록이 필요합니다.')
+
+        max_size = getattr(settings, 'ORDER_BULK_TRANSITION_MAX_SIZE', 10000)
+        if len(order_ids) > max_size:
+            raise serializers.ValidationError(f'한 번에 최대 {max_size}건까지 변경할 수 있습니다.')
+
+        try:
+            ids = list(dict.fromkeys(int(order_id) for order_id in order_ids))
+        except (TypeError, ValueError):
+            raise serializers.ValidationError('주문 ID는 정수여야 합니다.')
+
+        sources = Order.source_statuses(status)
+        updated_ids = set()
+        with transaction.atomic():
+            # 집계 변화량을 정확히 계산하기 위해 변경 대상 주문 행을 잠그고 현재 상태 조회
+            current = rollups.load_order_states(
+                Order.objects.filter(id__in=ids).select_for_update(of=('self',))
+            )
+            eligible = [order_id for order_id in ids if order_id in current and current[order_id]['status'] in sources]
+
+            if eligible:
+                now = timezone.now()
+                updated = Order.objects.filter(id__in=eligible, status__in=sources).update(
+                    status=status, updated_at=now
+                )
+                if updated == len(eligible):
+                    updated_ids = set(eligible)
+                else:
+                    # 동시 변경으로 일부만 반영된 경우 실제로 바뀐 행만 다시 확인
+                    updated_ids = set(Order.objects.filter(
+                        id__in=eligible, status=status, updated_at=now
+                    ).values_list('id', flat=True))
+
+                delta = rollups.RollupDelta()
+                for order_id in updated_ids:
+                    delta.move(current[order_id], dict(current[order_id], status=status))
+                delta.apply()
+
+                progress.update_snapshots(
+                    OrderProgressSnapshot.objects.filter(order_id__in=updated_ids),
+                    lambda document: progress.patch_order_status(document, status),
+                )
+
+        if updated_ids:
+            invalidate_lists([ORDER_NAMESPACE], {current[order_id]['designer_id'] for order_id in updated_ids})
+
+        results = []
+        for order_id in ids:
+            if order_id not in current:
+                results.append({'id': order_id, 'outcome': 'not_found', 'status': None})
+            elif order_id in updated_ids:
+                results.append({'id': order_id, 'outcome': 'updated', 'status': status})
+            elif order_id in eligible:
+                results.append({'id': order_id, 'outcome': 'conflict', 'status': None})
+            else:
+                results.append({
+                    'id': order_id, 'outcome': 'invalid_transition', 'status': current[order_id]['status'],
+                })
+
+        return {'status': status, 'updated': len(updated_ids), 'results': results}
+
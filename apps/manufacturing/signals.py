@@ -0,0 +1,148 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import progress, rollups, search
+from .cache import ORDER_NAMESPACE, PRODUCT_NAMESPACE, invalidate_lists
+from .models import Product, Order, OrderProgressSnapshot, ProductionStage
+
+
+@receiver([post_save, post_delete], sender=Product)
+def invalidate_product_lists(sender, instance, **kwargs):
+    """제품 변경 시 제품 목록과 (product_info를 포함한) 주문 목록 캐시 무효화"""
+    designer_ids = {instance.designer_id, getattr(instance, '_loaded_designer_id', None)}
+    invalidate_lists([PRODUCT_NAMESPACE, ORDER_NAMESPACE], designer_ids)
+
+
+@receiver([post_save, post_delete], sender=Order)
+def invalidate_order_lists(sender, instance, **kwargs):
+    """주문 변경 시 주문 목록 캐시 무효화"""
+    invalidate_lists([ORDER_NAMESPACE], [instance.designer_id])
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_designer_lists(sender, instance, created, update_fields=None, **kwargs):
+    """디자이너 정보(designer_info, designer_name)가 바뀌면 관련 목록 캐시 무효화 (로그인 시각 갱신은 제외)"""
+    if created or instance.user_type != 'designer':
+        return
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    invalidate_lists([PRODUCT_NAMESPACE, ORDER_NAMESPACE], [instance.pk])
+
+
+@receiver(post_save, sender=Order)
+def update_order_progress(sender, instance, created, **kwargs):
+    """주문 진행 현황 스냅샷 생성/갱신"""
+    if created:
+        progress.make_snapshot(instance).save(force_insert=True)
+        return
+
+    def patch(document):
+        # 다른 제품으로 바뀐 경우 제품명/디자이너도 반영 (문서의 product_id와 비교)
+        if document['product_id'] != str(instance.product_id):
+            product = instance.product
+            progress.patch_product(document, product)
+            progress.patch_designer(document, product.designer)
+        progress.patch_order(document, instance)
+
+    progress.update_snapshot(
+        instance.pk, patch, designer_id=instance.designer_id, factory_id=instance.factory_id,
+    )
+
+
+@receiver(post_save, sender=ProductionStage)
+def update_stage_progress(sender, instance, **kwargs):
+    progress.update_snapshot(instance.order_id, lambda document: progress.patch_stage(document, instance))
+
+
+@receiver(post_delete, sender=ProductionStage)
+def reset_stage_progress(sender, instance, **kwargs):
+    progress.update_snapshot(
+        instance.order_id, lambda document: progress.patch_stage(document, instance, deleted=True)
+    )
+
+
+@receiver(post_save, sender=Product)
+def update_product_progress(sender, instance, created, **kwargs):
+    """제품명/디자이너 변경을 해당 제품 주문들의 스냅샷에 반영"""
+    if created:
+        return
+    snapshots = OrderProgressSnapshot.objects.filter(order__product=instance)
+    if instance.designer_id != getattr(instance, '_loaded_designer_id', instance.designer_id):
+        designer = instance.designer
+
+        def patch(document):
+            progress.patch_product(document, instance)
+            progress.patch_designer(document, designer)
+
+        progress.update_snapshots(snapshots, patch, designer_id=instance.designer_id)
+    else:
+        progress.update_snapshots(snapshots, lambda document: progress.patch_product(document, instance))
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def update_user_progress(sender, instance, created, update_fields=None, **kwargs):
+    """공장/디자이너 정보 변경을 관련 스냅샷에 반영 (로그인 시각 갱신은 제외)"""
+    if created or (update_fields and set(update_fields) <= {'last_login'}):
+        return
+    if instance.user_type == 'factory':
+        progress.update_snapshots(
+            OrderProgressSnapshot.objects.filter(factory=instance),
+            lambda document: progress.patch_factory(document, instance),
+        )
+    elif instance.user_type == 'designer':
+        progress.update_snapshots(
+            OrderProgressSnapshot.objects.filter(designer=instance),
+            lambda document: progress.patch_designer(document, instance),
+        )
+
+
+@receiver(pre_save, sender=Order)
+def load_order_rollup_state(sender, instance, raw=False, **kwargs):
+    """집계 변화량 계산을 위해 저장 전 상태 조회"""
+    if raw or instance._state.adding or instance.pk is None:
+        instance._rollup_state = None
+        return
+    instance._rollup_state = rollups.load_order_states(Order.objects.filter(pk=instance.pk)).get(instance.pk)
+
+
+@receiver(post_save, sender=Order)
+def update_order_rollups(sender, instance, created, raw=False, **kwargs):
+    """주문 생성/수정/상태 변경을 집계에 반영 (Order.save의 트랜잭션 안에서 실행)"""
+    if raw:
+        return
+    delta = rollups.RollupDelta()
+    delta.move(getattr(instance, '_rollup_state', None), rollups.order_state(instance))
+    delta.apply()
+    instance._rollup_state = None
+
+
+@receiver(post_delete, sender=Order)
+def remove_order_rollups(sender, instance, **kwargs):
+    delta = rollups.RollupDelta()
+    delta.add(rollups.order_state(instance), -1)
+    delta.apply()
+
+
+@receiver(post_save, sender=Product)
+def move_product_rollups(sender, instance, created, raw=False, **kwargs):
+    """제품의 디자이너/시즌/타겟이 바뀌면 해당 주문들의 집계를 새 키로 이동"""
+    if created or raw or not hasattr(instance, '_loaded_season'):
+        return
+    old_values = {
+        'designer_id': instance._loaded_designer_id,
+        'season': instance._loaded_season,
+        'target': instance._loaded_target,
+    }
+    if old_values == {'designer_id': instance.designer_id, 'season': instance.season, 'target': instance.target}:
+        return
+    rollups.product_delta(instance, old_values).apply()
+
+
+@receiver(post_save, sender=Product)
+def update_product_search_vector(sender, instance, update_fields=None, raw=False, **kwargs):
+    """제품명/컨셉/설명이 저장되면 검색 벡터 갱신"""
+    if raw or (update_fields and not set(update_fields) & {'name', 'concept', 'detail'}):
+        return
+    search.update_search_vector(instance)
+
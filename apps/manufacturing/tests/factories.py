@@ -0,0 +1,22 @@
+from decimal import Decimal
+
+from apps.manufacturing.models import Product, Order
+
+
+def create_product(designer, **kwargs):
+    """테스트용 제품 생성"""
+    data = {
+        'name': '테스트 셔츠',
+        'season': 'summer',
+        'target': 'twenties',
+        'concept': '린넨 오버핏 셔츠',
+    }
+    data.update(kwargs)
+    return Product.objects.create(designer=designer, **data)
+
+
+def create_order(product, **kwargs):
+    """테스트용 주문 생성"""
+    data = {'quantity': 10, 'unit_price': Decimal('15000.00')}
+    data.update(kwargs)
+    return Order.objects.create(product=product, **data)
@@ -0,0 +1,118 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.manufacturing.models import Order
+from .factories import create_order, create_product
+
+User = get_user_model()
+
+
+class AdminSearchTest(TestCase):
+    """트라이그램 인덱스용 관리자 검색 테스트"""
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser(user_id='admin', name='관리자', password='testpass123')
+        self.client.force_login(self.admin)
+        self.designer = User.objects.create_user(user_id='linen_lab', name='김디자', user_type='designer')
+        self.other = User.objects.create_user(user_id='denim_lab', name='박디자', user_type='designer')
+        self.linen = create_product(self.designer, name='린넨 셔츠')
+        self.denim = create_product(self.other, name='데님 팬츠')
+
+    def search(self, model, q):
+        url = reverse(f'admin:manufacturing_{model}_changelist')
+        response = self.client.get(url, {'q': q})
+        self.assertEqual(response.status_code, 200)
+        return list(response.context['cl'].result_list)
+
+    def test_product_search_by_own_and_related_fields(self):
+        self.assertEqual(self.search('product', '린넨'), [self.linen])
+        self.assertEqual(self.search('product', '박디자'), [self.denim])
+        self.assertEqual(self.search('product', 'linen_'), [self.linen])
+        self.assertEqual(self.search('product', '셔츠 김디자'), [self.linen])
+
+    def test_related_fields_use_in_subquery(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.search('product', '박디자')
+        search_sql = [query['sql'] for query in queries if '박디자' in query['sql']]
+        self.assertTrue(search_sql)
+        self.assertTrue(all('"designer_id" IN (SELECT' in sql for sql in search_sql))
+
+    def test_order_search(self):
+        linen_order = create_order(self.linen)
+        denim_order = create_order(self.denim)
+        self.assertEqual(self.search('order', '데님'), [denim_order])
+        self.assertEqual(self.search('order', linen_order.order_id[:12]), [denim_order, linen_order])
+
+    def test_exact_order_id_short_circuits(self):
+        order = create_order(self.linen)
+        create_order(self.denim)
+        with CaptureQueriesContext(connection) as queries:
+            result = self.search('order', order.order_id)
+        self.assertEqual(result, [order])
+        self.assertFalse(any('LIKE' in query['sql'] for query in queries))
+
+
+class AdminChangelistTest(TestCase):
+    """관리자 목록 쿼리 수 / 일괄 상태 변경 테스트"""
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser(user_id='admin', name='관리자', password='testpass123')
+        self.client.force_login(self.admin)
+        self.count = 0
+
+    def add_rows(self, n):
+        for _ in range(n):
+            self.count += 1
+            designer = User.objects.create_user(
+                user_id=f'designer{self.count}', name=f'디자이너{self.count}', user_type='designer'
+            )
+            create_order(create_product(designer))
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_changelist_query_count_is_constant(self):
+        for model in ('product', 'order'):
+            url = reverse(f'admin:manufacturing_{model}_changelist')
+            self.add_rows(2)
+            small = self.count_queries(url)
+            self.add_rows(10)
+            self.assertEqual(self.count_queries(url), small, model)
+
+        url = reverse('admin:accounts_user_changelist')
+        small = self.count_queries(url)
+        self.add_rows(10)
+        self.assertEqual(self.count_queries(url), small)
+
+    def test_change_form_does_not_load_all_choices(self):
+        self.add_rows(1)
+        url = reverse('admin:manufacturing_order_change', args=[Order.objects.get().pk])
+        # 첫 요청의 ContentType 캐시 조회 등을 제외
+        self.count_queries(url)
+        small = self.count_queries(url)
+        self.add_rows(10)
+        self.assertEqual(self.count_queries(url), small)
+
+    def test_bulk_status_action(self):
+        self.add_rows(2)
+        orders = list(Order.objects.all())
+        orders[1].status = 'completed'
+        orders[1].save()
+
+        response = self.client.post(reverse('admin:manufacturing_order_changelist'), {
+            'action': 'mark_confirmed',
+            '_selected_action': [order.pk for order in orders],
+        }, follow=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            dict(Order.objects.values_list('pk', 'status')),
+            {orders[0].pk: 'confirmed', orders[1].pk: 'completed'},
+        )
+        self.assertEqual(len(list(response.context['messages'])), 2)
@@ -0,0 +1,524 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.accounts.cache import get_users
+from apps.core.cache import get_cache_metrics, reset_cache_metrics
+from apps.manufacturing.models import Product, Order, ProductionStage
+from tests.utils import QueryCountGuardMixin
+from .factories import create_order, create_product
+
+User = get_user_model()
+
+
+class ManufacturingAPITestCase(TestCase):
+    def setUp(self):
+        """테스트 데이터 설정"""
+        cache.clear()
+        self.client = APIClient()
+        self.designer = User.objects.create_user(
+            user_id='designer1', name='디자이너', user_type='designer', password='testpass123'
+        )
+        self.factory = User.objects.create_user(
+            user_id='factory1', name='공장주', user_type='factory', password='testpass123'
+        )
+
+    def add_products(self, n):
+        for _ in range(n):
+            create_product(self.designer)
+
+    def add_orders(self, n):
+        for _ in range(n):
+            designer = User.objects.create_user(
+                user_id=f'd{User.objects.count()}', name='디자이너', user_type='designer'
+            )
+            create_order(create_product(designer))
+
+
+class QueryPlanTest(QueryCountGuardMixin, ManufacturingAPITestCase):
+    """목록/상세 조회 쿼리 수가 행 수와 무관한지 확인"""
+
+    def test_product_list_queries_constant(self):
+        self.client.force_authenticate(self.factory)
+        # designer_info는 사용자 캐시에서 읽으므로 첫 요청에만 사용자 조회가 추가되지 않도록 미리 채움
+        get_users([self.designer.pk])
+        self.assertConstantQueries(reverse('product-list'), self.add_products)
+
+    def test_order_list_queries_constant_for_factory(self):
+        self.client.force_authenticate(self.factory)
+        self.assertConstantQueries(reverse('order-list'), self.add_orders)
+
+    def test_order_list_queries_constant_for_designer(self):
+        self.client.force_authenticate(self.designer)
+
+        def add_own_orders(n):
+            for _ in range(n):
+                create_order(create_product(self.designer))
+
+        self.assertConstantQueries(reverse('order-list'), add_own_orders)
+
+    def test_order_detail_single_query(self):
+        order = create_order(create_product(self.designer))
+        self.client.force_authenticate(self.factory)
+        url = reverse('order-detail', args=[order.pk])
+        # 조건부 GET 검증자 조회 + 본 조회
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['product_info']['designer_name'], '디자이너')
+
+
+class KeysetPaginationTest(ManufacturingAPITestCase):
+    """키셋 페이지네이션 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(self.factory)
+        self.products = [create_product(self.designer) for _ in range(5)]
+        # 동일한 created_at을 가진 행도 누락/중복 없이 순회되어야 함
+        same_time = self.products[0].created_at
+        Product.objects.filter(pk__in=[p.pk for p in self.products[1:3]]).update(created_at=same_time)
+
+    def collect_ids(self, url):
+        ids, pages = [], 0
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn('count', response.data)
+            ids.extend(row['id'] for row in response.data['results'])
+            url = response.data['next']
+            pages += 1
+        return ids, pages
+
+    def test_cursor_walk_matches_ordering(self):
+        expected = list(
+            Product.objects.order_by('-created_at', 'id').values_list('id', flat=True)
+        )
+        ids, pages = self.collect_ids(reverse('product-list') + '?pagination=cursor&page_size=2')
+        self.assertEqual(ids, expected)
+        self.assertEqual(pages, 3)
+
+    def test_previous_link_returns_previous_page(self):
+        url = reverse('product-list') + '?pagination=cursor&page_size=2'
+        first = self.client.get(url).data
+        self.assertIsNone(first['previous'])
+        second = self.client.get(first['next']).data
+        back = self.client.get(second['previous']).data
+        self.assertEqual(
+            [row['id'] for row in back['results']],
+            [row['id'] for row in first['results']],
+        )
+
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse('product-list') + '?cursor=not-a-cursor')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_number_still_default(self):
+        response = self.client.get(reverse('order-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('count', response.data)
+
+
+class SparseFieldsetTest(ManufacturingAPITestCase):
+    """?fields= / ?omit= 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(self.factory)
+        create_order(create_product(self.designer, memo='긴 메모', fabric={'type': 'cotton'}))
+
+    def test_fields_trims_output_and_columns(self):
+        url = reverse('product-list') + '?fields=id,name,imageUrl'
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data['results'][0]), {'id', 'name', 'image_url'})
+        select_sql = ctx.captured_queries[-1]['sql']
+        self.assertNotIn('"concept"', select_sql)
+        self.assertNotIn('"fabric"', select_sql)
+        self.assertNotIn('JOIN', select_sql)
+
+    def test_omit_removes_fields(self):
+        response = self.client.get(reverse('product-list') + '?omit=concept,detail,memo,designerInfo')
+        row = response.data['results'][0]
+        for name in ('concept', 'detail', 'memo', 'designer_info'):
+            self.assertNotIn(name, row)
+        self.assertIn('fabric', row)
+
+    def test_order_fields_with_nested_product(self):
+        response = self.client.get(reverse('order-list') + '?fields=order_id,product_info')
+        row = response.data['results'][0]
+        self.assertEqual(set(row), {'order_id', 'product_info'})
+        self.assertEqual(row['product_info']['designer_name'], '디자이너')
+
+    def test_sparse_fields_with_cursor_pagination(self):
+        # 본 조회만 실행 (목록 검증자는 캐시 세대 번호, 커서용 created_at 추가 조회 없음)
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('order-list') + '?fields=status&pagination=cursor')
+        self.assertEqual(response.data['results'], [{'status': 'pending'}])
+
+
+class ConditionalGetTest(ManufacturingAPITestCase):
+    """ETag / Last-Modified 조건부 GET 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(self.factory)
+        self.product = create_product(self.designer)
+        self.order = create_order(self.product)
+
+    def test_retrieve_not_modified(self):
+        url = reverse('order-detail', args=[self.order.pk])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('Last-Modified', response)
+
+        # 검증자 조회 한 번만 실행되고 직렬화는 일어나지 않음
+        with self.assertNumQueries(1):
+            cached = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(cached['ETag'], response['ETag'])
+
+    def test_list_not_modified_until_change(self):
+        url = reverse('order-list')
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED
+        )
+
+        # 중첩된 제품 정보가 바뀌어도 새 응답을 받아야 함
+        self.product.name = '새 이름'
+        self.product.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['product_info']['name'], '새 이름')
+
+    def test_list_etag_changes_on_designer_change(self):
+        url = reverse('order-list')
+        etag = self.client.get(url)['ETag']
+
+        self.designer.name = '새 디자이너'
+        self.designer.save()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['product_info']['designer_name'], '새 디자이너')
+
+    def test_list_etag_changes_on_delete(self):
+        create_order(self.product)
+        url = reverse('order-list')
+        etag = self.client.get(url)['ETag']
+        Order.objects.filter(pk=self.order.pk).delete()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK)
+
+    def test_etag_varies_with_query_and_user(self):
+        url = reverse('product-list')
+        etag = self.client.get(url)['ETag']
+        self.assertNotEqual(etag, self.client.get(url + '?fields=id')['ETag'])
+        self.client.force_authenticate(self.designer)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK)
+
+    def test_missing_object_returns_404(self):
+        response = self.client.get(reverse('order-detail', args=[self.order.pk + 100]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_non_numeric_pk_returns_404(self):
+        for basename in ('product', 'order'):
+            response = self.client.get(reverse(f'{basename}-detail', args=['abc']))
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ListCacheTest(ManufacturingAPITestCase):
+    """사용자별 목록 응답 캐시 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        reset_cache_metrics('list_cache')
+        self.other_designer = User.objects.create_user(
+            user_id='designer2', name='다른 디자이너', user_type='designer'
+        )
+        self.product = create_product(self.designer)
+        self.order = create_order(self.product)
+
+    def test_second_request_hits_cache(self):
+        self.client.force_authenticate(self.designer)
+        url = reverse('order-list')
+        self.assertEqual(self.client.get(url)['X-Cache'], 'MISS')
+        # 목록 검증자도 캐시 세대 번호로 만들므로 DB 조회 없음
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(response['X-Cache'], 'HIT')
+        self.assertEqual(response.data['results'][0]['order_id'], self.order.order_id)
+        self.assertEqual(get_cache_metrics('list_cache'), {'hits': 1, 'misses': 1, 'hit_rate': 0.5})
+
+    def test_cache_is_per_user_and_query(self):
+        url = reverse('product-list')
+        self.client.force_authenticate(self.designer)
+        self.client.get(url)
+        self.assertEqual(self.client.get(url + '?fields=id')['X-Cache'], 'MISS')
+        self.client.force_authenticate(self.factory)
+        self.assertEqual(self.client.get(url)['X-Cache'], 'MISS')
+
+    def test_save_invalidates_owner_and_factory_lists(self):
+        url = reverse('order-list')
+        for user in (self.designer, self.factory):
+            self.client.force_authenticate(user)
+            self.client.get(url)
+
+        self.order.status = 'confirmed'
+        self.order.save()
+
+        for user in (self.designer, self.factory):
+            self.client.force_authenticate(user)
+            response = self.client.get(url)
+            self.assertEqual(response['X-Cache'], 'MISS')
+            self.assertEqual(response.data['results'][0]['status'], 'confirmed')
+
+    def test_list_cached_before_commit_invalidated(self):
+        url = reverse('order-list')
+        self.client.force_authenticate(self.designer)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.order.status = 'confirmed'
+            self.order.save()
+            # 커밋 전에 다른 요청이 새 세대 번호로 캐시한 응답
+            self.assertEqual(self.client.get(url)['X-Cache'], 'MISS')
+            self.assertEqual(self.client.get(url)['X-Cache'], 'HIT')
+
+        self.assertEqual(self.client.get(url)['X-Cache'], 'MISS')
+
+    def test_last_login_update_keeps_cache(self):
+        url = reverse('product-list')
+        self.client.force_authenticate(self.designer)
+        self.client.get(url)
+
+        self.designer.save(update_fields=['last_login'])
+
+        self.assertEqual(self.client.get(url)['X-Cache'], 'HIT')
+
+    def test_other_designer_changes_keep_cache(self):
+        url = reverse('product-list')
+        self.client.force_authenticate(self.designer)
+        self.client.get(url)
+        create_product(self.other_designer)
+        self.assertEqual(self.client.get(url)['X-Cache'], 'HIT')
+
+    def test_product_change_invalidates_order_lists(self):
+        url = reverse('order-list')
+        self.client.force_authenticate(self.designer)
+        self.client.get(url)
+        self.product.name = '새 이름'
+        self.product.save()
+        response = self.client.get(url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['results'][0]['product_info']['name'], '새 이름')
+
+
+class BulkOrderCreateTest(ManufacturingAPITestCase):
+    """주문 대량 생성 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.product = create_product(self.designer)
+        self.url = reverse('order-bulk-create')
+        self.client.force_authenticate(self.factory)
+
+    def items(self, count, **kwargs):
+        item = {'product': self.product.pk, 'quantity': 3, 'unit_price': '1000.00'}
+        item.update(kwargs)
+        return [dict(item) for _ in range(count)]
+
+    def test_creates_orders_like_save(self):
+        response = self.client.post(self.url, self.items(3), format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data['created']), 3)
+        orders = Order.objects.all()
+        self.assertEqual(orders.count(), 3)
+        for order in orders:
+            self.assertRegex(order.order_id, r'^ORD-\d{8}-[0-9A-F]{8}$')
+            self.assertEqual(str(order.total_price), '3000.00')
+            self.assertEqual(order.designer_id, self.designer.pk)
+        self.assertEqual(len({order.order_id for order in orders}), 3)
+
+    def test_partial_errors_do_not_abort_batch(self):
+        items = self.items(2) + [{'product': 9999, 'quantity': 1}, {'product': self.product.pk, 'quantity': 0}]
+        response = self.client.post(self.url, {'orders': items}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(Order.objects.count(), 2)
+        self.assertEqual([error['index'] for error in response.data['errors']], [2, 3])
+        self.assertIn('product', response.data['errors'][0]['errors'])
+        self.assertIn('quantity', response.data['errors'][1]['errors'])
+
+    def test_atomic_mode_rejects_whole_batch(self):
+        items = self.items(2) + [{'product': self.product.pk, 'quantity': 0}]
+        response = self.client.post(self.url, {'orders': items, 'atomic': True}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Order.objects.count(), 0)
+        self.assertEqual(response.data['errors'][0]['index'], 2)
+
+    def test_query_count_does_not_grow_with_batch(self):
+        # 집계 행이 처음 생성될 때의 INSERT를 제외하기 위해 한 번 먼저 요청
+        self.client.post(self.url, self.items(1), format='json')
+        with CaptureQueriesContext(connection) as small:
+            self.client.post(self.url, self.items(2), format='json')
+        with CaptureQueriesContext(connection) as large:
+            self.client.post(self.url, self.items(20), format='json')
+        self.assertEqual(len(small), len(large))
+
+    def test_invalidates_order_list_cache(self):
+        list_url = reverse('order-list')
+        self.client.get(list_url)
+        self.client.post(self.url, self.items(1), format='json')
+        response = self.client.get(list_url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(len(response.data['results']), 1)
+
+
+class BulkOrderStatusTest(ManufacturingAPITestCase):
+    """주문 상태 일괄 변경 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.product = create_product(self.designer)
+        self.url = reverse('order-bulk-status')
+        self.client.force_authenticate(self.factory)
+
+    def test_applies_allowed_transitions_and_reports_outcomes(self):
+        confirmed = [create_order(self.product, status='confirmed') for _ in range(2)]
+        completed = create_order(self.product, status='completed')
+        ids = [order.pk for order in confirmed] + [completed.pk, 9999]
+
+        response = self.client.post(self.url, {'ids': ids, 'status': 'in_production'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated'], 2)
+        outcomes = {result['id']: result['outcome'] for result in response.data['results']}
+        self.assertEqual(outcomes, {
+            confirmed[0].pk: 'updated',
+            confirmed[1].pk: 'updated',
+            completed.pk: 'invalid_transition',
+            9999: 'not_found',
+        })
+        for order in confirmed:
+            order.refresh_from_db()
+            self.assertEqual(order.status, 'in_production')
+            self.assertGreater(order.updated_at, order.created_at)
+        completed.refresh_from_db()
+        self.assertEqual(completed.status, 'completed')
+
+    def test_query_count_does_not_grow_with_batch(self):
+        warmup = [create_order(self.product, status='confirmed').pk]
+        small = [create_order(self.product, status='confirmed').pk for _ in range(2)]
+        large = [create_order(self.product, status='confirmed').pk for _ in range(20)]
+        # 집계 행이 처음 생성될 때의 INSERT를 제외하기 위해 한 번 먼저 요청
+        self.client.post(self.url, {'ids': warmup, 'status': 'in_production'}, format='json')
+        with CaptureQueriesContext(connection) as small_queries:
+            self.client.post(self.url, {'ids': small, 'status': 'in_production'}, format='json')
+        with CaptureQueriesContext(connection) as large_queries:
+            self.client.post(self.url, {'ids': large, 'status': 'in_production'}, format='json')
+        self.assertEqual(len(small_queries), len(large_queries))
+
+    def test_rejects_unknown_status(self):
+        order = create_order(self.product)
+        response = self.client.post(self.url, {'ids': [order.pk], 'status': 'shipped'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_designer_forbidden(self):
+        order = create_order(self.product)
+        self.client.force_authenticate(self.designer)
+        response = self.client.post(self.url, {'ids': [order.pk], 'status': 'confirmed'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        order.refresh_from_db()
+        self.assertEqual(order.status, 'pending')
+
+
+class FactoryOrderTest(ManufacturingAPITestCase):
+    """공장 주문 관리 / 생산 단계 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.designer.contact = '010-1234-5678'
+        self.designer.save()
+        self.product = create_product(self.designer)
+        self.order = create_order(self.product, factory=self.factory)
+        self.url = reverse('order-factory')
+        self.client.force_authenticate(self.factory)
+
+    def stage_url(self, order, phase='sample', index=1):
+        return f"{reverse('order-detail', args=[order.pk])}stages/{phase}/{index}/"
+
+    def test_returns_schema_shape(self):
+        ProductionStage.objects.create(order=self.order, phase='sample', stage_index=1, status='done')
+        ProductionStage.objects.create(order=self.order, phase='main', stage_index=1, status='in_progress')
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        item = response.data['results'][0]
+        self.assertEqual(list(item), [
+            'factory_id', 'order_id', 'title', 'product_name', 'designer_name',
+            'designer_contact', 'order_date', 'due_date', 'stage',
+        ])
+        self.assertEqual(item['factory_id'], 'factory1')
+        self.assertEqual(item['title'], '샘플 생산 현황')
+        self.assertEqual(item['designer_contact'], '010-1234-5678')
+        self.assertEqual([stage['index'] for stage in item['stage']], [1, 2, 3, 4, 5, 6])
+        self.assertEqual(item['stage'][0], {'index': 1, 'name': '1차 가봉', 'status': 'done', 'end_date': None})
+        self.assertEqual(item['stage'][1]['status'], 'pending')
+        self.assertIn('delivery_code', item['stage'][5])
+
+        main = self.client.get(self.url + '?phase=main').data['results'][0]
+        self.assertEqual(main['title'], '본 생산 현황')
+        self.assertEqual(main['stage'][0]['status'], 'in_progress')
+
+    def test_only_assigned_orders(self):
+        create_order(self.product)
+        response = self.client.get(self.url)
+        self.assertEqual([item['order_id'] for item in response.data['results']], [self.order.order_id])
+
+    def test_constant_queries(self):
+        def add_orders(n):
+            for _ in range(n):
+                order = create_order(create_product(self.designer), factory=self.factory)
+                ProductionStage.objects.create(order=order, stage_index=1)
+
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(self.url)
+        add_orders(10)
+        with CaptureQueriesContext(connection) as large:
+            self.client.get(self.url)
+        self.assertEqual(len(small), len(large))
+
+    def test_stage_update_writes_single_row(self):
+        response = self.client.patch(self.stage_url(self.order, index=6), {
+            'status': 'done', 'end_date': '2024-01-19', 'delivery_code': 'CJ123',
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['delivery_code'], 'CJ123')
+
+        response = self.client.patch(self.stage_url(self.order, index=6), {'status': 'in_progress'}, format='json')
+        self.assertEqual(response.data['status'], 'in_progress')
+        stage = ProductionStage.objects.get(order=self.order, phase='sample', stage_index=6)
+        self.assertEqual(stage.delivery_code, 'CJ123')
+        self.assertEqual(ProductionStage.objects.filter(order=self.order).count(), 1)
+
+    def test_delivery_code_only_on_delivery_stage(self):
+        response = self.client.patch(self.stage_url(self.order, index=2), {'delivery_code': 'CJ123'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_stage_update_requires_assigned_factory(self):
+        other = create_order(self.product)
+        response = self.client.patch(self.stage_url(other), {'status': 'done'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        self.client.force_authenticate(self.designer)
+        response = self.client.patch(self.stage_url(self.order), {'status': 'done'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
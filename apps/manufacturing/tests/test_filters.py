@@ -0,0 +1,53 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from .factories import create_product
+
+User = get_user_model()
+
+
+class ProductJSONFilterTest(TestCase):
+    """원단/부자재 JSON 속성 필터 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.designer = User.objects.create_user(user_id='designer1', name='디자이너', user_type='designer')
+        self.client.force_authenticate(self.designer)
+        self.url = reverse('product-list')
+        self.cotton_ykk = create_product(
+            self.designer,
+            fabric={'type': 'cotton', 'count': '30수', 'weight': {'gsm': 180}},
+            material={'zipper': 'YKK', 'button': 'horn'},
+        )
+        self.cotton_plain = create_product(
+            self.designer, fabric={'type': 'cotton', 'count': '40수'}, material={'button': 'shell'}
+        )
+        self.linen = create_product(self.designer, fabric={'type': 'linen', 'stretch': True}, material=None)
+
+    def ids(self, params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return {item['id'] for item in response.data['results']}
+
+    def test_attribute_pairs(self):
+        params = {'fabric_attr': 'type:cotton,count:30수', 'material_attr': 'zipper:YKK'}
+        self.assertEqual(self.ids(params), {self.cotton_ykk.pk})
+        self.assertEqual(self.ids({'fabric_attr': 'type:cotton'}), {self.cotton_ykk.pk, self.cotton_plain.pk})
+
+    def test_json_containment(self):
+        self.assertEqual(self.ids({'fabric': '{"weight": {"gsm": 180}}'}), {self.cotton_ykk.pk})
+        self.assertEqual(self.ids({'fabric': '{"stretch": true}'}), {self.linen.pk})
+
+    def test_has_key(self):
+        self.assertEqual(self.ids({'fabric_has_key': 'stretch'}), {self.linen.pk})
+        self.assertEqual(self.ids({'material_has_key': 'zipper'}), {self.cotton_ykk.pk})
+
+    def test_invalid_values_are_rejected(self):
+        for params in ({'fabric': '[1, 2]'}, {'fabric': '{broken'}, {'fabric_attr': 'cotton'}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
@@ -0,0 +1,39 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from apps.manufacturing.models import Order
+from .factories import create_order, create_product
+
+User = get_user_model()
+
+
+class OrderDesignerSyncTest(TestCase):
+    """주문의 비정규화된 designer_id 동기화 테스트"""
+
+    def setUp(self):
+        self.designer = User.objects.create_user(user_id='designer1', name='디자이너', user_type='designer')
+        self.other = User.objects.create_user(user_id='designer2', name='다른 디자이너', user_type='designer')
+        self.product = create_product(self.designer)
+
+    def test_order_save_copies_product_designer(self):
+        order = create_order(self.product)
+        self.assertEqual(order.designer_id, self.designer.id)
+
+    def test_product_reassignment_updates_orders(self):
+        order = create_order(self.product)
+        product = type(self.product).objects.get(pk=self.product.pk)
+        product.designer = self.other
+        product.save()
+        order.refresh_from_db()
+        self.assertEqual(order.designer_id, self.other.id)
+
+    def test_backfill_command(self):
+        orders = [create_order(self.product) for _ in range(3)]
+        Order.objects.update(designer=None)
+        call_command('backfill_order_designer', batch_size=2, stdout=StringIO())
+        self.assertEqual(
+            Order.objects.filter(designer=self.designer).count(), len(orders)
+        )
@@ -0,0 +1,155 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.manufacturing import progress
+from apps.manufacturing.models import Order, OrderProgressSnapshot, ProductionStage
+from .factories import create_order, create_product
+
+User = get_user_model()
+
+
+class OrderProgressSnapshotTest(TestCase):
+    """주문 진행 현황 스냅샷 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.designer = User.objects.create_user(user_id='designer1', name='디자이너', user_type='designer')
+        self.factory = User.objects.create_user(
+            user_id='factory1', name='공장주', user_type='factory', contact='02-123-4567'
+        )
+        self.product = create_product(self.designer)
+        self.order = create_order(self.product)
+
+    def progress_url(self, order):
+        return reverse('order-progress', args=[order.pk])
+
+    def stage_url(self, order, phase, index):
+        return f"{reverse('order-detail', args=[order.pk])}stages/{phase}/{index}/"
+
+    def get_document(self, order):
+        return OrderProgressSnapshot.objects.get(pk=order.pk).document
+
+    def assertMatchesRebuild(self, order):
+        """부분 갱신된 문서가 전체 재생성한 문서와 같은지 확인"""
+        document = dict(self.get_document(order), last_updated=None)
+        rebuilt = dict(progress.rebuild_snapshot(order.pk).document, last_updated=None)
+        self.assertEqual(document, rebuilt)
+
+    def test_get_is_single_primary_key_read(self):
+        self.client.force_authenticate(self.designer)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.progress_url(self.order))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['order_id'], self.order.order_id)
+        self.assertEqual(response.data['designer_id'], 'designer1')
+        self.assertEqual([step['index'] for step in response.data['steps']], [1, 2, 3, 4, 5, 6, 7])
+        self.assertEqual(response.data['current_step_index'], 1)
+
+    def test_other_designer_cannot_read(self):
+        other = User.objects.create_user(user_id='designer2', name='다른 디자이너', user_type='designer')
+        self.client.force_authenticate(other)
+        response = self.client.get(self.progress_url(self.order))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_non_numeric_pk_returns_404(self):
+        self.client.force_authenticate(self.designer)
+        response = self.client.get(f"{reverse('order-list')}abc/progress/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_stage_update_non_numeric_pk_returns_404(self):
+        self.client.force_authenticate(self.factory)
+        response = self.client.patch(
+            f"{reverse('order-list')}abc/stages/sample/1/", {'status': 'done'}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_incremental_updates_match_rebuild(self):
+        self.order.factory = self.factory
+        self.order.save()
+        self.assertMatchesRebuild(self.order)
+
+        self.client.force_authenticate(self.factory)
+        for index in range(1, 7):
+            self.client.patch(self.stage_url(self.order, 'sample', index), {'status': 'done'}, format='json')
+        self.client.patch(
+            self.stage_url(self.order, 'sample', 6), {'delivery_code': 'CJ123'}, format='json'
+        )
+        document = self.get_document(self.order)
+        self.assertEqual(document['steps'][2]['delivery_code'], 'CJ123')
+        self.assertEqual(document['steps'][1]['status'], 'done')
+        self.assertEqual(document['current_step_index'], 4)
+        self.assertMatchesRebuild(self.order)
+
+        ProductionStage.objects.create(order=self.order, phase='main', stage_index=1, status='in_progress')
+        self.assertEqual(self.get_document(self.order)['current_step_index'], 6)
+        self.assertMatchesRebuild(self.order)
+
+        self.product.name = '새 제품명'
+        self.product.save()
+        self.factory.name = '새 공장명'
+        self.factory.save()
+        document = self.get_document(self.order)
+        self.assertEqual(document['steps'][2]['product_name'], '새 제품명')
+        self.assertEqual(document['steps'][1]['factory_name'], '새 공장명')
+        self.assertMatchesRebuild(self.order)
+
+    def test_stage_update_writes_single_row(self):
+        self.order.factory = self.factory
+        self.order.save()
+        self.client.force_authenticate(self.factory)
+        url = self.stage_url(self.order, 'sample', 6)
+
+        # 주문 확인, 단계 UPDATE(0행), INSERT, 스냅샷 잠금 조회/갱신 (+ 세이브포인트)
+        with self.assertNumQueries(9):
+            response = self.client.patch(url, {'status': 'in_progress'}, format='json')
+        self.assertEqual(response.data['status'], 'in_progress')
+
+        # 주문 확인, 단계 UPDATE, 스냅샷 잠금 조회/갱신 (+ 세이브포인트), 단계 다시 읽지 않음
+        with self.assertNumQueries(6):
+            response = self.client.patch(url, {'delivery_code': 'CJ123'}, format='json')
+        self.assertEqual(response.data, {
+            'index': 6, 'name': '배송', 'status': 'in_progress', 'end_date': None, 'delivery_code': 'CJ123',
+        })
+        self.assertMatchesRebuild(self.order)
+
+    def test_product_reassignment_updates_document(self):
+        other = User.objects.create_user(user_id='designer2', name='다른 디자이너', user_type='designer')
+        other_product = create_product(other, name='다른 제품')
+
+        self.order.product = other_product
+        self.order.save()
+
+        document = self.get_document(self.order)
+        self.assertEqual(document['designer_id'], 'designer2')
+        self.assertEqual(document['steps'][2]['product_name'], '다른 제품')
+        self.assertEqual(OrderProgressSnapshot.objects.get(pk=self.order.pk).designer_id, other.pk)
+        self.assertMatchesRebuild(self.order)
+
+    def test_bulk_paths_keep_snapshots(self):
+        self.client.force_authenticate(self.factory)
+        response = self.client.post(
+            reverse('order-bulk-create'),
+            [{'product': self.product.pk, 'quantity': 2, 'factory': self.factory.pk}],
+            format='json',
+        )
+        order = Order.objects.get(pk=response.data['created'][0]['id'])
+        self.assertEqual(self.get_document(order)['steps'][0]['factory_list'][0]['factory_id'], 'factory1')
+
+        self.client.post(
+            reverse('order-bulk-status'), {'ids': [self.order.pk], 'status': 'cancelled'}, format='json'
+        )
+        self.assertEqual(self.get_document(self.order)['overall_status'], 'cancelled')
+        self.assertMatchesRebuild(self.order)
+
+    def test_missing_snapshot_is_built_on_read(self):
+        OrderProgressSnapshot.objects.all().delete()
+        self.client.force_authenticate(self.designer)
+        response = self.client.get(self.progress_url(self.order))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(OrderProgressSnapshot.objects.filter(pk=self.order.pk).exists())
@@ -0,0 +1,104 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.manufacturing.models import OrderRollup
+from .factories import create_order, create_product
+
+User = get_user_model()
+
+
+class OrderRollupTest(TestCase):
+    """주문 집계 증분 갱신 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.designer = User.objects.create_user(user_id='designer1', name='디자이너', user_type='designer')
+        self.factory = User.objects.create_user(user_id='factory1', name='공장주', user_type='factory')
+        self.product = create_product(self.designer, season='summer', target='twenties')
+
+    def verify(self):
+        call_command('rebuild_order_rollups', '--verify', stdout=open('/dev/null', 'w'))
+
+    def rollup(self, **filters):
+        return OrderRollup.objects.get(owner_type='designer', owner=self.designer, **filters)
+
+    def test_incremental_changes_match_rebuild(self):
+        order = create_order(self.product, quantity=2, unit_price=Decimal('1000.00'))
+        create_order(self.product, quantity=1, unit_price=Decimal('500.00'))
+        self.assertEqual(self.rollup(status='pending').order_count, 2)
+        self.assertEqual(self.rollup(status='pending').revenue, Decimal('2500.00'))
+        self.verify()
+
+        order.status = 'confirmed'
+        order.factory = self.factory
+        order.save()
+        self.assertEqual(self.rollup(status='pending').order_count, 1)
+        self.assertEqual(self.rollup(status='confirmed').revenue, Decimal('2000.00'))
+        self.assertEqual(OrderRollup.objects.get(owner_type='factory', owner=self.factory).order_count, 1)
+        self.verify()
+
+        self.product.season = 'winter'
+        self.product.save()
+        self.assertFalse(OrderRollup.objects.filter(season='summer').exists())
+        self.verify()
+
+        order.delete()
+        self.assertFalse(OrderRollup.objects.filter(owner_type='factory').exists())
+        self.verify()
+
+    def test_bulk_paths_update_rollups(self):
+        self.client.force_authenticate(self.factory)
+        response = self.client.post(reverse('order-bulk-create'), [
+            {'product': self.product.pk, 'quantity': 3, 'unit_price': '100.00', 'factory': self.factory.pk},
+            {'product': self.product.pk, 'quantity': 1, 'unit_price': '100.00'},
+        ], format='json')
+        ids = [order['id'] for order in response.data['created']]
+        self.assertEqual(self.rollup(status='pending').order_count, 2)
+        self.verify()
+
+        self.client.post(reverse('order-bulk-status'), {'ids': ids, 'status': 'confirmed'}, format='json')
+        self.assertEqual(self.rollup(status='confirmed').revenue, Decimal('400.00'))
+        self.assertFalse(OrderRollup.objects.filter(status='pending').exists())
+        self.verify()
+
+    def test_verify_detects_drift_and_rebuild_fixes_it(self):
+        create_order(self.product)
+        OrderRollup.objects.update(order_count=5)
+        with self.assertRaises(CommandError):
+            self.verify()
+        call_command('rebuild_order_rollups', stdout=open('/dev/null', 'w'))
+        self.verify()
+
+    def test_analytics_endpoint(self):
+        create_order(self.product, quantity=2, unit_price=Decimal('1000.00'))
+        create_order(self.product, quantity=1, unit_price=Decimal('1000.00'), status='completed')
+        other = User.objects.create_user(user_id='designer2', name='다른 디자이너', user_type='designer')
+        create_order(create_product(other))
+
+        self.client.force_authenticate(self.designer)
+        url = reverse('order-analytics-list')
+        with self.assertNumQueries(1):
+            response = self.client.get(url, {'group_by': 'status,season'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total'], {'order_count': 2, 'revenue': Decimal('3000.00')})
+        self.assertEqual(
+            [(row['status'], row['season'], row['order_count']) for row in response.data['results']],
+            [('completed', 'summer', 1), ('pending', 'summer', 1)],
+        )
+
+        response = self.client.get(url, {'group_by': 'month'})
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertRegex(response.data['results'][0]['month'], r'^\d{4}-\d{2}$')
+
+        response = self.client.get(url, {'group_by': 'factory'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,95 @@
+from unittest import mock, skipUnless
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.accounts.cache import get_users
+from apps.manufacturing.models import Product
+from apps.manufacturing.search import tokenize
+from .factories import create_product
+
+User = get_user_model()
+
+
+class TokenizeTest(SimpleTestCase):
+    """검색어 토큰화 테스트"""
+
+    def test_bigram_splits_hangul_words(self):
+        self.assertEqual(tokenize('린넨셔츠 SHIRT'), ['린넨', '넨셔', '셔츠', 'shirt'])
+        self.assertEqual(tokenize('셔츠'), ['셔츠'])
+
+    @override_settings(PRODUCT_SEARCH_STRATEGY='dictionary')
+    def test_dictionary_keeps_original_text(self):
+        self.assertEqual(tokenize('린넨셔츠'), ['린넨셔츠'])
+
+
+class ProductSearchTest(TestCase):
+    """제품 검색 API 테스트 (SQLite에서는 대체 검색, PostgreSQL에서는 전문 검색)"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.designer = User.objects.create_user(user_id='designer1', name='디자이너', user_type='designer')
+        self.factory = User.objects.create_user(user_id='factory1', name='공장주', user_type='factory')
+        self.url = reverse('product-search')
+
+    def search(self, q, user=None):
+        self.client.force_authenticate(user or self.factory)
+        return self.client.get(self.url, {'q': q})
+
+    def test_ranks_name_matches_first(self):
+        in_detail = create_product(self.designer, name='재킷', concept='가을 아우터', detail='린넨 안감')
+        in_name = create_product(self.designer, name='린넨 셔츠', concept='여름 셔츠')
+        create_product(self.designer, name='데님 팬츠', concept='와이드 핏')
+
+        response = self.search('린넨')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['id'] for item in response.data['results']], [in_name.pk, in_detail.pk])
+
+    def test_all_terms_must_match(self):
+        product = create_product(self.designer, name='린넨 셔츠', concept='오버핏')
+        create_product(self.designer, name='린넨 팬츠', concept='와이드')
+
+        response = self.search('린넨 오버핏')
+        self.assertEqual([item['id'] for item in response.data['results']], [product.pk])
+
+    def test_designer_sees_only_own_products(self):
+        other = User.objects.create_user(user_id='designer2', name='다른 디자이너', user_type='designer')
+        create_product(other, name='린넨 셔츠')
+        own = create_product(self.designer, name='린넨 원피스')
+
+        response = self.search('린넨', user=self.designer)
+        self.assertEqual([item['id'] for item in response.data['results']], [own.pk])
+
+    def test_prefetches_page_designers(self):
+        other = User.objects.create_user(user_id='designer2', name='다른 디자이너', user_type='designer')
+        create_product(self.designer, name='린넨 셔츠')
+        create_product(other, name='린넨 팬츠')
+        cache.clear()
+
+        with mock.patch('apps.manufacturing.views.get_users', wraps=get_users) as prime:
+            response = self.search('린넨')
+
+        prime.assert_called_once_with({self.designer.pk, other.pk})
+        self.assertEqual(
+            {item['designer_info']['name'] for item in response.data['results']}, {'디자이너', '다른 디자이너'}
+        )
+
+    def test_requires_query(self):
+        self.assertEqual(self.search('  ').status_code, status.HTTP_400_BAD_REQUEST)
+
+    @skipUnless(connection.vendor == 'postgresql', 'PostgreSQL 전문 검색 전용')
+    def test_search_vector_is_maintained(self):
+        product = create_product(self.designer, name='린넨셔츠')
+        self.assertEqual([item['id'] for item in self.search('셔츠').data['results']], [product.pk])
+
+        product.name = '데님 팬츠'
+        product.save()
+        self.assertEqual(self.search('셔츠').data['results'], [])
+        self.assertTrue(Product._base_manager.filter(pk=product.pk, search_vector__isnull=False).exists())
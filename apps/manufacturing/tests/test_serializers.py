@@ -0,0 +1,117 @@
+import datetime
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from apps.core.serializers import ValuesPlan
+from apps.manufacturing.serializers import ProductSerializer
+
+from apps.manufacturing.views import ProductViewSet, OrderViewSet
+from .factories import create_order, create_product
+
+User = get_user_model()
+
+
+class CompiledListParityTest(TestCase):
+    """컴파일된 목록 직렬화가 기존 시리얼라이저와 같은 응답을 내는지 확인"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.designer = User.objects.create_user(
+            user_id='designer1', name='디자이너', user_type='designer', contact='010-0000-0000'
+        )
+        self.factory = User.objects.create_user(user_id='factory1', name='공장주', user_type='factory')
+
+        full = create_product(
+            self.designer,
+            detail='소매 포인트',
+            image_path='design_image/shirt.png',
+            work_sheet_path='worksheets/shirt.pdf',
+            size='M',
+            quantity=100,
+            fabric={'type': 'cotton', 'count': '30수', 'weight': 120.5},
+            material={'zipper': 'YKK', 'buttons': [1, 2]},
+            due_date=datetime.date(2026, 12, 1),
+            memo='메모',
+        )
+        empty = create_product(self.designer, image_path='')
+        create_order(full, receipt_path='orders/receipts/r.pdf', shipping_cost=Decimal('3000.50'),
+                     customer_email='a@example.com', notes='급함')
+        create_order(empty, unit_price=None, status='confirmed')
+
+    def assertSameResponse(self, viewset, url, user):
+        self.client.force_authenticate(user)
+        # 목록 응답 캐시를 거치지 않도록 요청마다 캐시 비움
+        cache.clear()
+        compiled = self.client.get(url)
+        cache.clear()
+        with mock.patch.object(viewset, 'compiled_list', False):
+            regular = self.client.get(url)
+        self.assertEqual(compiled.status_code, 200)
+        self.assertEqual(compiled.content, regular.content)
+
+    def test_product_list(self):
+        for user in (self.designer, self.factory):
+            self.assertSameResponse(ProductViewSet, reverse('product-list'), user)
+
+    def test_order_list(self):
+        for user in (self.designer, self.factory):
+            self.assertSameResponse(OrderViewSet, reverse('order-list'), user)
+
+    def test_sparse_fields(self):
+        self.assertSameResponse(
+            ProductViewSet, reverse('product-list') + '?fields=id,imageUrl,designerInfo,dueDate', self.factory
+        )
+        self.assertSameResponse(
+            OrderViewSet, reverse('order-list') + '?omit=productInfo,notes', self.factory
+        )
+
+    def test_cursor_pagination(self):
+        url = reverse('order-list') + '?pagination=cursor&page_size=1'
+        self.assertSameResponse(OrderViewSet, url, self.factory)
+        self.client.force_authenticate(self.factory)
+        next_url = self.client.get(url).data['next']
+        self.assertSameResponse(OrderViewSet, next_url, self.factory)
+
+
+class ValuesPlanCacheTest(TestCase):
+    """컴파일 결과 캐시 키/크기 테스트"""
+
+    def setUp(self):
+        ValuesPlan._cache.clear()
+        self.addCleanup(ValuesPlan._cache.clear)
+
+    def plan(self, query=''):
+        request = Request(APIRequestFactory().get('/products/' + query))
+        return ValuesPlan.for_serializer(ProductSerializer(context={'request': request}))
+
+    def test_field_order_shares_plan(self):
+        plan = self.plan('?fields=id,name,createdAt')
+
+        self.assertIs(self.plan('?fields=createdAt,name,id'), plan)
+        self.assertEqual([step[0] for step in plan.steps], ['id', 'name', 'created_at'])
+
+    @override_settings(VALUES_PLAN_CACHE_SIZE=2)
+    def test_cache_is_bounded(self):
+        first = self.plan('?fields=id')
+        self.plan('?fields=name')
+        self.plan('?fields=id')
+        self.plan('?fields=season')
+
+        self.assertEqual(len(ValuesPlan._cache), 2)
+        self.assertIs(self.plan('?fields=id'), first)
+
+    def test_converters_do_not_keep_request(self):
+        plan = self.plan()
+
+        converters = [step[3] for step in plan.steps if step[1] == ValuesPlan.FIELD and step[3] is not None]
+        self.assertTrue(converters)
+        for converter in converters:
+            self.assertIsNone(converter.__self__.parent)
@@ -1,10 +1,11 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import ProductViewSet, OrderViewSet
+from .views import ProductViewSet, OrderViewSet, OrderAnalyticsViewSet
 
 router = DefaultRouter()
 router.register(r'products', ProductViewSet)
 router.register(r'orders', OrderViewSet)
+router.register(r'analytics/orders', OrderAnalyticsViewSet, basename='order-analytics')
 
 urlpatterns = [
     path('', include(router.urls)),
@@ -1,15 +1,44 @@
 import logging
-from rest_framework import viewsets, status
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Prefetch, Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+from rest_framework import viewsets, status, serializers
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from .models import Product, Order
-from .serializers import ProductSerializer, ProductCreateSerializer, OrderSerializer, OrderCreateSerializer
+from apps.accounts.cache import get_users
+from apps.accounts.permissions import IsFactoryUser
+from apps.core.logging import LazyPayload
+from apps.core.mixins import CachedListMixin, CompiledListMixin, ConditionalGetMixin, QueryPlanMixin
+from apps.core.pagination import KeysetPagination, RankedPagination
+from . import progress
+from .cache import ORDER_NAMESPACE, PRODUCT_NAMESPACE, get_list_generations
+from .filters import ProductFilter
+from .models import Product, Order, OrderProgressSnapshot, OrderRollup, ProductionStage
+from .search import search_products
+from .serializers import (
+    ProductSerializer, ProductCreateSerializer, OrderSerializer, OrderCreateSerializer,
+    FactoryOrderSerializer, ProductionStageUpdateSerializer,
+)
+from .services import OrderService
 
 logger = logging.getLogger(__name__)
 
-class ProductViewSet(viewsets.ModelViewSet):
+class ProductViewSet(ConditionalGetMixin, CachedListMixin, CompiledListMixin, QueryPlanMixin,
+                     viewsets.ModelViewSet):
     queryset = Product.objects.all()
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
+    # 원단/부자재 JSON 속성 필터 (?fabric_attr=type:cotton 등, filters.py 참고)
+    filterset_class = ProductFilter
+    # designer_info가 디자이너 정보를 포함하므로 디자이너 변경도 상세 검증자에 반영
+    # (목록 검증자는 목록 캐시 세대 번호 사용)
+    conditional_fields = ('updated_at', 'designer__updated_at')
+    # designer_info는 사용자 캐시에서 읽으므로 designer JOIN 없음 (paginate_queryset에서 한 번에 준비)
+    query_plans = {}
     
     def get_serializer_class(self):
         if self.action == 'create':
@@ -19,8 +48,49 @@ class ProductViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         # 디자이너는 자신의 제품만, 공장주는 모든 제품 조회 가능
         if self.request.user.user_type == 'designer':
-            return Product.objects.filter(designer=self.request.user)
-        return Product.objects.all()
+            queryset = Product.objects.filter(designer_id=self.request.user.pk)
+        else:
+            queryset = Product.objects.all()
+        return self.apply_query_plan(queryset)
+
+    def get_list_cache_generations(self):
+        return get_list_generations(PRODUCT_NAMESPACE, self.request.user)
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        self.prime_designers(page)
+        return page
+
+    def prime_designers(self, page):
+        """페이지의 디자이너를 사용자 캐시에 한 번에 준비 (캐시에 없는 디자이너만 IN 쿼리 한 번)"""
+        if page:
+            # ?fields=로 designer_info를 제외하면 designer_id를 읽지 않으므로 건너뜀
+            designer_ids = {
+                row.get('designer_id') if isinstance(row, dict) else row.__dict__.get('designer_id') for row in page
+            }
+            designer_ids.discard(None)
+            if designer_ids:
+                get_users(designer_ids)
+
+    @action(detail=False, methods=['get'], url_path='search')
+    def search(self, request):
+        """
+        제품 검색 (제품명 > 컨셉 > 포인트 설명 가중치의 관련도 순)
+
+        `?q=검색어` 필수. 결과는 페이지 번호 방식(`?page=`, `?page_size=`)으로 나뉘며
+        `?fields=`/`?omit=`도 목록과 동일하게 지원합니다.
+        """
+        text = request.query_params.get('q', '')
+        if not text.strip():
+            return Response({'error': '검색어(q)가 필요합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        queryset = search_products(self.get_queryset(), text)
+        paginator = RankedPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        if page is not None:
+            self.prime_designers(page)
+            return paginator.get_paginated_response(self.get_serializer(page, many=True).data)
+        return Response(self.get_serializer(queryset, many=True).data)
 
     def perform_create(self, serializer):
         # 디자이너만 제품 생성 가능
@@ -29,15 +99,15 @@ class ProductViewSet(viewsets.ModelViewSet):
                 {'error': '디자이너만 제품을 생성할 수 있습니다.'}, 
                 status=status.HTTP_403_FORBIDDEN
             )
-        serializer.save(designer=self.request.user)
+        serializer.save(designer_id=self.request.user.pk)
     
     def create(self, request, *args, **kwargs):
-        logger.info(f"Product create request from user: {request.user}")
-        logger.info(f"Request data: {request.data}")
+        logger.info('Product create request from user: %s', request.user.pk)
+        logger.debug('Request data: %s', LazyPayload(request.data))
         
         # 디자이너 권한 확인
         if not hasattr(request.user, 'user_type') or request.user.user_type != 'designer':
-            logger.warning(f"Non-designer user attempted to create product: {request.user}")
+            logger.warning('Non-designer user attempted to create product: %s', request.user.pk)
             return Response(
                 {'error': '디자이너만 제품을 생성할 수 있습니다.'}, 
                 status=status.HTTP_403_FORBIDDEN
@@ -45,7 +115,7 @@ class ProductViewSet(viewsets.ModelViewSet):
         
         serializer = self.get_serializer(data=request.data)
         if not serializer.is_valid():
-            logger.error(f"Serializer validation errors: {serializer.errors}")
+            logger.warning('Serializer validation errors: %s', LazyPayload(serializer.errors))
             return Response(
                 {'error': 'Validation failed', 'details': serializer.errors},
                 status=status.HTTP_400_BAD_REQUEST
@@ -53,19 +123,29 @@ class ProductViewSet(viewsets.ModelViewSet):
         
         try:
             self.perform_create(serializer)
-            logger.info(f"Product created successfully: {serializer.data}")
+            logger.info('Product created successfully: %s', serializer.instance.pk)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         except Exception as e:
-            logger.error(f"Error creating product: {str(e)}")
+            logger.exception('Error creating product')
             return Response(
                 {'error': 'Failed to create product', 'details': str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
 
-class OrderViewSet(viewsets.ModelViewSet):
+class OrderViewSet(ConditionalGetMixin, CachedListMixin, CompiledListMixin, QueryPlanMixin,
+                   viewsets.ModelViewSet):
     queryset = Order.objects.all()
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
+    # product_info가 제품명/디자이너명을 포함하므로 함께 상세 검증자에 반영
+    conditional_fields = ('updated_at', 'product__updated_at', 'product__designer__updated_at')
+    query_plans = {
+        # product_info(ProductListSerializer)가 product.designer.name까지 읽음
+        OrderSerializer: {
+            'select_related': ('product__designer',),
+        },
+    }
     
     def get_serializer_class(self):
         if self.action == 'create':
@@ -75,6 +155,229 @@ class OrderViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         # 디자이너는 자신의 제품에 대한 주문만 조회 가능
         if self.request.user.user_type == 'designer':
-            return Order.objects.filter(product__designer=self.request.user)
-        # 공장주는 모든 주문 조회 가능
-        return Order.objects.all()
\ No newline at end of file
+            # 비정규화된 designer 컬럼으로 products 조인 없이 조회
+            queryset = Order.objects.filter(designer_id=self.request.user.pk)
+        else:
+            # 공장주는 모든 주문 조회 가능
+            queryset = Order.objects.all()
+        return self.apply_query_plan(queryset)
+
+    def get_list_cache_generations(self):
+        return get_list_generations(ORDER_NAMESPACE, self.request.user)
+
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk_create(self, request):
+        """
+        주문 대량 생성
+
+        요청: [{...}, ...] 또는 {"orders": [{...}, ...], "atomic": true}
+        (`?atomic=true` 쿼리 파라미터도 지원)
+
+        - 모두 성공: 201
+        - 일부 실패: 207 (유효한 항목만 생성, 실패 항목은 errors에 index와 함께 반환)
+        - 모두 실패 또는 atomic 모드에서 실패: 400 (아무것도 생성하지 않음)
+        """
+        data = request.data
+        atomic = request.query_params.get('atomic', '').lower() in ('1', 'true')
+        if isinstance(data, dict):
+            atomic = atomic or bool(data.get('atomic', False))
+            data = data.get('orders')
+
+        try:
+            result = OrderService.bulk_create_orders(data, atomic=atomic, context=self.get_serializer_context())
+        except serializers.ValidationError as e:
+            return Response({'error': e.detail}, status=status.HTTP_400_BAD_REQUEST)
+
+        created, errors = result['created'], result['errors']
+        if not created:
+            response_status = status.HTTP_400_BAD_REQUEST
+        elif errors:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_201_CREATED
+
+        return Response({
+            'created': OrderSerializer(created, many=True, context=self.get_serializer_context()).data,
+            'errors': errors,
+        }, status=response_status)
+
+    @action(detail=False, methods=['post'], url_path='bulk-status', permission_classes=[IsFactoryUser])
+    def bulk_status(self, request):
+        """
+        주문 상태 일괄 변경 (공장주 전용)
+
+        요청: {"ids": [1, 2, ...], "status": "in_production"}
+        응답: 주문별 결과(updated / not_found / invalid_transition / conflict)
+        """
+        data = request.data if isinstance(request.data, dict) else {}
+        try:
+            result = OrderService.bulk_transition_status(data.get('ids'), data.get('status'))
+        except serializers.ValidationError as e:
+            return Response({'error': e.detail}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(result, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=['get'], url_path='progress', url_name='progress')
+    def order_progress(self, request, pk=None):
+        """
+        디자이너 주문 진행 현황 (designer_order_schema.json 형식)
+
+        미리 만들어 둔 스냅샷 문서를 PK로 한 번 읽어 그대로 반환합니다.
+        디자이너는 자신의 주문만, 공장주는 모든 주문을 조회할 수 있습니다.
+        """
+        try:
+            pk = int(pk)
+        except (TypeError, ValueError):
+            raise NotFound('주문을 찾을 수 없습니다.')
+
+        row = OrderProgressSnapshot.objects.filter(pk=pk).values_list('designer_id', 'document').first()
+        if row is None:
+            # 스냅샷 도입 이전 주문은 처음 조회할 때 생성
+            snapshot = progress.rebuild_snapshot(pk)
+            row = (snapshot.designer_id, snapshot.document) if snapshot else None
+
+        if row is None or (request.user.user_type == 'designer' and row[0] != request.user.pk):
+            return Response({'error': '주문을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(row[1])
+
+    @action(detail=False, methods=['get'], url_path='factory', permission_classes=[IsFactoryUser])
+    def factory(self, request):
+        """
+        공장 주문 관리 목록 (factory_order_managing_schema.json 형식)
+
+        `?phase=sample|main` (기본 sample). 주문/제품/디자이너는 select_related,
+        단계는 해당 phase만 prefetch 하므로 페이지 크기와 관계없이 쿼리 수가 일정합니다.
+        """
+        phase = request.query_params.get('phase', 'sample')
+        if phase not in dict(ProductionStage.PHASE_CHOICES):
+            return Response({'error': f'알 수 없는 생산 구분입니다: {phase}'}, status=status.HTTP_400_BAD_REQUEST)
+
+        queryset = Order.objects.filter(factory_id=request.user.pk).select_related(
+            'factory', 'product__designer'
+        ).prefetch_related(
+            Prefetch('stages', queryset=ProductionStage.objects.filter(phase=phase))
+        )
+        context = dict(self.get_serializer_context(), phase=phase)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(FactoryOrderSerializer(page, many=True, context=context).data)
+        return Response(FactoryOrderSerializer(queryset, many=True, context=context).data)
+
+    @action(
+        detail=True,
+        methods=['patch'],
+        url_path=r'stages/(?P<phase>sample|main)/(?P<stage_index>[1-6])',
+        permission_classes=[IsFactoryUser],
+    )
+    def update_stage(self, request, pk=None, phase=None, stage_index=None):
+        """
+        생산 단계 수정 (주문을 맡은 공장만 가능)
+
+        단계 한 행만 UPDATE 하고, 아직 행이 없으면 새로 만듭니다.
+        요청: {"status": "done", "end_date": "2024-01-19", "delivery_code": "..."} (일부만 가능)
+        """
+        stage_index = int(stage_index)
+        try:
+            pk = int(pk)
+        except (TypeError, ValueError):
+            raise NotFound('주문을 찾을 수 없습니다.')
+        if not Order.objects.filter(pk=pk, factory_id=request.user.pk).exists():
+            return Response({'error': '주문을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
+
+        serializer = ProductionStageUpdateSerializer(
+            data=request.data, partial=True, context={'stage_index': stage_index}
+        )
+        serializer.is_valid(raise_exception=True)
+
+        lookup = {'order_id': pk, 'phase': phase, 'stage_index': stage_index}
+        data = serializer.validated_data
+        updated = ProductionStage.objects.filter(**lookup).update(**data, updated_at=timezone.now())
+        if not updated:
+            try:
+                with transaction.atomic():
+                    # 스냅샷은 post_save 시그널(update_stage_progress)에서 갱신
+                    stage = ProductionStage.objects.create(**lookup, **data)
+                return Response(self.stage_response(stage))
+            except IntegrityError:
+                # 동시에 같은 단계가 생성된 경우
+                ProductionStage.objects.filter(**lookup).update(**data, updated_at=timezone.now())
+
+        # QuerySet.update()는 시그널을 거치지 않으므로 방금 기록한 값으로 스냅샷 직접 갱신
+        written = {}
+
+        def patch(document):
+            written['stage'] = progress.stage_from_document(document, phase, stage_index, **data)
+            progress.patch_stage(document, written['stage'])
+
+        snapshot = progress.update_snapshot(pk, patch)
+        stage = written.get('stage')
+        if stage is None:
+            # 스냅샷이 없어 DB에서 새로 만든 경우 (이미 기록한 값이 반영됨)
+            stage = progress.stage_from_document(snapshot.document, phase, stage_index)
+        return Response(self.stage_response(stage))
+
+    @staticmethod
+    def stage_response(stage):
+        return {
+            'index': stage.stage_index,
+            'name': stage.name,
+            'status': stage.status,
+            'end_date': stage.end_date,
+            'delivery_code': stage.delivery_code,
+        }
+
+
+class OrderAnalyticsViewSet(viewsets.ViewSet):
+    """
+    주문 집계 조회 (읽기 전용)
+
+    주문 테이블을 GROUP BY 하지 않고 증분 갱신되는 OrderRollup에서 조회합니다.
+    디자이너는 자신의 제품 주문, 공장주는 자신에게 배정된 주문의 집계를 봅니다.
+
+    쿼리 파라미터:
+        group_by: day, month, status, season, target 중 쉼표로 구분 (기본: status)
+        date_from, date_to: 주문 일자 범위 (YYYY-MM-DD, 포함)
+    """
+    permission_classes = [IsAuthenticated]
+    dimensions = ('day', 'month', 'status', 'season', 'target')
+
+    def list(self, request):
+        group_by = [dim for dim in request.query_params.get('group_by', '').split(',') if dim] or ['status']
+        invalid = [dim for dim in group_by if dim not in self.dimensions]
+        if invalid:
+            return Response(
+                {'error': f"지원하지 않는 group_by 값입니다: {', '.join(invalid)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        queryset = OrderRollup.objects.filter(owner_type=request.user.user_type, owner_id=request.user.pk)
+        try:
+            if request.query_params.get('date_from'):
+                queryset = queryset.filter(day__gte=request.query_params['date_from'])
+            if request.query_params.get('date_to'):
+                queryset = queryset.filter(day__lte=request.query_params['date_to'])
+        except ValidationError:
+            return Response({'error': '날짜는 YYYY-MM-DD 형식이어야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        if 'month' in group_by:
+            queryset = queryset.annotate(month=TruncMonth('day'))
+
+        rows = queryset.values(*group_by).annotate(
+            order_count=Sum('order_count'), revenue=Sum('revenue')
+        ).order_by(*group_by)
+
+        results = []
+        total_count, total_revenue = 0, 0
+        for row in rows:
+            if 'month' in row:
+                row['month'] = row['month'].strftime('%Y-%m')
+            total_count += row['order_count']
+            total_revenue += row['revenue']
+            results.append(row)
+
+        return Response({
+            'group_by': group_by,
+            'results': results,
+            'total': {'order_count': total_count, 'revenue': total_revenue},
+        })
+
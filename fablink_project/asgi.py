@@ -3,6 +3,11 @@ ASGI config for fablink_project project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+비동기 로그인(/api/accounts/login/async/)은 ASGI 서버에서 실행해야 이벤트 루프가
+비밀번호 확인(프로세스 풀)을 기다리는 동안 다른 요청을 처리할 수 있습니다.
+
+    gunicorn fablink_project.asgi:application -k uvicorn.workers.UvicornWorker --workers 4
+
 For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
 """
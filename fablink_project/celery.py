@@ -0,0 +1,15 @@
+"""
+Celery 앱 (CELERY_* 설정 사용)
+
+실행:
+    celery -A fablink_project worker -B -l info
+"""
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'fablink_project.settings')
+
+app = Celery('fablink_project')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
@@ -14,14 +14,6 @@ SECRET_KEY = os.getenv('SECRET_KEY', 'your-default-secret-key-here')
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = True
 
-# 디버그 모드에서 자세한 오류 정보 표시
-if DEBUG:
-    import logging
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s %(levelname)s %(name)s %(message)s'
-    )
-
 ALLOWED_HOSTS = ['localhost', '127.0.0.1']
 
 # Application definition
@@ -115,23 +107,59 @@ MEDIA_ROOT = BASE_DIR / 'media'
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# 캐시 설정 (운영환경은 prod.py에서 Redis로 재정의)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'fablink-default',
+    }
+}
+
+# 제품/주문 목록 응답 캐시 유지 시간(초) - 변경 시 시그널로 즉시 무효화됨
+LIST_CACHE_TIMEOUT = int(os.getenv('LIST_CACHE_TIMEOUT', '300'))
+# 컴파일된 목록 직렬화 플랜(apps.core.serializers.ValuesPlan) 캐시 크기 (?fields= 조합별)
+VALUES_PLAN_CACHE_SIZE = 256
+
+# 사용자 토큰 버전(토큰 폐기 확인용) 캐시 유지 시간(초) - 변경 시 즉시 삭제됨
+TOKEN_VERSION_CACHE_TIMEOUT = int(os.getenv('TOKEN_VERSION_CACHE_TIMEOUT', '300'))
+
+# 사용자/권한 2단계 캐시 (apps.accounts.cache)
+USER_CACHE_LOCAL_SIZE = 1000  # 워커별 프로세스 내 캐시 최대 항목 수
+USER_CACHE_LOCAL_TIMEOUT = 60  # 프로세스 내 캐시 유지 시간(초)
+USER_CACHE_TIMEOUT = 600  # 공유 캐시 유지 시간(초)
+USER_CACHE_EPOCH_INTERVAL = 1  # 다른 워커의 무효화를 확인하는 간격(초)
+
+# 제품 전문 검색 (PostgreSQL)
+# - STRATEGY 'bigram': 한글 단어를 두 글자 단위로 나눠 CONFIG('simple')로 색인
+# - STRATEGY 'dictionary': 한국어 형태소 분석 설정(예: mecab 기반)을 CONFIG로 지정해 원문 그대로 색인
+# 변경 후에는 기존 제품의 검색 벡터를 다시 저장해야 함
+PRODUCT_SEARCH_CONFIG = os.getenv('PRODUCT_SEARCH_CONFIG', 'simple')
+PRODUCT_SEARCH_STRATEGY = os.getenv('PRODUCT_SEARCH_STRATEGY', 'bigram')
+
+# 주문 대량 생성 API 한 번의 요청당 최대 건수
+ORDER_BULK_CREATE_MAX_SIZE = int(os.getenv('ORDER_BULK_CREATE_MAX_SIZE', '500'))
+
+# 주문 상태 일괄 변경 API 한 번의 요청당 최대 건수
+ORDER_BULK_TRANSITION_MAX_SIZE = int(os.getenv('ORDER_BULK_TRANSITION_MAX_SIZE', '10000'))
+
 # Django REST Framework 설정
 REST_FRAMEWORK = {
-    # 카멜케이스 컨버터
+    # 카멜케이스 컨버터 (키 변환 결과를 캐시하는 프로젝트 렌더러/파서)
+    # orjson이 설치되어 있으면 orjson으로 인코딩/디코딩, 없으면 표준 json 사용
     'DEFAULT_RENDERER_CLASSES': [
-        'djangorestframework_camel_case.render.CamelCaseJSONRenderer',
-        'djangorestframework_camel_case.render.CamelCaseBrowsableAPIRenderer',
+        'apps.core.renderers.ORJSONCamelCaseRenderer',
+        'apps.core.renderers.CamelCaseBrowsableAPIRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
-        'djangorestframework_camel_case.parser.CamelCaseFormParser',
-        'djangorestframework_camel_case.parser.CamelCaseMultiPartParser',
-        'djangorestframework_camel_case.parser.CamelCaseJSONParser',
+        'apps.core.parsers.CamelCaseFormParser',
+        'apps.core.parsers.CamelCaseMultiPartParser',
+        'apps.core.parsers.ORJSONCamelCaseParser',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'apps.accounts.authentication.CustomJWTAuthentication',
+        'apps.accounts.authentication.StatelessJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
@@ -174,6 +202,17 @@ CSRF_COOKIE_HTTPONLY = False
 CSRF_USE_SESSIONS = False
 
 # Logging
+# 파일/콘솔 쓰기는 큐 핸들러 뒤의 백그라운드 스레드가 처리 (apps.core.logging 참고)
+# logger 이름(접두어)별 INFO 이하 기록 샘플링 비율 (0~1)
+LOG_SAMPLING_RATES = {
+    'apps.accounts.authentication': 0.01,
+}
+# logger 이름(접두어)별 초당 기록 수 제한 (WARNING 이하)
+LOG_RATE_LIMITS = {
+    'apps': 200,
+    'django.request': 50,
+}
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -183,6 +222,16 @@ LOGGING = {
             'style': '{',
         },
     },
+    'filters': {
+        'sampling': {
+            '()': 'apps.core.logging.SamplingFilter',
+            'rates': LOG_SAMPLING_RATES,
+        },
+        'rate_limit': {
+            '()': 'apps.core.logging.RateLimitFilter',
+            'limits': LOG_RATE_LIMITS,
+        },
+    },
     'handlers': {
         'console': {
             'level': 'DEBUG',
@@ -191,25 +240,34 @@ LOGGING = {
         },
         'file': {
             'level': 'INFO',
-            'class': 'logging.FileHandler',
+            'class': 'logging.handlers.RotatingFileHandler',
             'filename': BASE_DIR / 'logs' / 'django.log',
+            'maxBytes': 1024*1024*15,  # 15MB
+            'backupCount': 5,
+            'delay': True,
             'formatter': 'verbose',
         },
+        # 핸들러는 이름 순으로 생성되므로 대상(console, file)보다 뒤에 오는 이름 사용
+        'queue': {
+            'class': 'apps.core.logging.QueueLogHandler',
+            'handlers': ['console', 'file'],
+            'filters': ['sampling', 'rate_limit'],
+        },
     },
     'loggers': {
         'django': {
-            'handlers': ['console', 'file'],
+            'handlers': ['queue'],
             'level': 'INFO',
-            'propagate': True,
+            'propagate': False,
         },
         'apps': {
-            'handlers': ['console', 'file'],
-            'level': 'DEBUG',
-            'propagate': True,
+            'handlers': ['queue'],
+            'level': 'DEBUG' if DEBUG else 'INFO',
+            'propagate': False,
         },
     },
     'root': {
-        'handlers': ['console', 'file'],
+        'handlers': ['queue'],
         'level': 'INFO',
     },
 }
@@ -235,9 +293,32 @@ SIMPLE_JWT = {
     
     'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',),
     'TOKEN_TYPE_CLAIM': 'token_type',
-    'TOKEN_USER_CLASS': 'rest_framework_simplejwt.models.TokenUser',
+    'TOKEN_USER_CLASS': 'apps.accounts.authentication.StatelessUser',
     
     'JTI_CLAIM': 'jti',
 }
 
 AUTH_USER_MODEL = 'accounts.User'
+
+# 권한 조회는 사용자 권한 캐시 사용
+AUTHENTICATION_BACKENDS = ['apps.accounts.backends.CachedModelBackend']
+
+# 비동기 로그인(async_login_view)의 비밀번호 확인 프로세스 풀 (apps.accounts.passwords)
+LOGIN_PASSWORD_WORKERS = None  # 풀 프로세스 수 (None이면 CPU 수)
+LOGIN_PASSWORD_QUEUE_SIZE = 32  # 실행 중인 요청 외 대기할 수 있는 요청 수 (넘으면 503)
+LOGIN_RETRY_AFTER = 1  # 503 응답의 Retry-After(초)
+
+# 리프레시 토큰 블랙리스트 저장소 (apps.accounts.blacklist)
+# DatabaseBlacklistStore로 바꾸면 simplejwt 기본 동작(매번 DB 조회/기록)과 같음
+TOKEN_BLACKLIST_STORE = 'apps.accounts.blacklist.CacheBlacklistStore'
+TOKEN_BLACKLIST_ASYNC_WRITES = True  # DB 기록을 백그라운드 스레드에서 처리
+TOKEN_BLACKLIST_BLOOM_CAPACITY = 100000
+TOKEN_BLACKLIST_BLOOM_ERROR_RATE = 0.001
+TOKEN_BLACKLIST_REBUILD_INTERVAL = 3600  # 블룸 필터를 DB로 다시 만드는 간격(초)
+TOKEN_BLACKLIST_LOG_TIMEOUT = 3600  # 워커 간 동기화 로그 유지 시간(초)
+
+# 만료 토큰 정리 (compact_tokens 명령 / accounts.tasks.compact_expired_tokens_task)
+TOKEN_COMPACTION_BATCH_SIZE = 1000
+TOKEN_COMPACTION_SLEEP = 0.1  # 배치 사이 대기 시간(초)
+TOKEN_COMPACTION_GRACE = 3600  # 만료 후 삭제까지 유예 시간(초)
+TOKEN_COMPACTION_LOCK_TIMEOUT = 2000  # 배치별 잠금 대기 한도(ms, PostgreSQL)
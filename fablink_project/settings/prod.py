@@ -98,6 +98,12 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+CELERY_BEAT_SCHEDULE = {
+    'compact-expired-tokens': {
+        'task': 'apps.accounts.tasks.compact_expired_tokens_task',
+        'schedule': 60 * 60,  # 매시간
+    },
+}
 
 # 로깅 설정 (운영환경용)
 LOGGING = {
@@ -113,6 +119,16 @@ LOGGING = {
             'style': '{',
         },
     },
+    'filters': {
+        'sampling': {
+            '()': 'apps.core.logging.SamplingFilter',
+            'rates': LOG_SAMPLING_RATES,
+        },
+        'rate_limit': {
+            '()': 'apps.core.logging.RateLimitFilter',
+            'limits': LOG_RATE_LIMITS,
+        },
+    },
     'handlers': {
         'file': {
             'level': 'INFO',
@@ -127,15 +143,21 @@ LOGGING = {
             'class': 'logging.StreamHandler',
             'formatter': 'simple',
         },
+        # 파일/콘솔 쓰기는 백그라운드 스레드에서 처리
+        'queue': {
+            'class': 'apps.core.logging.QueueLogHandler',
+            'handlers': ['console', 'file'],
+            'filters': ['sampling', 'rate_limit'],
+        },
     },
     'root': {
-        'handlers': ['file', 'console'],
+        'handlers': ['queue'],
         'level': 'INFO',
     },
     'loggers': {
         'django.db.backends': {
             'level': 'ERROR',
-            'handlers': ['file'],
+            'handlers': ['queue'],
             'propagate': False,
         },
     },
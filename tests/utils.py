@@ -0,0 +1,32 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryCountGuardMixin:
+    """
+    엔드포인트의 쿼리 수가 응답 행 수에 비례해 늘어나지 않는지 검사하는 테스트 믹스인
+
+    N+1 쿼리가 다시 생기면 행 수를 늘렸을 때 쿼리 수가 함께 늘어나므로,
+    서로 다른 행 수로 같은 요청을 보내고 쿼리 수가 동일한지 비교합니다.
+    """
+
+    def count_queries(self, url, **extra):
+        """요청 한 번에 실행된 쿼리 수 반환"""
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, **extra)
+        self.assertEqual(response.status_code, 200, getattr(response, 'data', None))
+        return len(ctx.captured_queries)
+
+    def assertConstantQueries(self, url, add_rows, small=2, large=10, **extra):
+        """
+        add_rows(n)으로 행을 n개 만든 뒤 small개일 때와 large개일 때의
+        쿼리 수가 같은지 확인
+        """
+        add_rows(small)
+        baseline = self.count_queries(url, **extra)
+        add_rows(large - small)
+        grown = self.count_queries(url, **extra)
+        self.assertEqual(
+            baseline, grown,
+            f"{url} 쿼리 수가 행 수에 따라 증가했습니다: {small}행={baseline}, {large}행={grown}"
+        )